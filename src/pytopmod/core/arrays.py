@@ -0,0 +1,64 @@
+"""Index-based array representations of mesh connectivity.
+
+The 'dlfl.arrays' and 'dcel.arrays' modules export each mesh's vertices, faces
+and edges as lists of indices, cached on the mesh until its connectivity
+changes. This module builds the compressed sparse row (CSR) structures derived
+from them: the entries of row i are entries[offsets[i]:offsets[i + 1]].
+"""
+from typing import Iterable, Sequence, Tuple
+
+
+def csr_adjacency(
+    vertex_count: int, edges: Iterable[Tuple[int, int]]
+) -> Tuple[list[int], list[int]]:
+  """Returns the CSR vertex adjacency (offsets, neighbours) of undirected edges.
+
+  Edges are pairs of vertex indices. Loops and repeated edges are ignored.
+  """
+  adjacent: list[set[int]] = [set() for _ in range(vertex_count)]
+  for index_1, index_2 in edges:
+    if index_1 != index_2:
+      adjacent[index_1].add(index_2)
+      adjacent[index_2].add(index_1)
+
+  offsets = [0]
+  neighbours: list[int] = []
+  for vertex_neighbours in adjacent:
+    neighbours.extend(sorted(vertex_neighbours))
+    offsets.append(len(neighbours))
+  return (offsets, neighbours)
+
+
+def csr_incidence(
+    vertex_count: int, polygons: Sequence[Sequence[int]]
+) -> Tuple[list[int], list[int]]:
+  """Returns the CSR vertex-face incidence (offsets, faces) of polygons.
+
+  Polygons are lists of vertex indices, and faces are indices into the
+  polygons. A face is listed once per vertex even if the vertex appears several
+  times in its boundary.
+  """
+  incident: list[list[int]] = [[] for _ in range(vertex_count)]
+  for face, polygon in enumerate(polygons):
+    for vertex in dict.fromkeys(polygon):
+      incident[vertex].append(face)
+
+  offsets = [0]
+  faces: list[int] = []
+  for vertex_faces in incident:
+    faces.extend(vertex_faces)
+    offsets.append(len(faces))
+  return (offsets, faces)
+
+
+def csr_polygons(
+    polygons: Sequence[Sequence[int]]
+) -> Tuple[list[int], list[int]]:
+  """Returns the CSR form (offsets, corners) of polygons, the corners being
+  the vertex indices of all polygons, concatenated."""
+  offsets = [0]
+  corners: list[int] = []
+  for polygon in polygons:
+    corners.extend(polygon)
+    offsets.append(len(corners))
+  return (offsets, corners)
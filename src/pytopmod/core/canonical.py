@@ -0,0 +1,266 @@
+"""Canonical forms of meshes, to compare meshes regardless of their keys.
+
+A mesh is seen as a set of darts (directed edges of face boundaries): the dart
+i of a face goes from its vertex i to its vertex i + 1. Each dart has a next
+dart in its face and an opposite dart (the same edge traversed by the other
+face), which together describe the mesh's rotation system.
+
+Starting from a dart, a breadth-first traversal following next and opposite
+darts labels every dart of its component in an order that only depends on the
+connectivity, and encodes each dart as the labels of its next and opposite
+darts and of its origin vertex. The canonical code of a component is the
+smallest code over all starting darts: traversals only start from the darts
+with the smallest invariants (face size and vertex valences), and are
+abandoned as soon as their code exceeds the best one.
+
+A traversal whose code ties with the best one gives an automorphism of the
+component, mapping each dart of the best traversal to the dart with the same
+label. The darts are partitioned in the orbits of the automorphisms found so
+far, and starting darts in the orbit of a dart already tried are skipped, as
+they give the same code. Symmetric meshes (e.g tori, where every dart is
+equivalent) then need O(log(automorphisms)) full traversals rather than one
+per dart. If positions are included, they break ties between the starts giving
+the smallest code in a second search of the same kind. The worst case is still
+O(darts x starting darts tried), for meshes with many starting darts that are
+not equivalent but whose codes only differ late in the traversal.
+
+Two meshes with the same canonical form have an orientation-preserving
+mapping between their vertices and faces (and the same positions, if
+included). The converse holds for meshes without parallel edges: opposite
+darts are paired by their vertices, and when several edges join the same two
+vertices they are paired in face order, so some isomorphic meshes might get
+different forms.
+"""
+import array
+import sys
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+
+from pytopmod.core.geometry import Point3D
+
+MAGIC = b'PTMC\x01'
+
+
+def canonical_form(
+    vertex_count: int,
+    polygons: Sequence[Sequence[int]],
+    positions: Optional[Sequence[Point3D]] = None
+) -> bytes:
+  """Returns the canonical form of a mesh given as polygons of vertex indices.
+
+  If positions are passed, they are included in canonical vertex order, and
+  break ties between symmetric starting darts. Otherwise only the
+  connectivity is compared.
+  """
+  origins: list[int] = []
+  next_darts: list[int] = []
+  face_sizes: list[int] = []
+  for polygon in polygons:
+    offset = len(origins)
+    origins.extend(polygon)
+    next_darts.extend(offset + (index + 1) % len(polygon)
+                      for index in range(len(polygon)))
+    face_sizes.extend([len(polygon)] * len(polygon))
+
+  opposite_candidates: dict[Tuple[int, int], list[int]] = {}
+  for dart, origin in enumerate(origins):
+    opposite_candidates.setdefault(
+        (origin, origins[next_darts[dart]]), []).append(dart)
+  # Boundary darts are their own opposite.
+  opposites = list(range(len(origins)))
+  for (origin, target), darts in opposite_candidates.items():
+    for dart, opposite in zip(darts, opposite_candidates.get((target, origin),
+                                                            ())):
+      opposites[dart] = opposite
+
+  valences = [0] * vertex_count
+  for origin in origins:
+    valences[origin] += 1
+
+  def invariant(dart: int) -> Tuple[int, int, int]:
+    return (face_sizes[dart], valences[origins[dart]],
+            valences[origins[next_darts[dart]]])
+
+  components = []
+  for darts in _components(next_darts, opposites):
+    smallest = min(invariant(dart) for dart in darts)
+    starts = [dart for dart in darts if invariant(dart) == smallest]
+    components.append(_canonical_component(
+        starts, origins, next_darts, opposites, positions))
+
+  # Vertices without faces.
+  used = set(origins)
+  isolated = sorted(positions[vertex] for vertex in range(vertex_count)
+                    if vertex not in used) if positions is not None else []
+
+  data = bytearray(MAGIC)
+  data.extend(_int64_bytes((len(components), vertex_count - len(used))))
+  for code, component_positions in sorted(components):
+    data.extend(_int64_bytes((len(code),)))
+    data.extend(code)
+    data.extend(component_positions)
+  data.extend(_float64_bytes(coord for position in isolated
+                             for coord in position))
+  return bytes(data)
+
+
+def _components(
+        next_darts: Sequence[int], opposites: Sequence[int]
+) -> Iterable[list[int]]:
+  """Returns the darts of each connected component."""
+  visited = [False] * len(next_darts)
+  for start in range(len(next_darts)):
+    if visited[start]:
+      continue
+    visited[start] = True
+    darts = [start]
+    for dart in darts:
+      for neighbour in (next_darts[dart], opposites[dart]):
+        if not visited[neighbour]:
+          visited[neighbour] = True
+          darts.append(neighbour)
+    yield darts
+
+
+def _canonical_component(
+    starts: Sequence[int],
+    origins: Sequence[int], next_darts: Sequence[int],
+    opposites: Sequence[int],
+    positions: Optional[Sequence[Point3D]]
+) -> Tuple[bytes, bytes]:
+  """Returns the smallest code of a component over the passed starting darts,
+  and the positions of its vertices in the order of that code."""
+  code, starts = _smallest_code(
+      starts, lambda start, best: _traverse(
+          start, origins, next_darts, opposites, best))
+  if positions is None:
+    return (_int64_bytes(code), b'')
+  # The starts giving the smallest code are tied by their vertex positions.
+  vertex_positions, _ = _smallest_code(
+      starts, lambda start, best: _traverse_positions(
+          start, origins, next_darts, opposites, positions, best))
+  return (_int64_bytes(code), b''.join(vertex_positions))
+
+
+def _smallest_code(
+    starts: Sequence[int],
+    traverse: Callable[[int, list], Tuple[Optional[list], list[int]]]
+) -> Tuple[list, list[int]]:
+  """Returns the smallest code over the passed starting darts, and the starts
+  giving it.
+
+  'traverse' returns the code from a start and the darts in labelling order,
+  or None if the code gets larger than the passed best one.
+  """
+  best: list = []
+  best_order: list[int] = []
+  # Union-find of the darts in the orbits of the automorphisms found, with the
+  # roots of the orbits of which a start was traversed.
+  parents = {dart: dart for dart in starts}
+  tried = set()
+
+  def find(dart: int) -> int:
+    root = parents.setdefault(dart, dart)
+    while parents[root] != root:
+      root = parents[root]
+    while parents[dart] != root:
+      parents[dart], dart = root, parents[dart]
+    return root
+
+  for start in starts:
+    if find(start) in tried:
+      continue
+    tried.add(find(start))
+    code, order = traverse(start, best)
+    if code is None:
+      continue
+    if code == best:
+      # The dart labelled i from the best start maps to the dart labelled i
+      # from this one.
+      for dart_1, dart_2 in zip(best_order, order):
+        root_1, root_2 = find(dart_1), find(dart_2)
+        if root_1 != root_2:
+          parents[root_2] = root_1
+          if root_2 in tried:
+            tried.add(root_1)
+    elif not best or code < best:
+      best, best_order = code, order
+  best_root = find(best_order[0])
+  return (best, [start for start in starts if find(start) == best_root])
+
+
+def _traverse(
+    start: int,
+    origins: Sequence[int], next_darts: Sequence[int],
+    opposites: Sequence[int],
+    best: Sequence[int]
+) -> Tuple[Optional[list[int]], list[int]]:
+  """Returns the code of a component from a starting dart and its darts in
+  labelling order, or None if the code gets larger than 'best'."""
+  dart_labels = {start: 0}
+  vertex_labels: dict[int, int] = {}
+  order = [start]
+  code: list[int] = []
+  # Whether the code is equal to the best one so far (if any).
+  tied = bool(best)
+  for dart in order:
+    for neighbour in (next_darts[dart], opposites[dart]):
+      if neighbour not in dart_labels:
+        dart_labels[neighbour] = len(order)
+        order.append(neighbour)
+    vertex_labels.setdefault(origins[dart], len(vertex_labels))
+    for entry in (dart_labels[next_darts[dart]], dart_labels[opposites[dart]],
+                  vertex_labels[origins[dart]]):
+      if tied:
+        expected = best[len(code)]
+        if entry > expected:
+          return (None, order)
+        tied = entry == expected
+      code.append(entry)
+  return (code, order)
+
+
+def _traverse_positions(
+    start: int,
+    origins: Sequence[int], next_darts: Sequence[int],
+    opposites: Sequence[int],
+    positions: Sequence[Point3D],
+    best: Sequence[bytes]
+) -> Tuple[Optional[list[bytes]], list[int]]:
+  """Returns the positions of the vertices of a component in labelling order
+  from a starting dart (see '_traverse') and its darts in labelling order, or
+  None if the positions get larger than 'best'."""
+  visited = {start}
+  seen_vertices = set()
+  order = [start]
+  vertex_positions: list[bytes] = []
+  tied = bool(best)
+  for dart in order:
+    for neighbour in (next_darts[dart], opposites[dart]):
+      if neighbour not in visited:
+        visited.add(neighbour)
+        order.append(neighbour)
+    if origins[dart] in seen_vertices:
+      continue
+    seen_vertices.add(origins[dart])
+    entry = _float64_bytes(positions[origins[dart]])
+    if tied:
+      expected = best[len(vertex_positions)]
+      if entry > expected:
+        return (None, order)
+      tied = entry == expected
+    vertex_positions.append(entry)
+  return (vertex_positions, order)
+
+
+def _int64_bytes(values: Iterable[int]) -> bytes:
+  packed = array.array('q', values)
+  if sys.byteorder == 'big':
+    packed.byteswap()
+  return packed.tobytes()
+
+
+def _float64_bytes(values: Iterable[float]) -> bytes:
+  packed = array.array('d', values)
+  if sys.byteorder == 'big':
+    packed.byteswap()
+  return packed.tobytes()
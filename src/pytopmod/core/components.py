@@ -0,0 +1,139 @@
+"""Incremental tracking of the connected components of a mesh."""
+from typing import Callable, Generic, Iterable, Iterator, Tuple, TypeVar
+
+from pytopmod.core import traversal
+
+K = TypeVar('K', bound=str)
+
+
+class ComponentTracker(Generic[K]):
+  """Keeps track of the connected components formed by a set of vertices.
+
+  Each vertex is labelled with the index of its component, and each component
+  stores the set of its vertices, so component queries are O(1).
+
+  Merging two components relabels the vertices of the smaller one (union by
+  size), which bounds the cost of any sequence of merges to O(n log n).
+
+  Splitting is only attempted when an edge that may have been a bridge is
+  removed. Two searches are then run in lockstep from the edge's vertices: they
+  stop as soon as they meet, or when one of them exhausts its side of the split,
+  so the cost is bounded by the size of the smaller component.
+  """
+
+  def __init__(self):
+    self._labels: dict[K, int] = {}
+    self._members: dict[int, set[K]] = {}
+    self._next_label = 0
+
+  def __iter__(self) -> Iterator[int]:
+    return iter(self._members)
+
+  def __contains__(self, vertex: K) -> bool:
+    return vertex in self._labels
+
+  def __repr__(self) -> str:
+    return list(self._members.values()).__repr__()
+
+  def __len__(self) -> int:
+    return len(self._members)
+
+  def add(self, vertex: K) -> int:
+    """Adds a vertex as a new single-vertex component and returns its label."""
+    label = self._new_label()
+    self._labels[vertex] = label
+    self._members[label] = {vertex}
+    return label
+
+  def remove(self, vertex: K):
+    """Removes a vertex, deleting its component if it was the last vertex."""
+    label = self._labels.pop(vertex)
+    self._members[label].discard(vertex)
+    if not self._members[label]:
+      del self._members[label]
+
+  def merge(self, vertex_1: K, vertex_2: K) -> int:
+    """Merges the components of two vertices and returns the resulting label."""
+    label_1 = self._labels[vertex_1]
+    label_2 = self._labels[vertex_2]
+    if label_1 == label_2:
+      return label_1
+
+    # Relabel the vertices of the smaller component.
+    if len(self._members[label_1]) < len(self._members[label_2]):
+      label_1, label_2 = label_2, label_1
+    members = self._members.pop(label_2)
+    for vertex in members:
+      self._labels[vertex] = label_1
+    self._members[label_1].update(members)
+
+    return label_1
+
+  def merge_all(self, vertices: Iterable[K]) -> int:
+    """Merges the components of all passed vertices and returns the resulting
+    label."""
+    iterator = iter(vertices)
+    first_vertex = next(iterator)
+    label = self._labels[first_vertex]
+    for vertex in iterator:
+      if self._labels[vertex] != label:
+        label = self.merge(first_vertex, vertex)
+    return label
+
+  def split(
+          self,
+          vertex_1: K, vertex_2: K,
+          neighbours: Callable[[K], Iterable[K]]) -> bool:
+    """Updates the components after an edge between two vertices was removed.
+
+    The 'neighbours' callable must reflect the adjacency after the removal.
+    Returns whether the component of the two vertices was split in two.
+    """
+    if self._labels[vertex_1] != self._labels[vertex_2]:
+      return False
+
+    searches = (traversal.breadth_first(vertex_1, neighbours),
+                traversal.breadth_first(vertex_2, neighbours))
+    visited: Tuple[set[K], set[K]] = (set(), set())
+
+    while True:
+      for side in (0, 1):
+        vertex = next(searches[side], None)
+        if vertex is None:
+          # This side has been fully visited without reaching the other one:
+          # it forms a new component.
+          self._relabel(visited[side])
+          return True
+        if vertex in visited[1 - side]:
+          # Both searches met: the vertices are still connected.
+          return False
+        visited[side].add(vertex)
+
+  def component(self, vertex: K) -> int:
+    """Returns the label of the component of a vertex."""
+    return self._labels[vertex]
+
+  def vertices(self, component: int) -> Iterator[K]:
+    """Returns an iterator over the vertices of a component."""
+    return iter(self._members[component])
+
+  def connected(self, vertex_1: K, vertex_2: K) -> bool:
+    """Returns whether two vertices belong to the same component."""
+    return self._labels[vertex_1] == self._labels[vertex_2]
+
+  def count(self) -> int:
+    return self.__len__()
+
+  def _new_label(self) -> int:
+    label = self._next_label
+    self._next_label += 1
+    return label
+
+  def _relabel(self, vertices: set[K]):
+    """Moves a set of vertices from their component to a new one."""
+    old_label = self._labels[next(iter(vertices))]
+    self._members[old_label].difference_update(vertices)
+    new_label = self._new_label()
+    self._members[new_label] = vertices
+    for vertex in vertices:
+      self._labels[vertex] = new_label
@@ -0,0 +1,140 @@
+"""Conversions of DCEL Meshes to index-based arrays.
+
+Connectivity arrays are cached on the mesh and only rebuilt after its
+connectivity changed (see 'Mesh.cached'): they are shared between callers and
+must not be modified. Positions are read from the mesh on every call.
+"""
+from typing import Generator, Tuple
+
+from pytopmod.core import arrays, canonical, memo
+from pytopmod.core.dcel.mesh import DCELMesh
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
+from pytopmod.core.vertex import VertexKey
+
+
+def face_vertices(
+        mesh: DCELMesh, face: FaceKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices of a face boundary, in order.
+
+  Each edge is traversed from vertex_2 to vertex_1 by its face_1, and from
+  vertex_1 to vertex_2 by its face_2: the vertex it is traversed from is
+  yielded.
+  """
+  for edge in mesh.face_edges(face):
+    node = mesh.edge_nodes[edge]
+    yield node.vertex_2 if node.face_1 == face else node.vertex_1
+
+
+def vertices(mesh: DCELMesh) -> list[VertexKey]:
+  """Returns the mesh's vertices, in the order used by all index arrays."""
+  return mesh.cached('vertices', lambda: list(mesh.vertices))
+
+
+def positions(mesh: DCELMesh) -> list[Point3D]:
+  """Returns the positions of the mesh's vertices, in index order."""
+  return [mesh.vertex_coordinates[vertex] for vertex in vertices(mesh)]
+
+
+def faces(mesh: DCELMesh) -> Tuple[list[FaceKey], list[list[int]]]:
+  """Returns the mesh's faces and their boundaries as lists of vertex
+  indices."""
+  def build() -> Tuple[list[FaceKey], list[list[int]]]:
+    vertex_indices = _vertex_indices(mesh)
+    face_keys = list(mesh.faces)
+    return (face_keys,
+            [[vertex_indices[vertex] for vertex in face_vertices(mesh, face)]
+             for face in face_keys])
+
+  return mesh.cached('faces', build)
+
+
+def edge_indices(mesh: DCELMesh) -> list[Tuple[int, int]]:
+  """Returns the mesh's edges as pairs of vertex indices."""
+  def build() -> list[Tuple[int, int]]:
+    vertex_indices = _vertex_indices(mesh)
+    return [(vertex_indices[node.vertex_1], vertex_indices[node.vertex_2])
+            for node in mesh.edge_nodes.values()]
+
+  return mesh.cached('edge_indices', build)
+
+
+def face_corners(mesh: DCELMesh) -> Tuple[list[int], list[int]]:
+  """Returns the CSR face boundaries (offsets, vertex indices), as expected by
+  the bulk kernels in 'geometry'."""
+  return mesh.cached(
+      'face_corners', lambda: arrays.csr_polygons(faces(mesh)[1]))
+
+
+def vertex_faces(mesh: DCELMesh) -> Tuple[list[int], list[int]]:
+  """Returns the CSR vertex-face incidence (offsets, face indices)."""
+  return mesh.cached('vertex_faces', lambda: arrays.csr_incidence(
+      len(vertices(mesh)), faces(mesh)[1]))
+
+
+def vertex_adjacency(mesh: DCELMesh) -> Tuple[list[int], list[int]]:
+  """Returns the CSR vertex adjacency (offsets, neighbour indices)."""
+  return mesh.cached('vertex_adjacency', lambda: arrays.csr_adjacency(
+      len(vertices(mesh)), edge_indices(mesh)))
+
+
+def polygons(
+        mesh: DCELMesh
+) -> Tuple[list[VertexKey], list[Point3D], list[list[int]]]:
+  """Returns the mesh's vertices, their positions and its faces as polygons.
+
+  Polygons are lists of indices into the vertices, in face key order, and can
+  be passed back to 'primitives.polygon_mesh'.
+  """
+  return (vertices(mesh), positions(mesh), faces(mesh)[1])
+
+
+def edges(
+        mesh: DCELMesh
+) -> Tuple[list[VertexKey], list[Point3D], list[Tuple[int, int]]]:
+  """Returns the mesh's vertices, their positions and its edges as pairs of
+  indices into the vertices."""
+  return (vertices(mesh), positions(mesh), edge_indices(mesh))
+
+
+def fingerprint(mesh: DCELMesh) -> str:
+  """Returns a stable content hash of the mesh's vertex, face and edge keys,
+  connectivity and vertex coordinates (see 'memo.fingerprint')."""
+  def build() -> bytes:
+    vertex_indices = _vertex_indices(mesh)
+    face_keys, face_polygons = faces(mesh)
+    face_indices = {face: index for index, face in enumerate(face_keys)}
+    incidences = (
+        index for node in mesh.edge_nodes.values()
+        for index in (vertex_indices[node.vertex_1],
+                      vertex_indices[node.vertex_2],
+                      face_indices[node.face_1], face_indices[node.face_2]))
+    return memo.connectivity_digest(
+        'dcel', vertices(mesh), face_keys, face_polygons,
+        list(mesh.edge_nodes), incidences)
+
+  connectivity = mesh.cached('connectivity_digest', build)
+  return memo.fingerprint(connectivity, positions(mesh))
+
+
+def canonical_form(mesh: DCELMesh, include_positions: bool = True) -> bytes:
+  """Returns the canonical form of the mesh, which is equal for meshes that
+  only differ by their keys or representation (see 'canonical')."""
+  if not include_positions:
+    return mesh.cached('canonical_form', lambda: canonical.canonical_form(
+        len(vertices(mesh)), faces(mesh)[1]))
+  return canonical.canonical_form(
+      len(vertices(mesh)), faces(mesh)[1], positions(mesh))
+
+
+def isomorphic(
+        mesh_1: DCELMesh, mesh_2: DCELMesh,
+        include_positions: bool = True) -> bool:
+  """Returns whether two meshes have the same canonical form."""
+  return (canonical_form(mesh_1, include_positions) ==
+          canonical_form(mesh_2, include_positions))
+
+
+def _vertex_indices(mesh: DCELMesh) -> dict[VertexKey, int]:
+  return mesh.cached('vertex_indices', lambda: {
+      vertex: index for index, vertex in enumerate(vertices(mesh))})
@@ -0,0 +1,22 @@
+"""Conversion of DCEL Mesh changes to deltas (see 'core.delta_io')."""
+import functools
+
+from pytopmod.core import delta_io
+from pytopmod.core.dcel import arrays
+from pytopmod.core.dcel.mesh import DCELMesh
+
+
+def mesh_to_delta(
+        mesh: DCELMesh, full: bool = False, consumer: str = '') -> str:
+  """Returns the delta of the mesh's changes since the last call.
+
+  The mesh's dirty vertices and faces are taken (and cleared) for the passed
+  consumer (see 'Mesh.take_dirty'), so several streams can each send the
+  deltas of the same mesh under their own name. If 'full' is set, the delta
+  lists the whole mesh instead.
+  """
+  vertices, faces = mesh.take_dirty(consumer)
+  if full:
+    vertices, faces = mesh.vertices, mesh.faces
+  return delta_io.encode_delta(
+      mesh, vertices, faces, functools.partial(arrays.face_vertices, mesh))
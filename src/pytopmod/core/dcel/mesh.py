@@ -1,5 +1,5 @@
 import dataclasses
-from typing import Generator
+from typing import Generator, Iterable, Tuple
 
 from pytopmod.core.edge import EdgeKey
 from pytopmod.core.face import FaceKey
@@ -26,17 +26,35 @@ class EdgeNode:
 class DCELMesh(Mesh):
   """DCEL-backed Mesh class.
 
-  This structure uses a map of EdgeNodes.
+  This structure uses a map of EdgeNodes, along with two maps associating each
+  vertex (resp. face) with one of its incident edges:
+   - vertex_edge: Used as the starting point of a vertex rotation.
+   - face_edge: Used as the starting point of a face boundary.
 
   Manifold-preserving operators are implemented in 'operators.py'.
   """
   edges: KeyStore[EdgeKey] = dataclasses.field(init=False)
   edge_nodes: dict[EdgeKey, EdgeNode] = dataclasses.field(init=False)
+  vertex_edge: dict[VertexKey, EdgeKey] = dataclasses.field(init=False)
+  face_edge: dict[FaceKey, EdgeKey] = dataclasses.field(init=False)
 
   def __post_init__(self):
     super(DCELMesh, self).__post_init__()
     self.edges = KeyStore[EdgeKey]('e')
     self.edge_nodes = {}
+    self.vertex_edge = {}
+    self.face_edge = {}
+
+  def delete_vertex(self, vertex: VertexKey):
+    super(DCELMesh, self).delete_vertex(vertex)
+    self.vertex_edge.pop(vertex, None)
+
+  def delete_face(self, face: FaceKey):
+    super(DCELMesh, self).delete_face(face)
+    self.face_edge.pop(face, None)
+
+  def _connected_vertices(self) -> Iterable[Iterable[VertexKey]]:
+    return ((node.vertex_1, node.vertex_2) for node in self.edge_nodes.values())
 
   def create_edge(
           self,
@@ -45,22 +63,103 @@ class DCELMesh(Mesh):
           vertex_1_next: EdgeKey, vertex_2_next: EdgeKey
   ) -> EdgeKey:
     edge = self.edges.new()
+    self.version += 1
+    self.mark_dirty((vertex_1, vertex_2), (face_1, face_2))
     self.edge_nodes[edge] = EdgeNode(
         vertex_1, vertex_2, face_1, face_2, vertex_1_next, vertex_2_next)
+    self.vertex_edge.setdefault(vertex_1, edge)
+    self.vertex_edge.setdefault(vertex_2, edge)
+    self.face_edge.setdefault(face_1, edge)
+    self.face_edge.setdefault(face_2, edge)
+    if self.component_tracker is not None:
+      self.component_tracker.merge(vertex_1, vertex_2)
     return edge
 
   def delete_edge(self, edge: EdgeKey):
-    del self.edge_nodes[edge]
+    node = self.edge_nodes.pop(edge)
+    self.version += 1
+    self.mark_dirty((node.vertex_1, node.vertex_2), (node.face_1, node.face_2))
+    # Replace the deleted edge by its successor where it was used as a starting
+    # point, unless it was its own successor.
+    for vertex, face, next_edge in (
+            (node.vertex_1, node.face_1, node.vertex_1_next),
+            (node.vertex_2, node.face_2, node.vertex_2_next)):
+      if self.vertex_edge.get(vertex) == edge:
+        if next_edge in self.edge_nodes:
+          self.vertex_edge[vertex] = next_edge
+        else:
+          del self.vertex_edge[vertex]
+      if self.face_edge.get(face) == edge:
+        if next_edge in self.edge_nodes:
+          self.face_edge[face] = next_edge
+        else:
+          del self.face_edge[face]
     return self.edges.delete(edge)
 
   def vertex_edges(self, vertex: VertexKey) -> Generator[EdgeKey, None, None]:
-    """Returns a generator over the edges incident to a vertex."""
-    for edge, node in self.edge_nodes.items():
-      if vertex in (node.vertex_1, node.vertex_2):
-        yield edge
+    """Returns a generator over the edges incident to a vertex.
+
+    The edges are yielded in rotation order.
+    """
+    first_edge = self.vertex_edge.get(vertex)
+    if first_edge is None:
+      return
+    edge = first_edge
+    while True:
+      yield edge
+      node = self.edge_nodes[edge]
+      edge = (node.vertex_1_next if node.vertex_1 == vertex
+              else node.vertex_2_next)
+      if edge == first_edge:
+        return
 
   def face_edges(self, face: FaceKey) -> Generator[EdgeKey, None, None]:
-    """Returns a generator over the edges on the boundary of a face."""
-    for edge, node in self.edge_nodes.items():
-      if face in (node.face_1, node.face_2):
-        yield edge
+    """Returns a generator over the edges on the boundary of a face.
+
+    The edges are yielded in boundary order.
+    """
+    first_edge = self.face_edge.get(face)
+    if first_edge is None:
+      return
+    edge = first_edge
+    while True:
+      yield edge
+      node = self.edge_nodes[edge]
+      edge = node.vertex_1_next if node.face_1 == face else node.vertex_2_next
+      if edge == first_edge:
+        return
+
+  def vertex_corners(
+          self, vertex: VertexKey
+  ) -> Generator[Tuple[EdgeKey, FaceKey], None, None]:
+    """Returns a generator over the corners of a vertex, in rotation order.
+
+    Each corner is given as the edge that starts it (as expected by the
+    'insert_edge' operator) and the face it lies in.
+    """
+    for edge in self.vertex_edges(vertex):
+      node = self.edge_nodes[edge]
+      yield (edge, node.face_1 if node.vertex_1 == vertex else node.face_2)
+
+  def corner_of(self, vertex: VertexKey, face: FaceKey) -> EdgeKey:
+    """Returns the edge starting the corner of a vertex in a face.
+
+    Raises a KeyError if the vertex is not in the face boundary.
+    """
+    for edge, corner_face in self.vertex_corners(vertex):
+      if corner_face == face:
+        return edge
+    raise KeyError((vertex, face))
+
+  def shared_faces(
+          self, vertex_1: VertexKey, vertex_2: VertexKey) -> list[FaceKey]:
+    """Returns the faces whose boundary contains both vertices.
+
+    This costs O(valence_1 + valence_2).
+    """
+    faces_2 = {face for _, face in self.vertex_corners(vertex_2)}
+    faces = []
+    for _, face in self.vertex_corners(vertex_1):
+      if face in faces_2 and face not in faces:
+        faces.append(face)
+    return faces
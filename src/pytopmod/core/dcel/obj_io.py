@@ -1,10 +1,21 @@
 """Conversion functions between OBJ format and DCEL representation."""
-from pytopmod.core.dcel import operators
+from typing import BinaryIO, Optional
+
+from pytopmod.core import memo, obj_io
+from pytopmod.core.dcel import arrays, operators
 from pytopmod.core.dcel.mesh import DCELMesh
 
 
-def mesh_to_obj(mesh: DCELMesh) -> str:
-  """Converts a DCELMesh to OBJ format."""
+def mesh_to_obj(mesh: DCELMesh, cache: Optional[memo.MemoCache] = None) -> str:
+  """Converts a DCELMesh to OBJ format.
+
+  If a cache is passed, the result is memoized under the mesh's fingerprint.
+  """
+  if cache is not None:
+    return cache.memoize(
+        'dcel.mesh_to_obj', arrays.fingerprint(mesh),
+        lambda: mesh_to_obj(mesh))
+
   vertex_map = {}
 
   obj_vertices = []
@@ -33,3 +44,16 @@ def mesh_to_obj(mesh: DCELMesh) -> str:
     obj_faces.append(f'f {" ".join(indices)}')
 
   return '\n'.join(obj_vertices) + '\n' + '\n'.join(obj_faces)
+
+
+def write_obj(
+        mesh: DCELMesh, file: BinaryIO,
+        workers: Optional[int] = None, chunk_size: int = 65536):
+  """Writes a DCELMesh to a binary file in OBJ format, formatting it in
+  parallel (see 'core.obj_io.write_obj').
+
+  The output is identical to mesh_to_obj's.
+  """
+  offsets, corners = arrays.face_corners(mesh)
+  obj_io.write_obj(
+      file, arrays.positions(mesh), offsets, corners, workers, chunk_size)
@@ -0,0 +1,17 @@
+"""Decimation operations for DCEL Meshes."""
+from pytopmod.core import decimation
+from pytopmod.core.dcel import arrays, primitives
+from pytopmod.core.dcel.mesh import DCELMesh
+
+
+def decimate(mesh: DCELMesh, target_faces: int) -> DCELMesh:
+  """Returns a simplified copy of a mesh with (at most) 'target_faces' faces.
+
+  Faces are split in triangles, which are then reduced by quadric error edge
+  collapses (see 'pytopmod.core.decimation'). The returned mesh is built
+  directly from the remaining triangles, so its keys are unrelated to the
+  original mesh's.
+  """
+  _, positions, polygons = arrays.polygons(mesh)
+  return primitives.polygon_mesh(
+      *decimation.decimate(positions, polygons, target_faces))
@@ -0,0 +1,57 @@
+"""Dual operations for DCEL Meshes."""
+from pytopmod.core.dcel import arrays, primitives
+from pytopmod.core.dcel.mesh import DCELMesh
+from pytopmod.core.edge import EdgeKey
+from pytopmod.core.geometry import Point3D
+
+
+def dual(mesh: DCELMesh) -> DCELMesh:
+  """Returns the dual of a mesh.
+
+  Each face becomes a vertex at its centroid, and each vertex becomes a face
+  whose boundary goes through the duals of the faces around it. The dual faces
+  are read from the vertex rotations (following the vertex_next pointers of
+  the edge nodes) in a single pass, and the new mesh is built directly from
+  them.
+
+  The dual half-edges are paired by the edge they cross, so faces sharing
+  several edges give parallel edges, and edges with the same face on both
+  sides give loops.
+  """
+  face_keys, polygons = arrays.faces(mesh)
+  positions = arrays.positions(mesh)
+  face_indices = {face: index for index, face in enumerate(face_keys)}
+
+  centroids: list[Point3D] = []
+  for polygon in polygons:
+    count = len(polygon)
+    centroids.append((sum(positions[index][0] for index in polygon) / count,
+                      sum(positions[index][1] for index in polygon) / count,
+                      sum(positions[index][2] for index in polygon) / count))
+
+  # Rotations turn clockwise around their vertex: reverse them so the dual
+  # faces keep the orientation of the mesh. The face of each corner shares the
+  # edge of the corner with the previous face, so the dual half-edge j of a
+  # reversed rotation of k corners crosses the edge of corner k - 1 - j.
+  dual_polygons: list[list[int]] = []
+  crossings: dict[EdgeKey, list[int]] = {}
+  half_edge_count = 0
+  for vertex in arrays.vertices(mesh):
+    if vertex not in mesh.vertex_edge:
+      continue
+    corners = list(mesh.vertex_corners(vertex))
+    dual_polygons.append([face_indices[face] for _, face in reversed(corners)])
+    # Polygons of less than 2 vertices have no half-edges.
+    if len(corners) < 2:
+      continue
+    for index, (edge, _) in enumerate(reversed(corners)):
+      crossings.setdefault(edge, []).append(half_edge_count + index)
+    half_edge_count += len(corners)
+
+  opposites = list(range(half_edge_count))
+  for half_edges in crossings.values():
+    if len(half_edges) == 2:
+      opposites[half_edges[0]] = half_edges[1]
+      opposites[half_edges[1]] = half_edges[0]
+
+  return primitives.polygon_mesh(centroids, dual_polygons, opposites)
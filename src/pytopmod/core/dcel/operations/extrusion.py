@@ -0,0 +1,117 @@
+"""Extrusion operations for DCEL Meshes."""
+from typing import Iterable, Optional, Tuple
+
+from pytopmod.core import extrusion, trace
+from pytopmod.core.dcel.mesh import DCELMesh, EdgeNode
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
+from pytopmod.core.vertex import VertexKey
+
+
+@trace.traced
+def extrude_face(
+    mesh: DCELMesh,
+    face: FaceKey,
+    distance: float = 1.0,
+    direction: Optional[Point3D] = None,
+    scale: float = 1.0,
+    twist: float = 0.0
+) -> Tuple[list[VertexKey], list[FaceKey]]:
+  """Extrudes a face (see 'extrude_faces').
+
+  Returns the vertices of the extruded face and the new side faces.
+  """
+  return extrude_faces(mesh, [face], distance, direction, scale, twist)[0]
+
+
+def extrude_faces(
+    mesh: DCELMesh,
+    faces: Iterable[FaceKey],
+    distance: float = 1.0,
+    direction: Optional[Point3D] = None,
+    scale: float = 1.0,
+    twist: float = 0.0
+) -> list[Tuple[list[VertexKey], list[FaceKey]]]:
+  """Extrudes each of the passed faces independently.
+
+  The boundary [v_0, ..., v_n] of each face is replaced by new vertices
+  [w_0, ..., w_n], placed as described in 'extrusion.extruded_positions', and
+  the quads [v_i, v_i+1, w_i+1, w_i] are inserted as side faces. The extruded
+  face keeps its key.
+
+  The new vertices, faces and edges are all created at once and the edge nodes
+  are linked directly, rather than through the operators.
+
+  Returns the vertices of each extruded face and its new side faces, in the
+  order of the passed faces. Raises a ValueError, leaving the mesh unchanged,
+  if a face is passed twice or is a point-sphere.
+  """
+  faces = list(faces)
+  if len(set(faces)) != len(faces):
+    raise ValueError('Cannot extrude a face twice.')
+  # The boundary edges of each face, along with the vertex each of them is
+  # traversed from.
+  boundaries = []
+  for face in faces:
+    boundary = []
+    for edge in mesh.face_edges(face):
+      node = mesh.edge_nodes[edge]
+      boundary.append(
+          (edge, node.vertex_2 if node.face_1 == face else node.vertex_1))
+    if len(boundary) < 2:
+      raise ValueError('Cannot extrude a point-sphere.')
+    boundaries.append(boundary)
+
+  # Compute every new position before changing the mesh.
+  positions = [
+      position
+      for boundary in boundaries
+      for position in extrusion.extruded_positions(
+          [mesh.vertex_coordinates[vertex] for _, vertex in boundary],
+          distance, direction, scale, twist)]
+  new_vertices = mesh.create_vertices(positions)
+  new_faces = mesh.create_faces(len(positions))
+  # Each boundary edge gets a rung edge (v_i, w_i) and a cap edge (w_i, w_i+1).
+  new_edges = mesh.edges.new_keys(2 * len(positions))
+
+  results = []
+  offset = 0
+  for face, boundary in zip(faces, boundaries):
+    count = len(boundary)
+    vertices = new_vertices[offset:offset + count]
+    side_faces = new_faces[offset:offset + count]
+    rungs = new_edges[2 * offset:2 * offset + count]
+    caps = new_edges[2 * offset + count:2 * (offset + count)]
+    offset += count
+
+    for index, (edge, vertex) in enumerate(boundary):
+      next_index = (index + 1) % count
+      # The side face traverses the boundary edge, then the next rung upwards,
+      # the cap edge backwards and the rung downwards.
+      mesh.edge_nodes[rungs[index]] = EdgeNode(
+          vertex, vertices[index], side_faces[index], side_faces[index - 1],
+          edge, caps[index - 1])
+      mesh.edge_nodes[caps[index]] = EdgeNode(
+          vertices[index], vertices[next_index], side_faces[index], face,
+          rungs[index], caps[next_index])
+
+      node = mesh.edge_nodes[edge]
+      if node.face_2 == face and node.vertex_1 == vertex:
+        node.face_2 = side_faces[index]
+        node.vertex_2_next = rungs[next_index]
+      else:
+        node.face_1 = side_faces[index]
+        node.vertex_1_next = rungs[next_index]
+
+      mesh.vertex_edge[vertices[index]] = rungs[index]
+      mesh.face_edge[side_faces[index]] = edge
+
+    mesh.face_edge[face] = caps[0]
+    # The edge nodes were linked directly: mark the modified regions.
+    mesh.mark_dirty((vertex for _, vertex in boundary), (face,))
+    if mesh.component_tracker is not None:
+      mesh.component_tracker.merge_all([boundary[0][1], *vertices])
+
+    results.append((vertices, side_faces))
+
+  return results
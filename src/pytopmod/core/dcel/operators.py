@@ -1,8 +1,10 @@
 """Manifold-preserving operators on DCEL Meshes."""
+import functools
 import itertools
 from typing import Generator, Optional
 
-from pytopmod.core import circular_list
+from pytopmod.core import circular_list, trace
+from pytopmod.core.dcel import traversal
 from pytopmod.core.dcel.mesh import DCELMesh
 from pytopmod.core.edge import EdgeKey
 from pytopmod.core.face import FaceKey
@@ -53,6 +55,7 @@ def face_trace(
     edge = node.vertex_1_next if node.face_1 == face else node.vertex_2_next
 
 
+@trace.traced
 def insert_edge(
         mesh: DCELMesh,
         vertex_1: VertexKey, edge_1: EdgeKey,
@@ -76,7 +79,7 @@ def insert_edge(
   face_1 = (edge_1_node.face_1 if edge_1_node.vertex_1 ==
             vertex_1 else edge_1_node.face_2)
   face_2 = (edge_2_node.face_1 if edge_2_node.vertex_1 ==
-            vertex_2 else edge_1_node.face_2)
+            vertex_2 else edge_2_node.face_2)
 
   # Set the vertex and edge information for the new edge.
   # 2 - Create a new edge node.
@@ -102,6 +105,7 @@ def insert_edge(
     # Set the face information for the new edge.
     new_edge_node.face_1 = new_face
     new_edge_node.face_2 = new_face
+    mesh.face_edge[new_face] = new_edge
     # Delete the old faces.
     mesh.delete_face(face_1)
     mesh.delete_face(face_2)
@@ -149,10 +153,14 @@ def insert_edge(
       else:
         edge_node.face_2 = new_face_2
 
+    mesh.face_edge[new_face_1] = edge_1_2
+    mesh.face_edge[new_face_2] = edge_2_2
+
     # Delete face_1 == face_2.
     mesh.delete_face(face_1)
 
 
+@trace.traced
 def delete_edge(mesh: DCELMesh, old_edge: EdgeKey):
   old_edge_node = mesh.edge_nodes[old_edge]
 
@@ -185,6 +193,9 @@ def delete_edge(mesh: DCELMesh, old_edge: EdgeKey):
         edge_node.face_1 = new_face
       if edge_node.face_2 in (face_1, face_2):
         edge_node.face_2 = new_face
+    # The edge after the deleted one in vertex_1's rotation borders the new
+    # face.
+    mesh.face_edge[new_face] = vertex_1_next
 
     # Delete face_1 and face_2.
     mesh.delete_face(face_1)
@@ -230,7 +241,7 @@ def delete_edge(mesh: DCELMesh, old_edge: EdgeKey):
       if edge_node.face_1 == face_1:
         edge_node.face_1 = new_face_1
       if edge_node.face_2 == face_1:
-        edge_node.face_2 = face_1
+        edge_node.face_2 = new_face_1
 
     # Starting from vertex_2_previous, traverse the face and replace face_1 by
     # new_face_2.
@@ -241,5 +252,15 @@ def delete_edge(mesh: DCELMesh, old_edge: EdgeKey):
       if edge_node.face_2 == face_1:
         edge_node.face_2 = new_face_2
 
+    mesh.face_edge[new_face_1] = vertex_1_previous
+    mesh.face_edge[new_face_2] = vertex_2_previous
+
     # Delete face_1 == face_2.
     mesh.delete_face(face_1)
+
+    # 3.3 - The deleted edge had the same face on both sides, so it may have
+    # been the only path between its vertices: update the components.
+    if mesh.component_tracker is not None:
+      mesh.component_tracker.split(
+          old_edge_node.vertex_1, old_edge_node.vertex_2,
+          functools.partial(traversal.vertex_neighbours, mesh))
@@ -1,4 +1,10 @@
-from pytopmod.core.dcel.mesh import DCELMesh
+from typing import Optional, Sequence, Tuple, cast
+
+from pytopmod.core import circular_list, parametric
+from pytopmod.core.dcel.mesh import DCELMesh, EdgeNode
+from pytopmod.core.edge import EdgeKey
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
 
 
 def tetrahedron() -> DCELMesh:
@@ -41,3 +47,135 @@ def square() -> DCELMesh:
   mesh.create_edge('v4', 'v1', 'f1', 'f2', 'e3', 'e1')
 
   return mesh
+
+
+def polygon_mesh(
+    positions: Sequence[Point3D],
+    polygons: Sequence[list[int]],
+    opposites: Optional[Sequence[int]] = None
+) -> DCELMesh:
+  """Creates and returns a mesh directly from vertex positions and polygons.
+
+  Polygons are lists of indices into the positions. They must form a closed
+  oriented surface, i.e each half-edge (u, v) must have an opposite half-edge
+  (v, u). Several edges may join the same two vertices (parallel edges): the
+  half-edges of the polygons, numbered in order (skipping point-spheres), are
+  then paired as given by 'opposites', or by default the k-th half-edge (u, v)
+  with the k-th half-edge (v, u).
+
+  The edge nodes are created and linked in two passes over the half-edges,
+  without going through the operators.
+  """
+  mesh = DCELMesh()
+  vertices = mesh.create_vertices(positions)
+  faces = mesh.create_faces(len(polygons))
+
+  # The half-edges, as pairs of vertex indices, with their face and the index
+  # of the next half-edge in that face.
+  half_edges: list[Tuple[int, int]] = []
+  half_edge_faces: list[FaceKey] = []
+  next_half_edges: list[int] = []
+  for face, polygon in zip(faces, polygons):
+    # A point-sphere has no edges.
+    if len(polygon) < 2:
+      continue
+    offset = len(half_edges)
+    half_edges.extend(circular_list.pairs(polygon))
+    half_edge_faces.extend([face] * len(polygon))
+    next_half_edges.extend(offset + (position + 1) % len(polygon)
+                           for position in range(len(polygon)))
+
+  if opposites is None:
+    opposites = _paired_by_occurrence(half_edges)
+  for half_edge, (index_1, index_2) in enumerate(half_edges):
+    opposite = opposites[half_edge]
+    if (opposites[opposite] != half_edge or opposite == half_edge or
+            half_edges[opposite] != (index_2, index_1)):
+      raise ValueError(f'Half-edge {(index_1, index_2)} has no opposite.')
+
+  # Create an edge node (u, v) for each pair of opposite half-edges, with u < v
+  # (or from the first half-edge of a loop).
+  forward = [index_1 < index_2 or (index_1 == index_2 and
+                                   half_edge < opposites[half_edge])
+             for half_edge, (index_1, index_2) in enumerate(half_edges)]
+  forward_half_edges = [half_edge for half_edge in range(len(half_edges))
+                        if forward[half_edge]]
+  half_edge_edges: list[EdgeKey] = [cast(EdgeKey, '')] * len(half_edges)
+  for edge, half_edge in zip(
+          mesh.edges.new_keys(len(forward_half_edges)), forward_half_edges):
+    index_1, index_2 = half_edges[half_edge]
+    vertex_1 = vertices[index_1]
+    vertex_2 = vertices[index_2]
+    mesh.edge_nodes[edge] = EdgeNode(vertex_1, vertex_2, '', '', '', '')
+    mesh.vertex_edge.setdefault(vertex_1, edge)
+    mesh.vertex_edge.setdefault(vertex_2, edge)
+    half_edge_edges[half_edge] = edge
+    half_edge_edges[opposites[half_edge]] = edge
+
+  # Link the edge nodes: the half-edge (u, v) is traversed by face_2 and
+  # followed by vertex_2_next, the half-edge (v, u) by face_1 and vertex_1_next.
+  for half_edge, face in enumerate(half_edge_faces):
+    mesh.face_edge.setdefault(face, half_edge_edges[half_edge])
+    node = mesh.edge_nodes[half_edge_edges[half_edge]]
+    next_edge = half_edge_edges[next_half_edges[half_edge]]
+    if forward[half_edge]:
+      node.face_2 = face
+      node.vertex_2_next = next_edge
+    else:
+      node.face_1 = face
+      node.vertex_1_next = next_edge
+
+  return mesh
+
+
+def _paired_by_occurrence(half_edges: Sequence[Tuple[int, int]]) -> list[int]:
+  """Returns the opposite of each half-edge, pairing the k-th half-edge (u, v)
+  with the k-th half-edge (v, u), or the half-edge itself if it has none."""
+  occurrences: dict[Tuple[int, int], list[int]] = {}
+  for half_edge, vertex_pair in enumerate(half_edges):
+    occurrences.setdefault(vertex_pair, []).append(half_edge)
+
+  opposites = list(range(len(half_edges)))
+  for (index_1, index_2), occurrence in occurrences.items():
+    if index_1 == index_2:
+      # Loops: pair consecutive occurrences.
+      for half_edge_1, half_edge_2 in zip(occurrence[::2], occurrence[1::2]):
+        opposites[half_edge_1] = half_edge_2
+        opposites[half_edge_2] = half_edge_1
+      continue
+    for half_edge, opposite in zip(occurrence,
+                                   occurrences.get((index_2, index_1), ())):
+      opposites[half_edge] = opposite
+  return opposites
+
+
+def grid(rows: int, columns: int) -> DCELMesh:
+  """Creates and returns a grid of rows x columns quads, closed by a back
+  face."""
+  return polygon_mesh(*parametric.grid(rows, columns))
+
+
+def cube(resolution: int = 1) -> DCELMesh:
+  """Creates and returns a cube with resolution x resolution quads per side."""
+  return polygon_mesh(*parametric.cube(resolution))
+
+
+def cylinder(segments: int, rings: int = 1) -> DCELMesh:
+  """Creates and returns a closed cylinder of segments x rings quads."""
+  return polygon_mesh(*parametric.cylinder(segments, rings))
+
+
+def torus(segments: int, sides: int) -> DCELMesh:
+  """Creates and returns a torus of segments x sides quads."""
+  return polygon_mesh(*parametric.torus(segments, sides))
+
+
+def uv_sphere(segments: int, rings: int) -> DCELMesh:
+  """Creates and returns a UV sphere with 'segments' meridians and 'rings'
+  bands."""
+  return polygon_mesh(*parametric.uv_sphere(segments, rings))
+
+
+def ico_sphere(subdivisions: int = 0) -> DCELMesh:
+  """Creates and returns an icosphere subdivided 'subdivisions' times."""
+  return polygon_mesh(*parametric.ico_sphere(subdivisions))
@@ -0,0 +1,16 @@
+"""Serving of DCEL Meshes by a MeshServer (see 'core.server')."""
+from pytopmod.core import server
+from pytopmod.core.dcel import arrays, operators
+from pytopmod.core.dcel.operations import extrusion, smoothing
+
+BACKEND = server.Backend(
+    kind='dcel',
+    operations={
+        'insert_edge': operators.insert_edge,
+        'delete_edge': operators.delete_edge,
+        'extrude_face': extrusion.extrude_face,
+        'extrude_faces': extrusion.extrude_faces,
+        'laplacian_smooth': smoothing.laplacian_smooth,
+        'taubin_smooth': smoothing.taubin_smooth,
+    },
+    arrays=arrays)
@@ -0,0 +1,92 @@
+"""Recording and replay of operation traces on DCEL Meshes (see
+'core.trace')."""
+import random
+from typing import Optional
+
+from pytopmod.core import trace
+from pytopmod.core.dcel import arrays, operators
+from pytopmod.core.dcel.mesh import DCELMesh
+from pytopmod.core.dcel.operations import extrusion, smoothing
+from pytopmod.core.face import FaceKey
+from pytopmod.core.vertex import VertexKey
+
+KIND = 'dcel'
+
+# The traced operations. Their position is their opcode: only append to it.
+OPERATIONS = (
+    trace.OperationSpec('insert_edge', operators, 'veve'),
+    trace.OperationSpec('delete_edge', operators, 'e'),
+    trace.OperationSpec('extrude_face', extrusion, 'fdodd'),
+    trace.OperationSpec('laplacian_smooth', smoothing, 'id'),
+    trace.OperationSpec('taubin_smooth', smoothing, 'idd'),
+)
+
+
+def recorder(mesh: DCELMesh) -> trace.Recorder:
+  """Returns a recorder of the operations applied to a mesh, until it is
+  closed (see 'trace.Recorder')."""
+  return trace.Recorder(mesh, KIND, OPERATIONS)
+
+
+def replay(
+        mesh: DCELMesh, data: bytes,
+        timings: bool = False) -> Optional[list[float]]:
+  """Applies the operations of a binary trace to a mesh.
+
+  If 'timings' is set, returns the duration of each operation in seconds.
+  """
+  return trace.replay(mesh, data, KIND, OPERATIONS, timings)
+
+
+def random_trace(
+        mesh: DCELMesh, count: int, seed: Optional[int] = None) -> bytes:
+  """Applies random operations to a mesh, and returns their binary trace.
+
+  The trace can be replayed on a copy of the mesh in its original state, e.g
+  the same primitive. Edges are only inserted between non-adjacent vertices of
+  a face, and only deleted between two faces sharing no other edge, so that
+  every edge keeps two distinct faces.
+  """
+  generator = random.Random(seed)
+
+  def simple_faces() -> dict[FaceKey, list[VertexKey]]:
+    faces = {}
+    for face in mesh.faces:
+      vertices = list(arrays.face_vertices(mesh, face))
+      if len(set(vertices)) == len(vertices):
+        faces[face] = vertices
+    return faces
+
+  with recorder(mesh) as active:
+    while len(active.operations) < count:
+      faces = simple_faces()
+      if generator.randrange(2) == 0:
+        candidates = [face for face, vertices in faces.items()
+                      if len(vertices) >= 4]
+        if not candidates:
+          continue
+        face = generator.choice(candidates)
+        vertices = faces[face]
+        index = generator.randrange(len(vertices))
+        offset = generator.randrange(2, len(vertices) - 1)
+        vertex_1 = vertices[index]
+        vertex_2 = vertices[(index + offset) % len(vertices)]
+        active.apply(
+            'insert_edge',
+            vertex_1, mesh.corner_of(vertex_1, face),
+            vertex_2, mesh.corner_of(vertex_2, face))
+      else:
+        candidates = []
+        for edge, node in mesh.edge_nodes.items():
+          if node.face_1 not in faces or node.face_2 not in faces:
+            continue
+          shared = sum(
+              1 for face_edge in mesh.face_edges(node.face_1)
+              if node.face_2 in (mesh.edge_nodes[face_edge].face_1,
+                                 mesh.edge_nodes[face_edge].face_2))
+          if node.face_1 != node.face_2 and shared == 1:
+            candidates.append(edge)
+        if not candidates:
+          continue
+        active.apply('delete_edge', generator.choice(candidates))
+    return active.trace()
@@ -0,0 +1,79 @@
+"""Lazy traversals over the face and vertex adjacency of DCEL Meshes."""
+import functools
+from typing import Generator
+
+from pytopmod.core import traversal
+from pytopmod.core.dcel.mesh import DCELMesh
+from pytopmod.core.face import FaceKey
+from pytopmod.core.vertex import VertexKey
+
+
+def face_neighbours(
+        mesh: DCELMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the other faces sharing an edge with a face."""
+  visited = {face}
+  for edge in mesh.face_edges(face):
+    node = mesh.edge_nodes[edge]
+    neighbour = node.face_2 if node.face_1 == face else node.face_1
+    if neighbour not in visited:
+      visited.add(neighbour)
+      yield neighbour
+
+
+def vertex_neighbours(
+        mesh: DCELMesh, vertex: VertexKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices sharing an edge with a vertex."""
+  visited = {vertex}
+  for edge in mesh.vertex_edges(vertex):
+    node = mesh.edge_nodes[edge]
+    neighbour = node.vertex_2 if node.vertex_1 == vertex else node.vertex_1
+    if neighbour not in visited:
+      visited.add(neighbour)
+      yield neighbour
+
+
+def breadth_first_faces(
+        mesh: DCELMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the faces reachable from a face, breadth-first."""
+  return traversal.breadth_first(face, functools.partial(face_neighbours, mesh))
+
+
+def depth_first_faces(
+        mesh: DCELMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the faces reachable from a face, depth-first."""
+  return traversal.depth_first(face, functools.partial(face_neighbours, mesh))
+
+
+def breadth_first_vertices(
+        mesh: DCELMesh, vertex: VertexKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices reachable from a vertex,
+  breadth-first."""
+  return traversal.breadth_first(
+      vertex, functools.partial(vertex_neighbours, mesh))
+
+
+def depth_first_vertices(
+        mesh: DCELMesh, vertex: VertexKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices reachable from a vertex,
+  depth-first."""
+  return traversal.depth_first(
+      vertex, functools.partial(vertex_neighbours, mesh))
+
+
+def component_faces(
+        mesh: DCELMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the faces in the same component as a face.
+
+  Unlike 'breadth_first_faces', this relies on the mesh's component tracker
+  and the vertices' rotations instead of walking face boundaries.
+  """
+  visited = set()
+  first_node = mesh.edge_nodes[mesh.face_edge[face]]
+  component = mesh.components.component(first_node.vertex_1)
+  for vertex in mesh.components.vertices(component):
+    for edge in mesh.vertex_edges(vertex):
+      node = mesh.edge_nodes[edge]
+      for vertex_face in (node.face_1, node.face_2):
+        if vertex_face not in visited:
+          visited.add(vertex_face)
+          yield vertex_face
@@ -0,0 +1,283 @@
+"""Quadric error metric edge-collapse decimation of polygon meshes.
+
+The decimation works on index-based polygon lists (see 'dlfl.arrays' and
+'dcel.arrays') so it can be shared by both mesh representations.
+
+Each vertex accumulates the (area-weighted) quadrics of the planes of its
+triangles. Every edge is pushed on a heap with the error of its optimal collapse
+position, and edges are collapsed cheapest first. Entries are never removed from
+the heap: they are stamped with the versions of their vertices, and discarded
+when popped if either vertex changed since (lazy deletion). A collapse only
+touches the triangles around the collapsed edge and re-pushes the edges around
+the resulting vertex, so the whole decimation runs in O(E log E). Collapses
+rejected to preserve the surface (see 'decimate') are retried once the
+triangles around their edge changed.
+"""
+import heapq
+from typing import Sequence, Tuple, TypeAlias
+
+from pytopmod.core.geometry import Point3D
+
+# Type alias for a symmetric 4x4 quadric, stored as its upper triangle:
+# (aa, ab, ac, ad, bb, bc, bd, cc, cd, dd).
+Quadric: TypeAlias = Tuple[float, float, float, float, float,
+                           float, float, float, float, float]
+
+_ZERO_QUADRIC: Quadric = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def triangulated(polygons: Sequence[Sequence[int]]) -> list[list[int]]:
+  """Returns the polygons split in triangle fans."""
+  return [[polygon[0], polygon[index], polygon[index + 1]]
+          for polygon in polygons for index in range(1, len(polygon) - 1)]
+
+
+def decimate(
+    positions: Sequence[Point3D],
+    polygons: Sequence[Sequence[int]],
+    target_faces: int
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Collapses edges until there are at most 'target_faces' triangles left.
+
+  Polygons are first split in triangle fans, and must form a closed manifold
+  surface. Collapses that would break manifoldness (link condition), flip a
+  triangle or leave a component with less than four triangles (a tetrahedron)
+  are skipped, so the target may not be reached on small meshes.
+
+  Returns the positions of the remaining vertices and the remaining triangles.
+  """
+  if any(len(polygon) < 3 for polygon in polygons):
+    raise ValueError('Decimation requires faces with at least three vertices.')
+
+  positions = list(positions)
+  triangles = triangulated(polygons)
+
+  quadrics = [_ZERO_QUADRIC] * len(positions)
+  vertex_triangles: list[set[int]] = [set() for _ in positions]
+  for index, triangle in enumerate(triangles):
+    quadric = _plane_quadric(*(positions[vertex] for vertex in triangle))
+    for vertex in triangle:
+      quadrics[vertex] = _add(quadrics[vertex], quadric)
+      vertex_triangles[vertex].add(index)
+
+  # The component of each vertex, and the number of triangles of each
+  # component. Collapses never split or merge components.
+  vertex_components = _components(len(positions), triangles)
+  component_faces: dict[int, int] = {}
+  for triangle in triangles:
+    component = vertex_components[triangle[0]]
+    component_faces[component] = component_faces.get(component, 0) + 1
+
+  # Vertex versions, bumped when a vertex moves (and set to -1 when it is
+  # collapsed) to invalidate its heap entries.
+  versions = [0] * len(positions)
+
+  def entry(
+      vertex_1: int, vertex_2: int
+  ) -> Tuple[float, int, int, int, int, Point3D]:
+    quadric = _add(quadrics[vertex_1], quadrics[vertex_2])
+    point = _optimal_point(
+        quadric, positions[vertex_1], positions[vertex_2])
+    return (_error(quadric, point), vertex_1, vertex_2,
+            versions[vertex_1], versions[vertex_2], point)
+
+  heap = [entry(vertex_1, vertex_2)
+          for vertex_1, vertex_2 in {(min(edge), max(edge))
+                                     for triangle in triangles
+                                     for edge in ((triangle[0], triangle[1]),
+                                                  (triangle[1], triangle[2]),
+                                                  (triangle[2], triangle[0]))}]
+  heapq.heapify(heap)
+
+  # The other vertex of each edge whose collapse was rejected, by vertex: the
+  # collapse may become possible once the triangles around the vertex change.
+  blocked: list[set[int]] = [set() for _ in positions]
+
+  alive = [True] * len(triangles)
+  face_count = len(triangles)
+  while face_count > target_faces and heap:
+    _, vertex_1, vertex_2, version_1, version_2, point = heapq.heappop(heap)
+    if versions[vertex_1] != version_1 or versions[vertex_2] != version_2:
+      continue
+
+    component = vertex_components[vertex_1]
+    if component_faces[component] - 2 < 4:
+      continue
+    shared = vertex_triangles[vertex_1] & vertex_triangles[vertex_2]
+    if (not _link_condition(triangles, vertex_triangles,
+                            vertex_1, vertex_2, shared) or
+        _flips(triangles, vertex_triangles, positions,
+               vertex_1, vertex_2, shared, point)):
+      blocked[vertex_1].add(vertex_2)
+      blocked[vertex_2].add(vertex_1)
+      continue
+
+    # Remove the triangles on both sides of the edge.
+    for index in shared:
+      for vertex in triangles[index]:
+        vertex_triangles[vertex].discard(index)
+      alive[index] = False
+      face_count -= 1
+      component_faces[component] -= 1
+
+    # Move vertex_1 to the collapse point and give it vertex_2's triangles.
+    for index in vertex_triangles[vertex_2]:
+      triangle = triangles[index]
+      triangle[triangle.index(vertex_2)] = vertex_1
+      vertex_triangles[vertex_1].add(index)
+    vertex_triangles[vertex_2] = set()
+    positions[vertex_1] = point
+    quadrics[vertex_1] = _add(quadrics[vertex_1], quadrics[vertex_2])
+    versions[vertex_1] += 1
+    versions[vertex_2] = -1
+
+    blocked[vertex_2] = set()
+    for neighbour in _neighbours(triangles, vertex_triangles, vertex_1):
+      heapq.heappush(heap, entry(vertex_1, neighbour))
+      # The triangles around the neighbour changed: retry its rejected
+      # collapses.
+      for other in blocked[neighbour]:
+        blocked[other].discard(neighbour)
+        if versions[other] != -1:
+          heapq.heappush(heap, entry(neighbour, other))
+      blocked[neighbour] = set()
+
+  # Compact the remaining vertices and triangles.
+  new_indices: dict[int, int] = {}
+  new_positions = []
+  for vertex, position in enumerate(positions):
+    if vertex_triangles[vertex]:
+      new_indices[vertex] = len(new_positions)
+      new_positions.append(position)
+  new_triangles = [[new_indices[vertex] for vertex in triangle]
+                   for index, triangle in enumerate(triangles) if alive[index]]
+
+  return (new_positions, new_triangles)
+
+
+def _neighbours(
+        triangles: list[list[int]], vertex_triangles: list[set[int]],
+        vertex: int) -> set[int]:
+  """Returns the vertices sharing a triangle with a vertex."""
+  return {other for index in vertex_triangles[vertex]
+          for other in triangles[index] if other != vertex}
+
+
+def _components(
+        vertex_count: int, triangles: list[list[int]]) -> list[int]:
+  """Returns the connected component label of each vertex."""
+  parents = list(range(vertex_count))
+
+  def root(vertex: int) -> int:
+    while parents[vertex] != vertex:
+      parents[vertex] = parents[parents[vertex]]
+      vertex = parents[vertex]
+    return vertex
+
+  for triangle in triangles:
+    for vertex in triangle[1:]:
+      parents[root(vertex)] = root(triangle[0])
+  return [root(vertex) for vertex in range(vertex_count)]
+
+
+def _link_condition(
+        triangles: list[list[int]], vertex_triangles: list[set[int]],
+        vertex_1: int, vertex_2: int, shared: set[int]) -> bool:
+  """Returns whether collapsing an edge preserves manifoldness.
+
+  The edge must have two triangles on its sides with distinct opposite
+  vertices, and the vertices adjacent to both ends of the edge must be exactly
+  these opposite vertices.
+  """
+  opposite = {vertex for index in shared for vertex in triangles[index]
+              if vertex not in (vertex_1, vertex_2)}
+  return len(shared) == 2 and len(opposite) == 2 and (
+      _neighbours(triangles, vertex_triangles, vertex_1) &
+      _neighbours(triangles, vertex_triangles, vertex_2)) == opposite
+
+
+def _flips(
+        triangles: list[list[int]], vertex_triangles: list[set[int]],
+        positions: list[Point3D],
+        vertex_1: int, vertex_2: int, shared: set[int],
+        point: Point3D) -> bool:
+  """Returns whether moving an edge to 'point' would flip a triangle."""
+  for vertex in (vertex_1, vertex_2):
+    for index in vertex_triangles[vertex] - shared:
+      old = [positions[corner] for corner in triangles[index]]
+      new = [point if corner == vertex else positions[corner]
+             for corner in triangles[index]]
+      old_normal = _normal(*old)
+      new_normal = _normal(*new)
+      if sum(a * b for a, b in zip(old_normal, new_normal)) <= 0.0:
+        return True
+  return False
+
+
+def _normal(point_1: Point3D, point_2: Point3D, point_3: Point3D) -> Point3D:
+  """Returns the (non-normalized) normal of a triangle."""
+  u = (point_2[0] - point_1[0], point_2[1] - point_1[1],
+       point_2[2] - point_1[2])
+  v = (point_3[0] - point_1[0], point_3[1] - point_1[1],
+       point_3[2] - point_1[2])
+  return (u[1] * v[2] - u[2] * v[1],
+          u[2] * v[0] - u[0] * v[2],
+          u[0] * v[1] - u[1] * v[0])
+
+
+def _plane_quadric(
+        point_1: Point3D, point_2: Point3D, point_3: Point3D) -> Quadric:
+  """Returns the quadric of a triangle's plane, weighted by its area."""
+  normal = _normal(point_1, point_2, point_3)
+  length = sum(coordinate * coordinate for coordinate in normal) ** 0.5
+  if length == 0.0:
+    return _ZERO_QUADRIC
+  a, b, c = (coordinate / length for coordinate in normal)
+  d = -(a * point_1[0] + b * point_1[1] + c * point_1[2])
+  # The normal's length is twice the triangle's area.
+  weight = length / 2.0
+  return (weight * a * a, weight * a * b, weight * a * c, weight * a * d,
+          weight * b * b, weight * b * c, weight * b * d,
+          weight * c * c, weight * c * d, weight * d * d)
+
+
+def _add(quadric_1: Quadric, quadric_2: Quadric) -> Quadric:
+  return tuple(a + b for a, b in zip(quadric_1, quadric_2))  # type: ignore
+
+
+def _error(quadric: Quadric, point: Point3D) -> float:
+  """Returns the quadric error v^T Q v at a point, with v = (x, y, z, 1)."""
+  aa, ab, ac, ad, bb, bc, bd, cc, cd, dd = quadric
+  x, y, z = point
+  return (aa * x * x + 2.0 * ab * x * y + 2.0 * ac * x * z + 2.0 * ad * x +
+          bb * y * y + 2.0 * bc * y * z + 2.0 * bd * y +
+          cc * z * z + 2.0 * cd * z + dd)
+
+
+def _optimal_point(
+        quadric: Quadric, point_1: Point3D, point_2: Point3D) -> Point3D:
+  """Returns the point minimizing a quadric's error.
+
+  Falls back to the best of the two edge ends and its midpoint when the
+  quadric is (nearly) singular, e.g on flat regions.
+  """
+  aa, ab, ac, ad, bb, bc, bd, cc, cd, _ = quadric
+  determinant = (aa * (bb * cc - bc * bc) - ab * (ab * cc - bc * ac) +
+                 ac * (ab * bc - bb * ac))
+  scale = (aa + bb + cc) ** 3
+  if scale > 0.0 and abs(determinant) > 1e-6 * scale:
+    # Solve A.p = r with Cramer's rule, A being the upper-left 3x3 block.
+    r_a, r_b, r_c = -ad, -bd, -cd
+    x = (r_a * (bb * cc - bc * bc) - ab * (r_b * cc - bc * r_c) +
+         ac * (r_b * bc - bb * r_c)) / determinant
+    y = (aa * (r_b * cc - bc * r_c) - r_a * (ab * cc - bc * ac) +
+         ac * (ab * r_c - r_b * ac)) / determinant
+    z = (aa * (bb * r_c - r_b * bc) - ab * (ab * r_c - r_b * ac) +
+         r_a * (ab * bc - bb * ac)) / determinant
+    return (x, y, z)
+
+  midpoint: Point3D = ((point_1[0] + point_2[0]) / 2.0,
+                       (point_1[1] + point_2[1]) / 2.0,
+                       (point_1[2] + point_2[2]) / 2.0)
+  return min((point_1, point_2, midpoint),
+             key=lambda point: _error(quadric, point))
@@ -0,0 +1,115 @@
+"""Incremental export of mesh changes (deltas) for live viewers.
+
+A delta lists the vertices and faces marked as dirty since the previous delta
+(see 'Mesh.take_dirty'), one per line, keyed by their mesh keys:
+
+  v <vertex> <x> <y> <z>       A vertex was created or modified.
+  f <face> <vertex> ...        A face was created or its boundary modified.
+  df <face>                    A face was deleted.
+  dv <vertex>                  A vertex was deleted.
+
+Creations and modifications come first, then deletions, so a viewer can apply
+the lines in order. Each delta ends with an empty line. Keys that were created
+and deleted since the previous delta (e.g. intermediate faces of an operation)
+are left out.
+
+The 'dlfl.delta_io' and 'dcel.delta_io' modules encode deltas of each mesh
+representation, and DeltaStream sends them to an asyncio stream (e.g. a Unix
+socket or a pipe), at most once per frame.
+"""
+import asyncio
+from typing import Callable, Iterable, Optional
+
+from pytopmod.core.face import FaceKey
+from pytopmod.core.mesh import Mesh
+from pytopmod.core.vertex import VertexKey
+
+
+def encode_delta(
+    mesh: Mesh,
+    vertices: Iterable[VertexKey], faces: Iterable[FaceKey],
+    face_vertices: Callable[[FaceKey], Iterable[VertexKey]]
+) -> str:
+  """Returns the delta updating the passed vertices and faces, or an empty
+  string if there are none.
+
+  Vertices and faces that are no longer in the mesh are encoded as deleted.
+  """
+  lines = []
+  deleted_vertices = []
+  for vertex in vertices:
+    if vertex in mesh.vertex_coordinates:
+      coordinates = ' '.join(
+          str(coord) for coord in mesh.vertex_coordinates[vertex])
+      lines.append(f'v {vertex} {coordinates}')
+    else:
+      deleted_vertices.append(vertex)
+
+  deleted_faces = []
+  for face in faces:
+    if face in mesh.faces:
+      lines.append(f'f {face} {" ".join(face_vertices(face))}')
+    else:
+      deleted_faces.append(face)
+
+  lines.extend(f'df {face}' for face in deleted_faces)
+  lines.extend(f'dv {vertex}' for vertex in deleted_vertices)
+  if not lines:
+    return ''
+  return '\n'.join(lines) + '\n\n'
+
+
+class DeltaStream:
+  """Sends the deltas of a mesh to an asyncio stream writer.
+
+  'encode' returns the delta of the changes since its previous call (or a full
+  snapshot of the mesh if passed True), e.g. 'dlfl.delta_io.mesh_to_delta'
+  bound to a mesh. Changes made between two frames, e.g. by a burst of
+  operator calls, are coalesced in a single delta.
+  """
+
+  def __init__(
+          self, writer: asyncio.StreamWriter,
+          encode: Callable[[bool], str], frame_rate: float = 60.0):
+    self.writer = writer
+    self.encode = encode
+    self.frame_interval = 1.0 / frame_rate
+    self._task: Optional[asyncio.Task] = None
+
+  async def flush(self, full: bool = False) -> bool:
+    """Sends the pending changes (or a full snapshot) right away, and returns
+    whether anything was sent."""
+    delta = self.encode(full)
+    if not delta:
+      return False
+    self.writer.write(delta.encode())
+    await self.writer.drain()
+    return True
+
+  async def run(self):
+    """Sends a full snapshot, then the pending changes at each frame, until
+    cancelled."""
+    await self.flush(full=True)
+    while True:
+      await asyncio.sleep(self.frame_interval)
+      await self.flush()
+
+  def start(self) -> asyncio.Task:
+    """Starts sending deltas in a background task."""
+    if self._task is None or self._task.done():
+      self._task = asyncio.create_task(self.run())
+    return self._task
+
+  async def close(self):
+    """Stops sending deltas, flushes the pending changes and closes the
+    writer."""
+    if self._task is not None:
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+    await self.flush()
+    self.writer.close()
+    await self.writer.wait_closed()
@@ -0,0 +1,116 @@
+"""Conversions of DLFL Meshes to index-based arrays.
+
+Connectivity arrays are cached on the mesh and only rebuilt after its
+connectivity changed (see 'Mesh.cached'): they are shared between callers and
+must not be modified. Positions are read from the mesh on every call.
+"""
+from typing import Tuple
+
+from pytopmod.core import arrays, canonical, memo
+from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
+from pytopmod.core.vertex import VertexKey
+
+
+def vertices(mesh: DLFLMesh) -> list[VertexKey]:
+  """Returns the mesh's vertices, in the order used by all index arrays."""
+  return mesh.cached('vertices', lambda: list(mesh.vertices))
+
+
+def positions(mesh: DLFLMesh) -> list[Point3D]:
+  """Returns the positions of the mesh's vertices, in index order."""
+  return [mesh.vertex_coordinates[vertex] for vertex in vertices(mesh)]
+
+
+def faces(mesh: DLFLMesh) -> Tuple[list[FaceKey], list[list[int]]]:
+  """Returns the mesh's faces and their boundaries as lists of vertex
+  indices."""
+  def build() -> Tuple[list[FaceKey], list[list[int]]]:
+    vertex_indices = _vertex_indices(mesh)
+    face_keys = list(mesh.faces)
+    return (face_keys,
+            [[vertex_indices[vertex] for vertex in mesh.face_vertices[face]]
+             for face in face_keys])
+
+  return mesh.cached('faces', build)
+
+
+def edge_indices(mesh: DLFLMesh) -> list[Tuple[int, int]]:
+  """Returns the mesh's edges as pairs of vertex indices."""
+  def build() -> list[Tuple[int, int]]:
+    vertex_indices = _vertex_indices(mesh)
+    return [(vertex_indices[vertex_1], vertex_indices[vertex_2])
+            for vertex_1, vertex_2 in mesh.edges()]
+
+  return mesh.cached('edge_indices', build)
+
+
+def face_corners(mesh: DLFLMesh) -> Tuple[list[int], list[int]]:
+  """Returns the CSR face boundaries (offsets, vertex indices), as expected by
+  the bulk kernels in 'geometry'."""
+  return mesh.cached(
+      'face_corners', lambda: arrays.csr_polygons(faces(mesh)[1]))
+
+
+def vertex_faces(mesh: DLFLMesh) -> Tuple[list[int], list[int]]:
+  """Returns the CSR vertex-face incidence (offsets, face indices)."""
+  return mesh.cached('vertex_faces', lambda: arrays.csr_incidence(
+      len(vertices(mesh)), faces(mesh)[1]))
+
+
+def vertex_adjacency(mesh: DLFLMesh) -> Tuple[list[int], list[int]]:
+  """Returns the CSR vertex adjacency (offsets, neighbour indices)."""
+  return mesh.cached('vertex_adjacency', lambda: arrays.csr_adjacency(
+      len(vertices(mesh)), edge_indices(mesh)))
+
+
+def polygons(
+        mesh: DLFLMesh
+) -> Tuple[list[VertexKey], list[Point3D], list[list[int]]]:
+  """Returns the mesh's vertices, their positions and its faces as polygons.
+
+  Polygons are lists of indices into the vertices, in face key order, and can
+  be passed back to 'primitives.polygon_mesh'.
+  """
+  return (vertices(mesh), positions(mesh), faces(mesh)[1])
+
+
+def edges(
+        mesh: DLFLMesh
+) -> Tuple[list[VertexKey], list[Point3D], list[Tuple[int, int]]]:
+  """Returns the mesh's vertices, their positions and its edges as pairs of
+  indices into the vertices."""
+  return (vertices(mesh), positions(mesh), edge_indices(mesh))
+
+
+def fingerprint(mesh: DLFLMesh) -> str:
+  """Returns a stable content hash of the mesh's keys, connectivity and vertex
+  coordinates (see 'memo.fingerprint')."""
+  connectivity = mesh.cached(
+      'connectivity_digest',
+      lambda: memo.connectivity_digest('dlfl', vertices(mesh), *faces(mesh)))
+  return memo.fingerprint(connectivity, positions(mesh))
+
+
+def canonical_form(mesh: DLFLMesh, include_positions: bool = True) -> bytes:
+  """Returns the canonical form of the mesh, which is equal for meshes that
+  only differ by their keys or representation (see 'canonical')."""
+  if not include_positions:
+    return mesh.cached('canonical_form', lambda: canonical.canonical_form(
+        len(vertices(mesh)), faces(mesh)[1]))
+  return canonical.canonical_form(
+      len(vertices(mesh)), faces(mesh)[1], positions(mesh))
+
+
+def isomorphic(
+        mesh_1: DLFLMesh, mesh_2: DLFLMesh,
+        include_positions: bool = True) -> bool:
+  """Returns whether two meshes have the same canonical form."""
+  return (canonical_form(mesh_1, include_positions) ==
+          canonical_form(mesh_2, include_positions))
+
+
+def _vertex_indices(mesh: DLFLMesh) -> dict[VertexKey, int]:
+  return mesh.cached('vertex_indices', lambda: {
+      vertex: index for index, vertex in enumerate(vertices(mesh))})
@@ -1,33 +1,75 @@
 import dataclasses
+from typing import (
+    Generator, Iterable, Iterator, Optional, Sequence, Tuple, TypeAlias)
 
+from pytopmod.core import circular_list
 from pytopmod.core.face import FaceKey
 from pytopmod.core.geometry import Point3D
 from pytopmod.core.mesh import Mesh
 from pytopmod.core.vertex import VertexKey
 
+# Type alias for a corner: a vertex in the boundary of a face.
+Corner: TypeAlias = Tuple[VertexKey, FaceKey]
+
+# Type alias for an (undirected) edge, identified by its two vertices.
+Edge: TypeAlias = Tuple[VertexKey, VertexKey]
+
+# Type alias for a half-edge, from its first to its second vertex.
+HalfEdgeVertices: TypeAlias = Tuple[VertexKey, VertexKey]
+
+# Type alias for an occurrence of a half-edge in a face boundary: the face and
+# the position of its first vertex.
+HalfEdgePosition: TypeAlias = Tuple[FaceKey, int]
+
 
 @dataclasses.dataclass(slots=True)
 class DLFLMesh(Mesh):
   """DLFL-backed Mesh class.
 
   This structure uses two maps:
-   - face_vertices: A map that associates each face with an ordered list of the 
+   - face_vertices: A map that associates each face with an ordered list of the
       vertices forming its boundary.
    - vertex_faces: A map that associates each vertex with an (unordered) set of
       faces in its rotation.
 
+  Two indexes are built from the face boundaries on first query (see
+  'build_indexes'), then maintained alongside:
+   - half_edge_positions: A map that associates each half-edge (u, v) with
+      the faces containing it and the position of u in their boundary, once
+      for each occurrence.
+   - corner_positions: A map that associates each corner (vertex, face) with
+      the position of the first occurrence of the vertex in the face boundary.
+
+  Face boundaries alone cannot tell apart several edges joining the same two
+  vertices (parallel edges): the k-th occurrence of a half-edge (u, v) in the
+  index is paired with the k-th occurrence of (v, u). A parallel edge can only
+  be inserted once the indexes are built, which the operators ensure.
+
   Manifold-preserving operators are implemented in 'operators.py'.
   """
   face_vertices: dict[FaceKey, list[VertexKey]] = dataclasses.field(
       default_factory=dict)
   vertex_faces: dict[VertexKey, set[FaceKey]] = dataclasses.field(
       default_factory=dict)
+  half_edge_positions: dict[
+      HalfEdgeVertices, list[HalfEdgePosition]] = dataclasses.field(
+          default_factory=dict)
+  corner_positions: dict[Corner, int] = dataclasses.field(
+      default_factory=dict)
+  _indexed: bool = dataclasses.field(
+      default=False, init=False, repr=False, compare=False)
 
   def create_vertex(self, position: Point3D) -> VertexKey:
     vertex = super(DLFLMesh, self).create_vertex(position)
     self.vertex_faces[vertex] = set()
     return vertex
 
+  def create_vertices(self, positions: Iterable[Point3D]) -> list[VertexKey]:
+    vertices = super(DLFLMesh, self).create_vertices(positions)
+    for vertex in vertices:
+      self.vertex_faces[vertex] = set()
+    return vertices
+
   def delete_vertex(self, vertex: VertexKey):
     super(DLFLMesh, self).delete_vertex(vertex)
     del self.vertex_faces[vertex]
@@ -37,6 +79,259 @@ class DLFLMesh(Mesh):
     self.face_vertices[face] = []
     return face
 
+  def create_faces(self, count: int) -> list[FaceKey]:
+    faces = super(DLFLMesh, self).create_faces(count)
+    for face in faces:
+      self.face_vertices[face] = []
+    return faces
+
   def delete_face(self, face: FaceKey):
+    self.unlink_face(face)
     super(DLFLMesh, self).delete_face(face)
     del self.face_vertices[face]
+
+  def _connected_vertices(self) -> Iterable[Iterable[VertexKey]]:
+    return self.face_vertices.values()
+
+  @property
+  def indexed(self) -> bool:
+    """Whether the edge and corner indexes are built."""
+    return self._indexed
+
+  def build_indexes(self):
+    """Builds the edge and corner indexes from the face boundaries, unless
+    they are built already.
+
+    Without parallel edges, the occurrences of a half-edge and its opposite
+    are paired unambiguously.
+    """
+    if self._indexed:
+      return
+    self._indexed = True
+    self.half_edge_positions.clear()
+    self.corner_positions.clear()
+    for face in self.faces:
+      self._index_face(face, None)
+
+  def link_face(
+          self, face: FaceKey,
+          origins: Optional[Sequence[Optional[HalfEdgePosition]]] = None):
+    """Updates the edge and corner indexes with the boundary of a face.
+
+    Must be called whenever the boundary of a face is set, before the faces it
+    replaces are deleted. The origins give, for each position in the boundary,
+    the occurrence in a replaced face of the half-edge starting there, or None
+    for a half-edge of an inserted edge: it takes the place of that occurrence
+    in the index, so parallel edges stay paired. Without origins, all the
+    half-edges are indexed as new ones. Does nothing to the indexes until they
+    are built.
+    """
+    self.version += 1
+    # The rotations of the face's vertices changed along with the face.
+    self.mark_dirty(self.face_vertices[face], (face,))
+    if self._indexed:
+      self._index_face(face, origins)
+
+  def _index_face(
+          self, face: FaceKey,
+          origins: Optional[Sequence[Optional[HalfEdgePosition]]]):
+    face_vertices = self.face_vertices[face]
+    # Iterate backwards so a vertex appearing several times in the boundary is
+    # indexed at its first occurrence, as found by the operators.
+    for position in range(len(face_vertices) - 1, -1, -1):
+      self.corner_positions[(face_vertices[position], face)] = position
+
+    # A point-sphere has no edges.
+    if len(face_vertices) < 2:
+      return
+    for position, half_edge in enumerate(circular_list.pairs(face_vertices)):
+      positions = self.half_edge_positions.setdefault(half_edge, [])
+      origin = None if origins is None else origins[position]
+      if origin is None:
+        positions.append((face, position))
+      else:
+        positions[positions.index(origin)] = (face, position)
+
+  def unlink_face(self, face: FaceKey):
+    """Removes the boundary of a face from the edge and corner indexes.
+
+    Its half-edges that were not taken over by another face are removed, along
+    with the edges left without any.
+    """
+    if not self._indexed:
+      return
+    face_vertices = self.face_vertices[face]
+    if len(face_vertices) > 1:
+      for position, half_edge in enumerate(
+              circular_list.pairs(face_vertices)):
+        positions = self.half_edge_positions.get(half_edge, [])
+        if (face, position) not in positions:
+          continue
+        positions.remove((face, position))
+        if not positions:
+          del self.half_edge_positions[half_edge]
+    for vertex in face_vertices:
+      self.corner_positions.pop((vertex, face), None)
+
+  def edges(self) -> Iterator[Edge]:
+    """Returns an iterator over the edges of the mesh.
+
+    Each edge is given by the vertices of its first indexed half-edge, and
+    parallel edges are given once each.
+    """
+    self.build_indexes()
+    indexed = set()
+    for (vertex_1, vertex_2), positions in self.half_edge_positions.items():
+      if (vertex_2, vertex_1) not in indexed:
+        indexed.add((vertex_1, vertex_2))
+        yield from ((vertex_1, vertex_2) for _ in positions)
+
+  def find_edge(
+          self, vertex_1: VertexKey, vertex_2: VertexKey) -> Optional[Edge]:
+    """Returns the edge between two vertices, as (vertex_1, vertex_2), if they
+    are joined by at least one.
+
+    Before the indexes are built, the boundaries of the faces shared by the
+    vertices are searched instead.
+    """
+    if not self._indexed:
+      for face in self.shared_faces(vertex_1, vertex_2):
+        face_vertices = self.face_vertices[face]
+        half_edges = set(
+            zip(face_vertices, face_vertices[1:] + face_vertices[:1]))
+        if ((vertex_1, vertex_2) in half_edges or
+                (vertex_2, vertex_1) in half_edges):
+          return (vertex_1, vertex_2)
+      return None
+    if (vertex_1, vertex_2) in self.half_edge_positions or (
+            vertex_2, vertex_1) in self.half_edge_positions:
+      return (vertex_1, vertex_2)
+    return None
+
+  def corners_of_edge(
+          self, vertex_1: VertexKey, vertex_2: VertexKey
+  ) -> Tuple[Corner, Corner]:
+    """Returns the corners of an edge between two vertices.
+
+    The corners are ordered as the passed vertices, i.e ((vertex_1, face_1),
+    (vertex_2, face_2)) where face_1 contains the half-edge (vertex_1, vertex_2)
+    and face_2 the half-edge (vertex_2, vertex_1), as expected by the
+    'delete_edge' operator. For parallel edges, those of the first one are
+    returned.
+    """
+    self.build_indexes()
+    (face_1, _), *_ = self.half_edge_positions[(vertex_1, vertex_2)]
+    (face_2, _), *_ = self.half_edge_positions[(vertex_2, vertex_1)]
+    return ((vertex_1, face_1), (vertex_2, face_2))
+
+  def corner_of(self, vertex: VertexKey, face: FaceKey) -> int:
+    """Returns the position of a corner in its face boundary.
+
+    Raises a KeyError if the vertex is not in the face boundary.
+    """
+    self.build_indexes()
+    return self.corner_positions[(vertex, face)]
+
+  def corner_neighbours(
+          self, vertex: VertexKey, face: FaceKey
+  ) -> Tuple[VertexKey, VertexKey]:
+    """Returns the vertices before and after a corner in its face boundary."""
+    self.build_indexes()
+    face_vertices = self.face_vertices[face]
+    position = self.corner_positions[(vertex, face)]
+    return (face_vertices[position - 1],
+            face_vertices[(position + 1) % len(face_vertices)])
+
+  def vertex_rotation(
+          self, vertex: VertexKey) -> Generator[FaceKey, None, None]:
+    """Returns a generator over the faces around a vertex, in rotation order.
+
+    A face appears once for each occurrence of the vertex in its boundary (see
+    'rotation_corners').
+    """
+    return (face for face, _ in self.rotation_corners(vertex))
+
+  def rotation_corners(
+          self, vertex: VertexKey
+  ) -> Generator[Tuple[FaceKey, int], None, None]:
+    """Returns a generator over the corners of a vertex, in rotation order.
+
+    Each corner is given as a face and the position of the vertex in its
+    boundary, so the occurrences of a vertex appearing several times in a face
+    boundary are told apart. From each corner, the next one is found across
+    the edge leaving the vertex, with O(1) lookups in the edge index (O(number
+    of parallel edges) for parallel edges).
+    """
+    self.build_indexes()
+    first_face = next(iter(self.vertex_faces[vertex]), None)
+    if first_face is None:
+      return
+    first_corner = (first_face, self.corner_positions[(vertex, first_face)])
+    face, position = first_corner
+    while True:
+      yield (face, position)
+      face_vertices = self.face_vertices[face]
+      # A point-sphere is alone in its vertex's rotation.
+      if len(face_vertices) < 2:
+        return
+      # The next corner follows the opposite half-edge (next_vertex, vertex).
+      face, position = self._opposite_corner(face, position)
+      if (face, position) == first_corner:
+        return
+
+  def _opposite_corner(
+          self, face: FaceKey, position: int) -> Tuple[FaceKey, int]:
+    """Returns the corner following the opposite of the half-edge leaving a
+    corner, given as a face and a position in its boundary."""
+    face, position = self.opposite_half_edge(face, position)
+    return (face, (position + 1) % len(self.face_vertices[face]))
+
+  def opposite_half_edge(
+          self, face: FaceKey, position: int) -> HalfEdgePosition:
+    """Returns the occurrence of the opposite of the half-edge starting at a
+    position in a face boundary."""
+    self.build_indexes()
+    face_vertices = self.face_vertices[face]
+    vertex = face_vertices[position]
+    next_vertex = face_vertices[(position + 1) % len(face_vertices)]
+    positions = self.half_edge_positions[(vertex, next_vertex)]
+    # The k-th occurrence of the half-edge is paired with the k-th occurrence
+    # of its opposite.
+    rank = 0 if len(positions) == 1 else positions.index((face, position))
+    return self.half_edge_positions[(next_vertex, vertex)][rank]
+
+  def edge_positions(
+          self, vertex_1: VertexKey, face_1: FaceKey,
+          vertex_2: VertexKey, face_2: FaceKey) -> Tuple[int, int]:
+    """Returns the positions of the half-edges of an edge between two corners,
+    i.e of (vertex_1, vertex_2) in the boundary of face_1 and of (vertex_2,
+    vertex_1) in the boundary of face_2.
+
+    For parallel edges, those of the first one bordered by both faces are
+    returned, or the first occurrences of the half-edges if there is none.
+    """
+    self.build_indexes()
+    positions = self.half_edge_positions[(vertex_1, vertex_2)]
+    opposite_positions = self.half_edge_positions[(vertex_2, vertex_1)]
+    for (face, position), (opposite_face, opposite_position) in zip(
+            positions, opposite_positions):
+      if face == face_1 and opposite_face == face_2:
+        return (position, opposite_position)
+    return (
+        next(position for face, position in positions if face == face_1),
+        next(position for face, position in opposite_positions
+             if face == face_2))
+
+  def shared_faces(
+          self, vertex_1: VertexKey, vertex_2: VertexKey) -> list[FaceKey]:
+    """Returns the faces whose boundary contains both vertices.
+
+    Each returned face gives a pair of corners (vertex_1, face) and (vertex_2,
+    face) that can be passed to the 'insert_edge' operator. This costs
+    O(min(valence_1, valence_2)).
+    """
+    faces_1 = self.vertex_faces[vertex_1]
+    faces_2 = self.vertex_faces[vertex_2]
+    if len(faces_1) > len(faces_2):
+      faces_1, faces_2 = faces_2, faces_1
+    return [face for face in faces_1 if face in faces_2]
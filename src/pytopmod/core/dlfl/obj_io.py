@@ -1,9 +1,21 @@
 """Conversion functions between OBJ format and DLFL representation."""
+from typing import BinaryIO, Optional
+
+from pytopmod.core import memo, obj_io
+from pytopmod.core.dlfl import arrays
 from pytopmod.core.dlfl.mesh import DLFLMesh
 
 
-def mesh_to_obj(mesh: DLFLMesh) -> str:
-  """Converts a DLFLMesh to OBJ format."""
+def mesh_to_obj(mesh: DLFLMesh, cache: Optional[memo.MemoCache] = None) -> str:
+  """Converts a DLFLMesh to OBJ format.
+
+  If a cache is passed, the result is memoized under the mesh's fingerprint.
+  """
+  if cache is not None:
+    return cache.memoize(
+        'dlfl.mesh_to_obj', arrays.fingerprint(mesh),
+        lambda: mesh_to_obj(mesh))
+
   vertex_index_map = {}
 
   obj_vertices = []
@@ -21,5 +33,18 @@ def mesh_to_obj(mesh: DLFLMesh) -> str:
   return '\n'.join(obj_vertices) + '\n' + '\n'.join(obj_faces)
 
 
+def write_obj(
+        mesh: DLFLMesh, file: BinaryIO,
+        workers: Optional[int] = None, chunk_size: int = 65536):
+  """Writes a DLFLMesh to a binary file in OBJ format, formatting it in
+  parallel (see 'core.obj_io.write_obj').
+
+  The output is identical to mesh_to_obj's.
+  """
+  offsets, corners = arrays.face_corners(mesh)
+  obj_io.write_obj(
+      file, arrays.positions(mesh), offsets, corners, workers, chunk_size)
+
+
 def obj_to_mesh(obj: str) -> DLFLMesh:
   raise NotImplementedError()
@@ -0,0 +1,49 @@
+"""Dual operations for DLFL Meshes."""
+from pytopmod.core import circular_list
+from pytopmod.core.dlfl import arrays, primitives
+from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.geometry import Point3D
+
+
+def dual(mesh: DLFLMesh) -> DLFLMesh:
+  """Returns the dual of a mesh.
+
+  Each face becomes a vertex at its centroid, and each vertex becomes a face
+  whose boundary goes through the duals of the faces around it. The dual faces
+  are read from the vertex rotations (see 'DLFLMesh.vertex_rotation') in a
+  single pass, and the new mesh is built directly from them.
+
+  Raises a ValueError if two faces share several edges, or if an edge has the
+  same face on both sides: their duals would be parallel edges or loops,
+  which cannot be built from polygons (see 'primitives.polygon_mesh').
+  """
+  face_keys, polygons = arrays.faces(mesh)
+  positions = arrays.positions(mesh)
+  face_indices = {face: index for index, face in enumerate(face_keys)}
+
+  centroids: list[Point3D] = []
+  for polygon in polygons:
+    count = len(polygon)
+    centroids.append((sum(positions[index][0] for index in polygon) / count,
+                      sum(positions[index][1] for index in polygon) / count,
+                      sum(positions[index][2] for index in polygon) / count))
+
+  # Rotations turn clockwise around their vertex: reverse them so the dual
+  # faces keep the orientation of the mesh.
+  dual_polygons = [
+      [face_indices[face] for face in mesh.vertex_rotation(vertex)][::-1]
+      for vertex in arrays.vertices(mesh) if mesh.vertex_faces[vertex]]
+
+  half_edges = set()
+  for polygon in dual_polygons:
+    # The duals of point-spheres are point-spheres, without edges.
+    if len(polygon) < 2:
+      continue
+    for half_edge in circular_list.pairs(polygon):
+      if half_edge in half_edges or half_edge[0] == half_edge[1]:
+        raise ValueError(
+            'The dual has parallel edges or loops, which cannot be built from '
+            'polygons.')
+      half_edges.add(half_edge)
+
+  return primitives.polygon_mesh(centroids, dual_polygons)
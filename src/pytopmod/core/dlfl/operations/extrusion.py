@@ -0,0 +1,99 @@
+"""Extrusion operations for DLFL Meshes."""
+from typing import Iterable, Optional, Tuple
+
+from pytopmod.core import extrusion, trace
+from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
+from pytopmod.core.vertex import VertexKey
+
+
+@trace.traced
+def extrude_face(
+    mesh: DLFLMesh,
+    face: FaceKey,
+    distance: float = 1.0,
+    direction: Optional[Point3D] = None,
+    scale: float = 1.0,
+    twist: float = 0.0
+) -> Tuple[list[VertexKey], list[FaceKey]]:
+  """Extrudes a face (see 'extrude_faces').
+
+  Returns the vertices of the extruded face and the new side faces.
+  """
+  return extrude_faces(mesh, [face], distance, direction, scale, twist)[0]
+
+
+def extrude_faces(
+    mesh: DLFLMesh,
+    faces: Iterable[FaceKey],
+    distance: float = 1.0,
+    direction: Optional[Point3D] = None,
+    scale: float = 1.0,
+    twist: float = 0.0
+) -> list[Tuple[list[VertexKey], list[FaceKey]]]:
+  """Extrudes each of the passed faces independently.
+
+  The boundary [v_0, ..., v_n] of each face is replaced by new vertices
+  [w_0, ..., w_n], placed as described in 'extrusion.extruded_positions', and
+  the quads [v_i, v_i+1, w_i+1, w_i] are inserted as side faces. The extruded
+  face keeps its key.
+
+  The new vertices and faces are all created at once and spliced into the maps
+  directly, rather than through the operators.
+
+  Returns the vertices of each extruded face and its new side faces, in the
+  order of the passed faces. Raises a ValueError, leaving the mesh unchanged,
+  if a face is passed twice or is a point-sphere.
+  """
+  faces = list(faces)
+  if len(set(faces)) != len(faces):
+    raise ValueError('Cannot extrude a face twice.')
+  boundaries = [mesh.face_vertices[face] for face in faces]
+  if any(len(boundary) < 2 for boundary in boundaries):
+    raise ValueError('Cannot extrude a point-sphere.')
+
+  # Compute every new position before changing the mesh.
+  positions = [
+      position
+      for boundary in boundaries
+      for position in extrusion.extruded_positions(
+          [mesh.vertex_coordinates[vertex] for vertex in boundary],
+          distance, direction, scale, twist)]
+  new_vertices = mesh.create_vertices(positions)
+  new_faces = mesh.create_faces(len(positions))
+
+  results = []
+  offset = 0
+  for face, boundary in zip(faces, boundaries):
+    count = len(boundary)
+    vertices = new_vertices[offset:offset + count]
+    side_faces = new_faces[offset:offset + count]
+    offset += count
+
+    for vertex in boundary:
+      mesh.corner_positions.pop((vertex, face), None)
+
+    for index in range(count):
+      next_index = (index + 1) % count
+      side_face = side_faces[index]
+      mesh.face_vertices[side_face] = [
+          boundary[index], boundary[next_index],
+          vertices[next_index], vertices[index]]
+      vertex_faces = mesh.vertex_faces[boundary[index]]
+      vertex_faces.discard(face)
+      vertex_faces.add(side_face)
+      vertex_faces.add(side_faces[index - 1])
+      mesh.vertex_faces[vertices[index]] = {
+          face, side_face, side_faces[index - 1]}
+      # The side face takes over the extruded face's half-edge.
+      mesh.link_face(side_face, [(face, index), None, None, None])
+
+    mesh.face_vertices[face] = list(vertices)
+    mesh.link_face(face)
+    if mesh.component_tracker is not None:
+      mesh.component_tracker.merge_all([boundary[0], *vertices])
+
+    results.append((vertices, side_faces))
+
+  return results
@@ -0,0 +1,28 @@
+"""Smoothing operations for DLFL Meshes."""
+from pytopmod.core import smoothing, trace
+from pytopmod.core.dlfl import arrays
+from pytopmod.core.dlfl.mesh import DLFLMesh
+
+
+@trace.traced
+def laplacian_smooth(
+        mesh: DLFLMesh, iterations: int = 1, factor: float = 0.5):
+  """Smooths the mesh's vertex positions in place (see
+  'smoothing.laplacian_smooth')."""
+  offsets, neighbours = arrays.vertex_adjacency(mesh)
+  positions = smoothing.laplacian_smooth(
+      arrays.positions(mesh), offsets, neighbours, iterations, factor)
+  mesh.move_vertices(zip(arrays.vertices(mesh), positions))
+
+
+@trace.traced
+def taubin_smooth(
+        mesh: DLFLMesh, iterations: int = 10,
+        factor: float = 0.5, inflation: float = -0.53):
+  """Smooths the mesh's vertex positions in place without shrinking it (see
+  'smoothing.taubin_smooth')."""
+  offsets, neighbours = arrays.vertex_adjacency(mesh)
+  positions = smoothing.taubin_smooth(
+      arrays.positions(mesh), offsets, neighbours,
+      iterations, factor, inflation)
+  mesh.move_vertices(zip(arrays.vertices(mesh), positions))
@@ -1,14 +1,17 @@
 """Subdivision operations for DLFL Meshes."""
-from typing import Tuple, cast
+import copy
+import math
+from typing import Callable, Iterable, Optional, Tuple, cast
 
-from pytopmod.core import geometry
-from pytopmod.core.dlfl import operators
+from pytopmod.core import geometry, memo, trace
+from pytopmod.core.dlfl import arrays, operators, traversal
 from pytopmod.core.dlfl.mesh import DLFLMesh
 from pytopmod.core.face import FaceKey
 from pytopmod.core.geometry import Point3D
 from pytopmod.core.vertex import VertexKey
 
 
+@trace.traced
 def subdivide_edge(
     mesh: DLFLMesh,
     vertex_1: VertexKey, face_1: FaceKey,
@@ -44,6 +47,7 @@ def subdivide_edge(
   return (new_vertex, insertion_2_faces)
 
 
+@trace.traced
 def triangulate_face(
         mesh: DLFLMesh, face: FaceKey
 ) -> Tuple[VertexKey, set[FaceKey]]:
@@ -83,3 +87,87 @@ def triangulate_face(
   result_faces.update(insert_faces)
 
   return (centroid_vertex, result_faces)
+
+
+def triangulate_faces(
+        mesh: DLFLMesh, faces: Iterable[FaceKey]) -> set[FaceKey]:
+  """Triangulates each of the passed faces from its centroid.
+
+  Faces with less than three vertices are left as is. Since no vertex is
+  inserted on the faces' edges, the neighbouring faces are unchanged and no
+  crack can appear at the border of the triangulated region.
+
+  Returns the set of new faces.
+  """
+  result_faces = set()
+  for face in list(faces):
+    if len(mesh.face_vertices[face]) >= 3:
+      _, new_faces = triangulate_face(mesh, face)
+      result_faces.update(new_faces)
+  return result_faces
+
+
+def triangulated(
+        mesh: DLFLMesh, cache: Optional[memo.MemoCache] = None) -> DLFLMesh:
+  """Returns a copy of the mesh with all its faces triangulated (see
+  'triangulate_faces').
+
+  If a cache is passed, the result is memoized under the mesh's fingerprint.
+  """
+  def triangulate() -> DLFLMesh:
+    result = copy.deepcopy(mesh)
+    triangulate_faces(result, list(result.faces))
+    return result
+
+  if cache is None:
+    return triangulate()
+  return cache.memoize('dlfl.triangulated', arrays.fingerprint(mesh),
+                       triangulate)
+
+
+def adaptive_triangulate(
+    mesh: DLFLMesh,
+    predicate: Callable[[FaceKey], bool],
+    levels: int = 1,
+    faces: Optional[Iterable[FaceKey]] = None
+) -> Tuple[set[FaceKey], set[FaceKey]]:
+  """Triangulates the faces selected by a predicate, over several levels.
+
+  The first level considers the passed faces (all faces by default), and each
+  following level only the faces created by the previous one, so regions that
+  no longer need refinement are left alone. The predicate can be a selection
+  test, or threshold an error metric such as 'normal_deviation'.
+
+  Returns the set of new faces remaining in the mesh, and the set of selected
+  faces left as is since they have less than three vertices (see
+  'triangulate_faces').
+  """
+  candidates = list(mesh.faces if faces is None else faces)
+  result_faces: set[FaceKey] = set()
+  skipped_faces: set[FaceKey] = set()
+  for _ in range(levels):
+    selected = [face for face in candidates if predicate(face)]
+    skipped_faces.update(
+        face for face in selected if len(mesh.face_vertices[face]) < 3)
+    if not selected:
+      break
+    new_faces = triangulate_faces(mesh, selected)
+    result_faces.difference_update(selected)
+    result_faces.update(new_faces)
+    candidates = list(new_faces)
+  return (result_faces, skipped_faces)
+
+
+def normal_deviation(mesh: DLFLMesh, face: FaceKey) -> float:
+  """Returns the largest angle, in radians, between the normal of a face and
+  the normals of its neighbours: a discrete measure of curvature."""
+  def normal(face_: FaceKey) -> Point3D:
+    return geometry.normal(
+        mesh.vertex_coordinates[vertex] for vertex in mesh.face_vertices[face_])
+
+  face_normal = normal(face)
+  deviation = 0.0
+  for neighbour in traversal.face_neighbours(mesh, face):
+    cosine = sum(a * b for a, b in zip(face_normal, normal(neighbour)))
+    deviation = max(deviation, math.acos(max(-1.0, min(1.0, cosine))))
+  return deviation
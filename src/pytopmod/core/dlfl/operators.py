@@ -1,8 +1,10 @@
 """Manifold-preserving operators on DLFL Meshes."""
+import functools
 from typing import Generator, Tuple, cast
 
-from pytopmod.core import circular_list
-from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core import circular_list, trace
+from pytopmod.core.dlfl import traversal
+from pytopmod.core.dlfl.mesh import DLFLMesh, HalfEdgePosition
 from pytopmod.core.face import FaceKey
 from pytopmod.core.geometry import Point3D
 from pytopmod.core.half_edge import HalfEdge
@@ -20,46 +22,25 @@ def face_trace(
 
 def vertex_trace(
         mesh: DLFLMesh, vertex: VertexKey) -> (Generator[HalfEdge, None, None]):
-  """Returns a generator over the half-edges of a vertex rotation."""
-  # Pick a first face in the set of the vertex's faces rotation.
-  first_face = next(iter(mesh.vertex_faces[vertex]))
-  # Output the first half-edge formed by the passed vertex and its successor
-  # in the picked face's boundary: [u, v].
-  first_half_edge = HalfEdge((vertex, circular_list.next_item(
-      mesh.face_vertices[first_face], vertex)), first_face)
-  yield first_half_edge
-
-  # Find the face in the vertex rotation that contains the opposite half-edge.
-  face = next(
-      key for key in mesh.vertex_faces[first_half_edge.vertices[1]]
-      if (first_half_edge.vertices[1], first_half_edge.vertices[0])
-      in circular_list.pairs(mesh.face_vertices[key]))
-
-  half_edge = HalfEdge(
-      (first_half_edge.vertices[1], first_half_edge.vertices[0]), face)
-
-  while half_edge != first_half_edge:
-    yield half_edge
-    if half_edge.vertices[1] == vertex:
-      # If the current half-edge's tail vertex is the passed vertex, form the
-      # next half-edge from the passed vertex and its successor in the current
-      # face.
-      half_edge = HalfEdge(
-          (half_edge.vertices[1],
-           circular_list.next_item(
-              mesh.face_vertices[face], half_edge.vertices[1])),
-          face)
-    else:
-      # If the current half-edge's head is the passed vertex, find the face in
-      # the passed vertex rotation that contains the opposite half-edge.
-      face = next(
-          key for key in mesh.vertex_faces[half_edge.vertices[1]]
-          if (half_edge.vertices[1], half_edge.vertices[0])
-          in circular_list.pairs(mesh.face_vertices[key]))
-      half_edge = HalfEdge(
-          (half_edge.vertices[1], half_edge.vertices[0]), face)
-
+  """Returns a generator over the half-edges of a vertex rotation.
 
+  The half-edges alternate between one leaving the vertex in a face and its
+  opposite, in the next face of the rotation (see 'DLFLMesh.rotation_corners').
+  """
+  corners = list(mesh.rotation_corners(vertex))
+  for index, (face, position) in enumerate(corners):
+    # Output the half-edge formed by the passed vertex and its successor in the
+    # face's boundary: [u, v].
+    face_vertices = mesh.face_vertices[face]
+    next_vertex = face_vertices[(position + 1) % len(face_vertices)]
+    yield HalfEdge((vertex, next_vertex), face)
+    # Then its opposite half-edge [v, u], unless the face is a point-sphere.
+    if next_vertex != vertex:
+      next_face, _ = corners[(index + 1) % len(corners)]
+      yield HalfEdge((next_vertex, vertex), next_face)
+
+
+@trace.traced
 def create_point_sphere(
         mesh: DLFLMesh, position: Point3D) -> Tuple[VertexKey, FaceKey]:
   """Creates a point-sphere in the passed mesh.
@@ -72,9 +53,11 @@ def create_point_sphere(
   face = mesh.create_face()
   mesh.face_vertices[face].append(vertex)
   mesh.vertex_faces[vertex].add(face)
+  mesh.link_face(face)
   return (vertex, face)
 
 
+@trace.traced
 def insert_edge(
     mesh: DLFLMesh,
     vertex_1: VertexKey, face_1: FaceKey,
@@ -86,6 +69,10 @@ def insert_edge(
    - A tuple of (new_face_1, new_face_2) for a cofacial insertion.
    - A tuple of (new_face, new_face) for a non-cofacial insertion.
   """
+  # A parallel edge can only be paired with the edge indexes: build them before
+  # inserting one.
+  if not mesh.indexed and mesh.find_edge(vertex_1, vertex_2) is not None:
+    mesh.build_indexes()
   return (_insert_edge_cofacial if face_1 == face_2
           else _insert_edge_non_cofacial
           )(mesh, vertex_1,  face_1, vertex_2, face_2)
@@ -106,14 +93,33 @@ def _insert_edge_cofacial(
 
   # Compute the boundaries of the newly created faces as the boundary of the old
   # face circulated to end with vertex_2 and split at vertex_1.
+  old_face_vertices = mesh.face_vertices[old_face]
   new_face_1_vertices, new_face_2_vertices = (
       circular_list.split_at_item(
-          circular_list.circulated_to_item(
-              mesh.face_vertices[old_face], vertex_2), vertex_1))
+          circular_list.circulated_to_item(old_face_vertices, vertex_2),
+          vertex_1))
 
-  # Append vertex_2 to new_face_1's boundary (resp. vertex_1 to new_face_2).
+  # Append vertex_2 to new_face_1's boundary (resp. vertex_1 to new_face_2):
+  # the inserted edge is their second to last half-edge.
   mesh.face_vertices[new_face_1] = new_face_1_vertices + [vertex_2]
   mesh.face_vertices[new_face_2] = new_face_2_vertices + [vertex_1]
+  if mesh.indexed:
+    # The half-edges are taken over from the old face, at the positions of
+    # their first vertex in it.
+    positions = circular_list.circulated_to(
+        list(range(len(old_face_vertices))),
+        old_face_vertices.index(vertex_2))
+    positions_1, positions_2 = circular_list.split_at(
+        positions, len(new_face_1_vertices))
+    mesh.link_face(new_face_1, [
+        *_taken_over(old_face, positions_1[:-1]), None,
+        *_taken_over(old_face, positions[-1:])])
+    mesh.link_face(new_face_2, [
+        *_taken_over(old_face, positions_2[:-1]), None,
+        *_taken_over(old_face, positions_1[-1:])])
+  else:
+    mesh.link_face(new_face_1)
+    mesh.link_face(new_face_2)
 
   # Update the vertices face rotations:
   # Replace old_face with new_face_1 for each vertex in new_face_1.
@@ -152,14 +158,29 @@ def _insert_edge_non_cofacial(
   #  - old_face_2's boundary circulated to end with vertex_2's predecessor.
   #  - vertex_2 if old face 2 was not a point-sphere.
   #  - vertex_2 if old_face_1 was not a point-sphere.
+  # The positions of the vertices in the old faces are kept alongside.
+  positions_1 = circular_list.circulated_to(
+      list(range(len(old_face_1_vertices))),
+      old_face_1_vertices.index(vertex_1))
+  positions_2 = circular_list.circulated_to(
+      list(range(len(old_face_2_vertices))),
+      old_face_2_vertices.index(vertex_2) - 1)
   new_face_vertices = (
-      circular_list.circulated_to_item(old_face_1_vertices, vertex_1) +
-      circular_list.circulated_to_item(
-          old_face_2_vertices,
-          circular_list.previous_item(old_face_2_vertices, vertex_2)) +
+      [old_face_1_vertices[position] for position in positions_1] +
+      [old_face_2_vertices[position] for position in positions_2] +
       ([vertex_2] if len(old_face_2_vertices) > 1 else []) +
       ([vertex_1] if len(old_face_1_vertices) > 1 else []))
   mesh.face_vertices[new_face] = new_face_vertices
+  # The inserted edge is traversed from vertex_1 to vertex_2, then from the
+  # last vertex_2 back to vertex_1.
+  mesh.link_face(new_face, [
+      *_taken_over(old_face_1, positions_1[:-1]), None,
+      *_taken_over(old_face_2, positions_2[:-1]),
+      *(_taken_over(old_face_2, positions_2[-1:])
+        if len(old_face_2_vertices) > 1 else []), None,
+      *(_taken_over(old_face_1, positions_1[-1:])
+        if len(old_face_1_vertices) > 1 else [])
+  ] if mesh.indexed else None)
 
   # Update the vertices face rotations:
   for vertex in new_face_vertices:
@@ -172,9 +193,14 @@ def _insert_edge_non_cofacial(
   mesh.delete_face(old_face_1)
   mesh.delete_face(old_face_2)
 
+  # The two corners may belong to different components, which are now joined.
+  if mesh.component_tracker is not None:
+    mesh.component_tracker.merge(vertex_1, vertex_2)
+
   return (new_face, new_face)
 
 
+@trace.traced
 def delete_edge(
     mesh: DLFLMesh,
     vertex_1: VertexKey, face_1: FaceKey,
@@ -205,16 +231,31 @@ def _delete_edge_cofacial(
   new_face_2 = mesh.create_face()
 
   # Compute the boundaries of the new faces as the boundary of the old face
-  # circulated to (vertex_1, vertex_2) and split at (vertex_2, vertex_1).
-  new_face_1_vertices, new_face_2_vertices = (
-      circular_list.split_at_pair(
-          circular_list.circulated_to_pair(
-              mesh.face_vertices[old_face], (vertex_1, vertex_2)),
-          (vertex_2, vertex_1)))
+  # circulated to (vertex_1, vertex_2) and split at (vertex_2, vertex_1), along
+  # with the positions of their vertices in the old face.
+  old_face_vertices = mesh.face_vertices[old_face]
+  position_1, position_2 = mesh.edge_positions(
+      vertex_1, old_face, vertex_2, old_face)
+  positions = circular_list.circulated_to(
+      list(range(len(old_face_vertices))), position_1 + 1)
+  vertices = [old_face_vertices[position] for position in positions]
+  split = positions.index(position_2) + 2
+  new_face_1_vertices, new_face_2_vertices = circular_list.split_at(
+      vertices, split)
+  positions_1, positions_2 = circular_list.split_at(positions, split)
 
   # Remove the last vertices from the created faces (i.e vertex_1 and vertex_2).
-  mesh.face_vertices[new_face_1] = new_face_1_vertices[:-1]
-  mesh.face_vertices[new_face_2] = new_face_2_vertices[:-1]
+  # Deleting the only edge of a two-vertex face leaves two point-spheres, which
+  # the split above cannot express. The last half-edge of each face was
+  # traversed from the old corner of its last vertex before the deleted edge.
+  mesh.face_vertices[new_face_1] = new_face_1_vertices[:-1] or [vertex_2]
+  mesh.face_vertices[new_face_2] = new_face_2_vertices[:-1] or [vertex_1]
+  mesh.link_face(new_face_1, [
+      *_taken_over(old_face, positions_1[:-2]),
+      *_taken_over(old_face, positions[-1:])])
+  mesh.link_face(new_face_2, [
+      *_taken_over(old_face, positions_2[:-2]),
+      *_taken_over(old_face, positions_1[-1:])])
 
   # Update the vertices face rotations:
   for vertex in mesh.face_vertices[new_face_1]:
@@ -230,6 +271,13 @@ def _delete_edge_cofacial(
   # Delete the old face.
   mesh.delete_face(old_face)
 
+  # The deleted edge had the same face on both sides, so it may have been the
+  # only path between its vertices: update the components.
+  if mesh.component_tracker is not None:
+    mesh.component_tracker.split(
+        vertex_1, vertex_2,
+        functools.partial(traversal.vertex_neighbours, mesh))
+
   return (new_face_1, new_face_2)
 
 
@@ -249,13 +297,24 @@ def _delete_edge_non_cofacial(
   old_face_2_vertices = mesh.face_vertices[old_face_2]
 
   # Compute the new face's boundary as the concatenation of:
-  #  - old_face_1's boundary circulated to vertex_1, without vertex_1.
-  #  - old_face_2's boundary circulated to vertex_2, without vertex_2.
+  #  - old_face_1's boundary circulated to (vertex_1, vertex_2), without
+  #    vertex_1.
+  #  - old_face_2's boundary circulated to (vertex_2, vertex_1), without
+  #    vertex_2.
+  # All its half-edges are kept from the old faces.
+  position_1, position_2 = mesh.edge_positions(
+      vertex_1, old_face_1, vertex_2, old_face_2)
+  positions_1 = circular_list.circulated_to(
+      list(range(len(old_face_1_vertices))), position_1)[:-1]
+  positions_2 = circular_list.circulated_to(
+      list(range(len(old_face_2_vertices))), position_2)[:-1]
   new_face_vertices = (
-      circular_list.circulated_to_item(old_face_1_vertices, vertex_1)[:-1] +
-      circular_list.circulated_to_item(old_face_2_vertices, vertex_2)[:-1])
+      [old_face_1_vertices[position] for position in positions_1] +
+      [old_face_2_vertices[position] for position in positions_2])
 
   mesh.face_vertices[new_face] = new_face_vertices
+  mesh.link_face(new_face, [*_taken_over(old_face_1, positions_1),
+                            *_taken_over(old_face_2, positions_2)])
 
   # Update the vertices face rotations:
   for vertex in new_face_vertices:
@@ -269,3 +328,10 @@ def _delete_edge_non_cofacial(
   mesh.delete_face(old_face_2)
 
   return (new_face, new_face)
+
+
+def _taken_over(
+        face: FaceKey, positions: list[int]) -> list[HalfEdgePosition]:
+  """Returns the occurrences of the half-edges starting at the passed positions
+  in a face boundary, as origins for 'DLFLMesh.link_face'."""
+  return [(face, position) for position in positions]
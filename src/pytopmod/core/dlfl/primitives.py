@@ -1,19 +1,24 @@
 """Convenience functions to create primitive DLFL Meshes."""
+from typing import Sequence, Tuple
+
+from pytopmod.core import circular_list, parametric
 from pytopmod.core.dlfl import operators
 from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
 
 
 def triangle() -> DLFLMesh:
   """Creates and returns a triangle with two faces."""
   mesh = DLFLMesh()
 
-  operators.create_point_sphere(mesh, (1.0, 1.0, 1.0))
-  operators.create_point_sphere(mesh, (1.0, -1.0, -1.0))
-  operators.create_point_sphere(mesh, (-1.0, 1.0, -1.0))
+  vertex_1, face_1 = operators.create_point_sphere(mesh, (1.0, 1.0, 1.0))
+  vertex_2, face_2 = operators.create_point_sphere(mesh, (1.0, -1.0, -1.0))
+  vertex_3, face_3 = operators.create_point_sphere(mesh, (-1.0, 1.0, -1.0))
 
-  operators.insert_edge(mesh, 'v1', 'f1', 'v2', 'f2')
-  operators.insert_edge(mesh, 'v2', 'f4', 'v3', 'f3')
-  operators.insert_edge(mesh, 'v3', 'f5', 'v1', 'f5')
+  face, _ = operators.insert_edge(mesh, vertex_1, face_1, vertex_2, face_2)
+  face, _ = operators.insert_edge(mesh, vertex_2, face, vertex_3, face_3)
+  operators.insert_edge(mesh, vertex_3, face, vertex_1, face)
 
   return mesh
 
@@ -22,16 +27,93 @@ def tetrahedron():
   """Creates and returns a tetrahedron."""
   mesh = DLFLMesh()
 
-  operators.create_point_sphere(mesh, (1.0, 1.0, 1.0))
-  operators.create_point_sphere(mesh, (1.0, -1.0, -1.0))
-  operators.create_point_sphere(mesh, (-1.0, 1.0, -1.0))
-  operators.create_point_sphere(mesh, (-1.0, -1.0, 1.0))
+  vertex_1, face_1 = operators.create_point_sphere(mesh, (1.0, 1.0, 1.0))
+  vertex_2, face_2 = operators.create_point_sphere(mesh, (1.0, -1.0, -1.0))
+  vertex_3, face_3 = operators.create_point_sphere(mesh, (-1.0, 1.0, -1.0))
+  vertex_4, face_4 = operators.create_point_sphere(mesh, (-1.0, -1.0, 1.0))
+
+  # Form a triangle, then connect the fourth vertex to each of its vertices.
+  face, _ = operators.insert_edge(mesh, vertex_1, face_1, vertex_2, face_2)
+  face, _ = operators.insert_edge(mesh, vertex_2, face, vertex_3, face_3)
+  face, _ = operators.insert_edge(mesh, vertex_3, face, vertex_1, face)
+  face, _ = operators.insert_edge(mesh, vertex_1, face, vertex_4, face_4)
+  for vertex in (vertex_2, vertex_3):
+    face = mesh.shared_faces(vertex_4, vertex)[0]
+    operators.insert_edge(mesh, vertex_4, face, vertex, face)
+
+  return mesh
+
+
+def polygon_mesh(
+        positions: Sequence[Point3D], polygons: Sequence[list[int]]
+) -> DLFLMesh:
+  """Creates and returns a mesh directly from vertex positions and polygons.
+
+  Polygons are lists of indices into the positions. They must form a closed
+  oriented surface, i.e each half-edge (u, v) must appear once, along with its
+  opposite half-edge (v, u). Half-edges are paired by their vertices, so
+  several edges joining the same two vertices (parallel edges) cannot be
+  created this way: a half-edge appearing twice raises a ValueError.
+
+  The face boundaries and rotations are filled in a single pass over the
+  polygons, without going through the operators. The indexes are built on
+  first query (see 'DLFLMesh.build_indexes').
+  """
+  mesh = DLFLMesh()
+  vertices = mesh.create_vertices(positions)
+  faces = mesh.create_faces(len(polygons))
+
+  # Half-edges, as pairs of vertex indices.
+  half_edges: set[Tuple[int, int]] = set()
+
+  for face, polygon in zip(faces, polygons):
+    face_vertices = [vertices[index] for index in polygon]
+    mesh.face_vertices[face] = face_vertices
+    for vertex in face_vertices:
+      mesh.vertex_faces[vertex].add(face)
+
+    # A point-sphere has no edges.
+    if len(polygon) < 2:
+      continue
+    for half_edge in circular_list.pairs(polygon):
+      if half_edge in half_edges:
+        raise ValueError(f'Half-edge {half_edge} appears twice.')
+      half_edges.add(half_edge)
 
-  operators.insert_edge(mesh, 'v1', 'f1', 'v2', 'f2')
-  operators.insert_edge(mesh, 'v2', 'f5', 'v3', 'f3')
-  operators.insert_edge(mesh, 'v3', 'f6', 'v1', 'f6')
-  operators.insert_edge(mesh, 'v1', 'f7', 'v4', 'f4')
-  operators.insert_edge(mesh, 'v4', 'f9', 'v2', 'f9')
-  operators.insert_edge(mesh, 'v4', 'f10', 'v3', 'f10')
+  for index_1, index_2 in half_edges:
+    if (index_2, index_1) not in half_edges:
+      raise ValueError(f'Half-edge {(index_1, index_2)} has no opposite.')
 
   return mesh
+
+
+def grid(rows: int, columns: int) -> DLFLMesh:
+  """Creates and returns a grid of rows x columns quads, closed by a back
+  face."""
+  return polygon_mesh(*parametric.grid(rows, columns))
+
+
+def cube(resolution: int = 1) -> DLFLMesh:
+  """Creates and returns a cube with resolution x resolution quads per side."""
+  return polygon_mesh(*parametric.cube(resolution))
+
+
+def cylinder(segments: int, rings: int = 1) -> DLFLMesh:
+  """Creates and returns a closed cylinder of segments x rings quads."""
+  return polygon_mesh(*parametric.cylinder(segments, rings))
+
+
+def torus(segments: int, sides: int) -> DLFLMesh:
+  """Creates and returns a torus of segments x sides quads."""
+  return polygon_mesh(*parametric.torus(segments, sides))
+
+
+def uv_sphere(segments: int, rings: int) -> DLFLMesh:
+  """Creates and returns a UV sphere with 'segments' meridians and 'rings'
+  bands."""
+  return polygon_mesh(*parametric.uv_sphere(segments, rings))
+
+
+def ico_sphere(subdivisions: int = 0) -> DLFLMesh:
+  """Creates and returns an icosphere subdivided 'subdivisions' times."""
+  return polygon_mesh(*parametric.ico_sphere(subdivisions))
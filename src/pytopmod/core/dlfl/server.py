@@ -0,0 +1,20 @@
+"""Serving of DLFL Meshes by a MeshServer (see 'core.server')."""
+from pytopmod.core import server
+from pytopmod.core.dlfl import arrays, operators
+from pytopmod.core.dlfl.operations import extrusion, smoothing, subdivision
+
+BACKEND = server.Backend(
+    kind='dlfl',
+    operations={
+        'create_point_sphere': operators.create_point_sphere,
+        'insert_edge': operators.insert_edge,
+        'delete_edge': operators.delete_edge,
+        'subdivide_edge': subdivision.subdivide_edge,
+        'triangulate_face': subdivision.triangulate_face,
+        'triangulate_faces': subdivision.triangulate_faces,
+        'extrude_face': extrusion.extrude_face,
+        'extrude_faces': extrusion.extrude_faces,
+        'laplacian_smooth': smoothing.laplacian_smooth,
+        'taubin_smooth': smoothing.taubin_smooth,
+    },
+    arrays=arrays)
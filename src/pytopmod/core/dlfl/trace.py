@@ -0,0 +1,92 @@
+"""Recording and replay of operation traces on DLFL Meshes (see
+'core.trace')."""
+import random
+from typing import Optional
+
+from pytopmod.core import trace
+from pytopmod.core.dlfl import operators
+from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.dlfl.operations import extrusion, smoothing, subdivision
+from pytopmod.core.face import FaceKey
+
+KIND = 'dlfl'
+
+# The traced operations. Their position is their opcode: only append to it.
+OPERATIONS = (
+    trace.OperationSpec('create_point_sphere', operators, 'p'),
+    trace.OperationSpec('insert_edge', operators, 'vfvf'),
+    trace.OperationSpec('delete_edge', operators, 'vfvf'),
+    trace.OperationSpec('subdivide_edge', subdivision, 'vfvf'),
+    trace.OperationSpec('triangulate_face', subdivision, 'f'),
+    trace.OperationSpec('extrude_face', extrusion, 'fdodd'),
+    trace.OperationSpec('laplacian_smooth', smoothing, 'id'),
+    trace.OperationSpec('taubin_smooth', smoothing, 'idd'),
+)
+
+
+def recorder(mesh: DLFLMesh) -> trace.Recorder:
+  """Returns a recorder of the operations applied to a mesh, until it is
+  closed (see 'trace.Recorder')."""
+  return trace.Recorder(mesh, KIND, OPERATIONS)
+
+
+def replay(
+        mesh: DLFLMesh, data: bytes,
+        timings: bool = False) -> Optional[list[float]]:
+  """Applies the operations of a binary trace to a mesh.
+
+  If 'timings' is set, returns the duration of each operation in seconds.
+  """
+  return trace.replay(mesh, data, KIND, OPERATIONS, timings)
+
+
+def random_trace(
+        mesh: DLFLMesh, count: int, seed: Optional[int] = None) -> bytes:
+  """Applies random operations to a mesh, and returns their binary trace.
+
+  The trace can be replayed on a copy of the mesh in its original state, e.g
+  the same primitive. Operations are only applied to faces without repeated
+  vertices, and edges are not inserted between adjacent vertices.
+  """
+  generator = random.Random(seed)
+
+  def simple(face: FaceKey) -> bool:
+    vertices = mesh.face_vertices[face]
+    return len(set(vertices)) == len(vertices)
+
+  def random_edge():
+    edges = [mesh.corners_of_edge(*edge) for edge in mesh.edges()]
+    edges = [corners for corners in edges
+             if simple(corners[0][1]) and simple(corners[1][1])]
+    if not edges:
+      return None
+    corners = generator.choice(edges)
+    # Deleting an edge bordering a single face would split its component.
+    if corners[0][1] == corners[1][1]:
+      return None
+    return (*corners[0], *corners[1])
+
+  with recorder(mesh) as active:
+    while len(active.operations) < count:
+      operation = generator.randrange(5)
+      faces = [face for face in mesh.faces if simple(face)]
+      if operation == 0:
+        active.apply(
+            'create_point_sphere',
+            tuple(generator.uniform(-1.0, 1.0) for _ in range(3)))
+      elif operation == 1 and faces:
+        face_1, face_2 = generator.choice(faces), generator.choice(faces)
+        vertex_1 = generator.choice(mesh.face_vertices[face_1])
+        vertex_2 = generator.choice(mesh.face_vertices[face_2])
+        if vertex_1 != vertex_2 and mesh.find_edge(vertex_1, vertex_2) is None:
+          active.apply('insert_edge', vertex_1, face_1, vertex_2, face_2)
+      elif operation in (2, 3):
+        edge = random_edge()
+        if edge is not None:
+          active.apply('delete_edge' if operation == 2 else 'subdivide_edge',
+                       *edge)
+      elif operation == 4:
+        faces = [face for face in faces if len(mesh.face_vertices[face]) >= 3]
+        if faces:
+          active.apply('triangulate_face', generator.choice(faces))
+    return active.trace()
@@ -0,0 +1,92 @@
+"""Lazy traversals over the face and vertex adjacency of DLFL Meshes."""
+import functools
+from typing import Generator
+
+from pytopmod.core import circular_list, traversal
+from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.face import FaceKey
+from pytopmod.core.vertex import VertexKey
+
+
+def opposite_face(
+        mesh: DLFLMesh, vertex_1: VertexKey, vertex_2: VertexKey) -> FaceKey:
+  """Returns the face containing the half-edge (vertex_2, vertex_1)."""
+  _, (_, face) = mesh.corners_of_edge(vertex_1, vertex_2)
+  return face
+
+
+def face_neighbours(
+        mesh: DLFLMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the other faces sharing an edge with a face."""
+  visited = {face}
+  face_vertices = mesh.face_vertices[face]
+  # A point-sphere has no edges.
+  if len(face_vertices) < 2:
+    return
+  for vertex_1, vertex_2 in circular_list.pairs(face_vertices):
+    neighbour = opposite_face(mesh, vertex_1, vertex_2)
+    if neighbour not in visited:
+      visited.add(neighbour)
+      yield neighbour
+
+
+def vertex_neighbours(
+        mesh: DLFLMesh, vertex: VertexKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices sharing an edge with a vertex."""
+  visited = {vertex}
+  for face in mesh.vertex_faces[vertex]:
+    face_vertices = mesh.face_vertices[face]
+    # The vertex may appear several times in a face boundary: its neighbours
+    # are the predecessor and successor of each of its occurrences.
+    for index, face_vertex in enumerate(face_vertices):
+      if face_vertex != vertex:
+        continue
+      for neighbour in (face_vertices[index - 1],
+                        face_vertices[(index + 1) % len(face_vertices)]):
+        if neighbour not in visited:
+          visited.add(neighbour)
+          yield neighbour
+
+
+def breadth_first_faces(
+        mesh: DLFLMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the faces reachable from a face, breadth-first."""
+  return traversal.breadth_first(face, functools.partial(face_neighbours, mesh))
+
+
+def depth_first_faces(
+        mesh: DLFLMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the faces reachable from a face, depth-first."""
+  return traversal.depth_first(face, functools.partial(face_neighbours, mesh))
+
+
+def breadth_first_vertices(
+        mesh: DLFLMesh, vertex: VertexKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices reachable from a vertex,
+  breadth-first."""
+  return traversal.breadth_first(
+      vertex, functools.partial(vertex_neighbours, mesh))
+
+
+def depth_first_vertices(
+        mesh: DLFLMesh, vertex: VertexKey) -> Generator[VertexKey, None, None]:
+  """Returns a generator over the vertices reachable from a vertex,
+  depth-first."""
+  return traversal.depth_first(
+      vertex, functools.partial(vertex_neighbours, mesh))
+
+
+def component_faces(
+        mesh: DLFLMesh, face: FaceKey) -> Generator[FaceKey, None, None]:
+  """Returns a generator over the faces in the same component as a face.
+
+  Unlike 'breadth_first_faces', this relies on the mesh's component tracker
+  and the vertices' face rotations instead of walking face boundaries.
+  """
+  visited = set()
+  component = mesh.components.component(mesh.face_vertices[face][0])
+  for vertex in mesh.components.vertices(component):
+    for vertex_face in mesh.vertex_faces[vertex]:
+      if vertex_face not in visited:
+        visited.add(vertex_face)
+        yield vertex_face
@@ -0,0 +1,48 @@
+"""Geometry of face extrusions, shared by the DLFL and DCEL operations.
+
+The topological part of an extrusion is implemented by each representation in
+'operations/extrusion.py': this module only computes where the extruded
+vertices go.
+"""
+import math
+from typing import Optional, Sequence
+
+from pytopmod.core import geometry
+from pytopmod.core.geometry import Point3D
+
+
+def extruded_positions(
+    points: Sequence[Point3D],
+    distance: float = 1.0,
+    direction: Optional[Point3D] = None,
+    scale: float = 1.0,
+    twist: float = 0.0
+) -> list[Point3D]:
+  """Returns the positions of the vertices of an extruded face.
+
+  The face's points are rotated by 'twist' radians around the face normal and
+  scaled by 'scale' around the face centroid, then moved by 'distance' along
+  'direction', or along the face normal if no direction is given.
+  """
+  normal = geometry.normal(points)
+  center = geometry.centroid(points)
+  if direction is None:
+    direction = normal
+  offset = tuple(distance * coordinate for coordinate in direction)
+
+  cos_twist, sin_twist = math.cos(twist), math.sin(twist)
+  positions: list[Point3D] = []
+  for point in points:
+    v = tuple(p - c for p, c in zip(point, center))
+    if twist:
+      # Rodrigues' rotation of v around the normal.
+      cross = (normal[1] * v[2] - normal[2] * v[1],
+               normal[2] * v[0] - normal[0] * v[2],
+               normal[0] * v[1] - normal[1] * v[0])
+      dot = normal[0] * v[0] + normal[1] * v[1] + normal[2] * v[2]
+      v = tuple(a * cos_twist + b * sin_twist + n * dot * (1.0 - cos_twist)
+                for a, b, n in zip(v, cross, normal))
+    positions.append(tuple(
+        c + scale * a + o
+        for c, a, o in zip(center, v, offset)))  # type: ignore
+  return positions
@@ -1,4 +1,4 @@
-from typing import Iterable, Tuple, TypeAlias, cast
+from typing import Iterable, Sequence, Tuple, TypeAlias, cast
 
 Point: TypeAlias = Tuple[float, ...]
 
@@ -20,3 +20,118 @@ def centroid(points: Iterable[Point]) -> Point:
                        for pair in zip(sum_coords, point))
     num += 1.0
   return tuple(coord / num for coord in sum_coords)
+
+
+def normal(points: Iterable[Point3D]) -> Point3D:
+  """Returns the unit normal of a polygon, computed with Newell's method.
+
+  The zero vector is returned for degenerate polygons.
+  """
+  points = list(points)
+  x = y = z = 0.0
+  for index, point_1 in enumerate(points):
+    point_2 = points[(index + 1) % len(points)]
+    x += (point_1[1] - point_2[1]) * (point_1[2] + point_2[2])
+    y += (point_1[2] - point_2[2]) * (point_1[0] + point_2[0])
+    z += (point_1[0] - point_2[0]) * (point_1[1] + point_2[1])
+  length = (x * x + y * y + z * z) ** 0.5
+  if length == 0.0:
+    return (0.0, 0.0, 0.0)
+  return (x / length, y / length, z / length)
+
+
+# Bulk kernels, computing a quantity for all faces, vertices or edges of a mesh
+# at once. Faces are given in CSR form (see 'arrays.csr_polygons'): the vertex
+# indices of face i are corners[offsets[i]:offsets[i + 1]].
+
+
+def face_normals(
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], corners: Sequence[int]
+) -> list[Point3D]:
+  """Returns the unit normal of each face (zero for degenerate faces)."""
+  return [_normalized(x, y, z)
+          for x, y, z in zip(*_newell_vectors(positions, offsets, corners))]
+
+
+def face_areas(
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], corners: Sequence[int]
+) -> list[float]:
+  """Returns the area of each face, computed with Newell's method."""
+  return [(x * x + y * y + z * z) ** 0.5 / 2.0
+          for x, y, z in zip(*_newell_vectors(positions, offsets, corners))]
+
+
+def vertex_normals(
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], corners: Sequence[int]
+) -> list[Point3D]:
+  """Returns the unit normal of each vertex, i.e the area-weighted average of
+  the normals of its faces."""
+  sums_x = [0.0] * len(positions)
+  sums_y = [0.0] * len(positions)
+  sums_z = [0.0] * len(positions)
+  for face, (x, y, z) in enumerate(
+          zip(*_newell_vectors(positions, offsets, corners))):
+    for vertex in corners[offsets[face]:offsets[face + 1]]:
+      sums_x[vertex] += x
+      sums_y[vertex] += y
+      sums_z[vertex] += z
+  return [_normalized(x, y, z) for x, y, z in zip(sums_x, sums_y, sums_z)]
+
+
+def bounds(positions: Iterable[Point3D]) -> Tuple[Point3D, Point3D]:
+  """Returns the minimum and maximum corners of the axis-aligned bounding box
+  of a non-empty set of points."""
+  xs, ys, zs = zip(*positions)
+  return ((min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs)))
+
+
+def edge_lengths(
+    positions: Sequence[Point3D], edges: Iterable[Tuple[int, int]]
+) -> list[float]:
+  """Returns the length of each edge, given as a pair of vertex indices."""
+  lengths = []
+  for index_1, index_2 in edges:
+    point_1, point_2 = positions[index_1], positions[index_2]
+    x = point_1[0] - point_2[0]
+    y = point_1[1] - point_2[1]
+    z = point_1[2] - point_2[2]
+    lengths.append((x * x + y * y + z * z) ** 0.5)
+  return lengths
+
+
+def _newell_vectors(
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], corners: Sequence[int]
+) -> Tuple[list[float], list[float], list[float]]:
+  """Returns the (non-normalized) Newell normal of each face, whose length is
+  twice the face area, as lists of x, y and z coordinates."""
+  xs = [position[0] for position in positions]
+  ys = [position[1] for position in positions]
+  zs = [position[2] for position in positions]
+  normals_x, normals_y, normals_z = [], [], []
+  for face in range(len(offsets) - 1):
+    start, end = offsets[face], offsets[face + 1]
+    x = y = z = 0.0
+    if end > start:
+      last = corners[end - 1]
+      x_1, y_1, z_1 = xs[last], ys[last], zs[last]
+      for corner in corners[start:end]:
+        x_2, y_2, z_2 = xs[corner], ys[corner], zs[corner]
+        x += (y_1 - y_2) * (z_1 + z_2)
+        y += (z_1 - z_2) * (x_1 + x_2)
+        z += (x_1 - x_2) * (y_1 + y_2)
+        x_1, y_1, z_1 = x_2, y_2, z_2
+    normals_x.append(x)
+    normals_y.append(y)
+    normals_z.append(z)
+  return (normals_x, normals_y, normals_z)
+
+
+def _normalized(x: float, y: float, z: float) -> Point3D:
+  length = (x * x + y * y + z * z) ** 0.5
+  if length == 0.0:
+    return (0.0, 0.0, 0.0)
+  return (x / length, y / length, z / length)
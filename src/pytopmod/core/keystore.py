@@ -41,11 +41,19 @@ class KeyStore(Generic[K]):
   def new(self) -> K:
     key = cast(
         K, f'{self._key_prefix}{len(self._counter) + self._key_index_offset}')
-    self._counter.update([key])
+    self._counter[key] = 1
     return key
 
+  def new_keys(self, count: int) -> list[K]:
+    """Creates 'count' keys at once and returns them in creation order."""
+    start = len(self._counter) + self._key_index_offset
+    keys = [cast(K, f'{self._key_prefix}{index}')
+            for index in range(start, start + count)]
+    self._counter.update(keys)
+    return keys
+
   def delete(self, key: K):
-    self._counter.subtract([key])
+    self._counter[key] -= 1
 
   def contains(self, key: K) -> bool:
     return self.__contains__(key)
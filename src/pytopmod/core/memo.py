@@ -0,0 +1,187 @@
+"""Content fingerprints of meshes and an on-disk cache of operation results.
+
+A fingerprint covers the keys of a mesh (in order, including its edge keys for
+representations storing edges), its connectivity and its vertex coordinates.
+The connectivity part only changes when the mesh's version does, so it is
+cached on the mesh (see 'dlfl.arrays.fingerprint' and
+'dcel.arrays.fingerprint'), and only the coordinates are hashed again on each
+call.
+
+The MemoCache stores the results of deterministic operations on disk, keyed by
+the fingerprint of their input and their parameters, and evicts the least
+recently used entries past a maximum number of entries. Whole-mesh operations
+accept a cache to memoize their result, e.g. 'dlfl.obj_io.mesh_to_obj',
+'dcel.obj_io.mesh_to_obj' and 'dlfl.operations.subdivision.triangulated'.
+"""
+import array
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Callable, Iterable, Sequence, TypeVar
+
+from pytopmod.core.geometry import Point3D
+
+T = TypeVar('T')
+
+
+def connectivity_digest(
+    kind: str,
+    vertices: Sequence[str], faces: Sequence[str],
+    polygons: Sequence[Sequence[int]],
+    edges: Sequence[str] = (),
+    edge_incidences: Iterable[int] = ()
+) -> bytes:
+  """Returns a digest of the keys and face boundaries of a mesh.
+
+  'kind' identifies the mesh representation, so equal DLFL and DCEL meshes
+  get different fingerprints. Representations storing edges pass their keys,
+  and the vertex and face indices of each edge as 'edge_incidences', so that
+  meshes only differing by their edge keys get different fingerprints.
+  """
+  digest = hashlib.blake2b(digest_size=16)
+  digest.update(kind.encode())
+  for keys in (vertices, faces):
+    digest.update(b'\0')
+    digest.update('\n'.join(keys).encode())
+  digest.update(_int64_bytes(len(polygon) for polygon in polygons))
+  digest.update(
+      _int64_bytes(index for polygon in polygons for index in polygon))
+  if edges:
+    digest.update(b'\0')
+    digest.update('\n'.join(edges).encode())
+    digest.update(_int64_bytes(edge_incidences))
+  return digest.digest()
+
+
+def fingerprint(connectivity: bytes, positions: Iterable[Point3D]) -> str:
+  """Returns the hexadecimal fingerprint of a mesh, from its connectivity
+  digest and its vertex positions."""
+  values = array.array(
+      'd', (coordinate for position in positions for coordinate in position))
+  if sys.byteorder == 'big':
+    values.byteswap()
+  digest = hashlib.blake2b(connectivity, digest_size=16)
+  digest.update(values.tobytes())
+  return digest.hexdigest()
+
+
+def _int64_bytes(values: Iterable[int]) -> bytes:
+  """Returns integers packed as little-endian 64-bit values."""
+  packed = array.array('q', values)
+  if sys.byteorder == 'big':
+    packed.byteswap()
+  return packed.tobytes()
+
+
+class MemoCache:
+  """An on-disk least recently used cache of operation results.
+
+  Each result is pickled to its own file in the cache directory, named after
+  the key of the operation. Reading an entry refreshes its modification time,
+  which is used to evict the least recently used entries once there are more
+  than 'max_entries'. Entries are written atomically, so the directory can be
+  shared between processes.
+  """
+
+  _SUFFIX = '.pickle'
+  _TEMPORARY_SUFFIX = '.tmp'
+
+  def __init__(self, directory: str | os.PathLike, max_entries: int = 256):
+    self.directory = os.fspath(directory)
+    self.max_entries = max_entries
+    os.makedirs(self.directory, exist_ok=True)
+
+  def __contains__(self, key: str) -> bool:
+    return os.path.exists(self._path(key))
+
+  def __len__(self) -> int:
+    return len(self._entries())
+
+  @staticmethod
+  def key(operation: str, input_fingerprint: str, *parameters: Any) -> str:
+    """Returns the key of an operation applied to an input with the passed
+    fingerprint. Parameters are identified by their repr()."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (operation, input_fingerprint, *map(repr, parameters)):
+      digest.update(part.encode())
+      digest.update(b'\0')
+    return digest.hexdigest()
+
+  def get(self, key: str) -> Any:
+    """Returns the result stored for a key.
+
+    Raises a KeyError if there is none.
+    """
+    path = self._path(key)
+    try:
+      with open(path, 'rb') as file:
+        value = pickle.load(file)
+      # Mark the entry as recently used.
+      os.utime(path)
+    except FileNotFoundError:
+      # Missing, or evicted by another process since it was read.
+      raise KeyError(key) from None
+    return value
+
+  def put(self, key: str, value: Any):
+    """Stores the result for a key, evicting old entries if needed.
+
+    The result is written to a temporary file in the cache directory, which is
+    then renamed to the entry's path, or removed if writing fails (e.g the
+    value cannot be pickled).
+    """
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=self.directory, prefix=f'.{key}.', suffix=self._TEMPORARY_SUFFIX)
+    try:
+      with os.fdopen(file_descriptor, 'wb') as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+      os.replace(temporary_path, self._path(key))
+    except BaseException:
+      try:
+        os.unlink(temporary_path)
+      except FileNotFoundError:
+        pass
+      raise
+    self._evict()
+
+  def memoize(
+          self, operation: str, input_fingerprint: str,
+          compute: Callable[[], T], *parameters: Any) -> T:
+    """Returns the cached result of an operation, computing and storing it
+    with 'compute' if it is not cached yet."""
+    key = self.key(operation, input_fingerprint, *parameters)
+    try:
+      return self.get(key)
+    except KeyError:
+      pass
+    value = compute()
+    self.put(key, value)
+    return value
+
+  def clear(self):
+    """Deletes all entries."""
+    for path in self._entries():
+      os.unlink(path)
+
+  def _path(self, key: str) -> str:
+    return os.path.join(self.directory, key + self._SUFFIX)
+
+  def _entries(self) -> list[str]:
+    return [os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(self._SUFFIX)]
+
+  def _evict(self):
+    """Deletes the least recently used entries past the maximum count."""
+    entries = self._entries()
+    if len(entries) <= self.max_entries:
+      return
+    entries.sort(key=os.path.getmtime)
+    for path in entries[:len(entries) - self.max_entries]:
+      try:
+        os.unlink(path)
+      except FileNotFoundError:
+        # Already evicted by another process.
+        pass
@@ -1,38 +1,220 @@
 import dataclasses
+from typing import Any, Callable, Iterable, Optional, Tuple, TypeVar
 
+from pytopmod.core.components import ComponentTracker
 from pytopmod.core.face import FaceKey
 from pytopmod.core.geometry import Point3D
 from pytopmod.core.keystore import KeyStore
 from pytopmod.core.vertex import VertexKey
 
+T = TypeVar('T')
+
+
+@dataclasses.dataclass(slots=True)
+class _DirtyKeys:
+  """The vertices and faces marked as dirty for a consumer of 'Mesh.take_dirty',
+  and those among them that were created since its last call."""
+  vertices: set[VertexKey] = dataclasses.field(default_factory=set)
+  faces: set[FaceKey] = dataclasses.field(default_factory=set)
+  created_vertices: set[VertexKey] = dataclasses.field(default_factory=set)
+  created_faces: set[FaceKey] = dataclasses.field(default_factory=set)
+
+  def mark_created(
+          self, vertices: Iterable[VertexKey], faces: Iterable[FaceKey]):
+    self.vertices.update(vertices)
+    self.faces.update(faces)
+    self.created_vertices.update(vertices)
+    self.created_faces.update(faces)
+
+  def mark_deleted(
+          self, vertices: Iterable[VertexKey], faces: Iterable[FaceKey]):
+    # Keys created since the last call are forgotten rather than marked.
+    for keys, created, deleted in ((self.vertices, self.created_vertices,
+                                    vertices),
+                                   (self.faces, self.created_faces, faces)):
+      for key in deleted:
+        if key in created:
+          keys.discard(key)
+        else:
+          keys.add(key)
+
 
 @dataclasses.dataclass(slots=True)
 class Mesh:
   """Base Mesh class, to be subclassed (e.g DLFLMesh, DCELMesh, ect.)
 
   Stores and provides create/delete methods for vertice and face keys.
-  Also exposes a vertex coordinates map.
+  Also exposes a vertex coordinates map, and the connected components formed by
+  the vertices: they are found on first access, then kept up to date by the
+  subclasses' operators (see 'component_tracker').
+
+  The version is bumped by every change to the connectivity of the mesh (vertex,
+  face and edge creation and deletion, face boundary updates), and is used to
+  invalidate values derived from the connectivity (see 'cached'). Changes to the
+  vertex coordinates do not bump it.
+
+  Vertices and faces that were created, deleted or modified (including vertex
+  moves through 'move_vertices') are also recorded as dirty for each consumer
+  of 'take_dirty', so later passes can only process the modified regions.
+  Nothing is recorded while there is no consumer.
   """
   vertices: KeyStore[VertexKey] = dataclasses.field(init=False)
   faces: KeyStore[FaceKey] = dataclasses.field(init=False)
   vertex_coordinates: dict[VertexKey, Point3D] = dataclasses.field(init=False)
+  _components: Optional[ComponentTracker[VertexKey]] = dataclasses.field(
+      init=False, repr=False, compare=False)
+  version: int = dataclasses.field(init=False, compare=False)
+  _cache: dict[str, Tuple[int, Any]] = dataclasses.field(
+      init=False, repr=False, compare=False)
+  _dirty_consumers: dict[str, _DirtyKeys] = dataclasses.field(
+      init=False, repr=False, compare=False)
 
   def __post_init__(self):
     self.vertices = KeyStore[VertexKey]('v')
     self.faces = KeyStore[VertexKey]('f')
     self.vertex_coordinates = {}
+    self._components = None
+    self.version = 0
+    self._cache = {}
+    self._dirty_consumers = {}
 
   def create_vertex(self, position: Point3D) -> VertexKey:
     vertex = self.vertices.new()
+    self.version += 1
+    for dirty in self._dirty_consumers.values():
+      dirty.mark_created((vertex,), ())
     self.vertex_coordinates[vertex] = position
+    if self._components is not None:
+      self._components.add(vertex)
     return vertex
 
+  def create_vertices(self, positions: Iterable[Point3D]) -> list[VertexKey]:
+    """Creates a vertex at each of the passed positions at once."""
+    positions = list(positions)
+    vertices = self.vertices.new_keys(len(positions))
+    self.version += 1
+    for dirty in self._dirty_consumers.values():
+      dirty.mark_created(vertices, ())
+    self.vertex_coordinates.update(zip(vertices, positions))
+    if self._components is not None:
+      for vertex in vertices:
+        self._components.add(vertex)
+    return vertices
+
   def delete_vertex(self, vertex: VertexKey):
     self.vertices.delete(vertex)
+    self.version += 1
+    for dirty in self._dirty_consumers.values():
+      dirty.mark_deleted((vertex,), ())
     del self.vertex_coordinates[vertex]
+    if self._components is not None:
+      self._components.remove(vertex)
+
+  @property
+  def components(self) -> ComponentTracker[VertexKey]:
+    """The connected components formed by the vertices.
+
+    They are found from the connectivity on first access, after which the
+    operators keep them up to date.
+    """
+    if self._components is None:
+      components = ComponentTracker[VertexKey]()
+      for vertex in self.vertices:
+        components.add(vertex)
+      for vertices in self._connected_vertices():
+        components.merge_all(vertices)
+      self._components = components
+    return self._components
+
+  @property
+  def component_tracker(self) -> Optional[ComponentTracker[VertexKey]]:
+    """The components to update after a change of the connectivity, or None
+    if they were never accessed (see 'components')."""
+    return self._components
+
+  def _connected_vertices(self) -> Iterable[Iterable[VertexKey]]:
+    """Returns groups of connected vertices covering the connectivity of the
+    mesh, e.g its face boundaries. To be overridden by subclasses."""
+    return ()
+
+  def move_vertices(self, positions: Iterable[Tuple[VertexKey, Point3D]]):
+    """Sets the coordinates of vertices from (vertex, position) pairs, and
+    marks them as dirty."""
+    positions = list(positions)
+    for vertex, position in positions:
+      self.vertex_coordinates[vertex] = position
+    self.mark_dirty(vertex for vertex, _ in positions)
 
   def create_face(self) -> FaceKey:
-    return self.faces.new()
+    face = self.faces.new()
+    self.version += 1
+    for dirty in self._dirty_consumers.values():
+      dirty.mark_created((), (face,))
+    return face
+
+  def create_faces(self, count: int) -> list[FaceKey]:
+    """Creates 'count' faces at once."""
+    faces = self.faces.new_keys(count)
+    self.version += 1
+    for dirty in self._dirty_consumers.values():
+      dirty.mark_created((), faces)
+    return faces
 
   def delete_face(self, face: FaceKey):
+    self.version += 1
+    for dirty in self._dirty_consumers.values():
+      dirty.mark_deleted((), (face,))
     return self.faces.delete(face)
+
+  def mark_dirty(
+          self, vertices: Iterable[VertexKey] = (),
+          faces: Iterable[FaceKey] = ()):
+    """Marks vertices and faces as modified for the consumers of 'take_dirty'.
+
+    Nothing is recorded while there is no consumer.
+    """
+    if not self._dirty_consumers:
+      return
+    vertices, faces = list(vertices), list(faces)
+    for dirty in self._dirty_consumers.values():
+      dirty.vertices.update(vertices)
+      dirty.faces.update(faces)
+
+  def take_dirty(
+          self, consumer: str = '') -> Tuple[set[VertexKey], set[FaceKey]]:
+    """Returns the vertices and faces marked as dirty since the consumer's
+    last call, and clears them for that consumer only.
+
+    Each consumer (e.g a delta stream, or an incremental pass) is named, and
+    registered by its first call, which returns no keys: changes are only
+    recorded for registered consumers, which should start from the whole mesh
+    (e.g a full delta). Consumers that stop calling must be dropped (see
+    'drop_dirty_consumer').
+
+    Keys created and deleted between two calls are left out, but other dirty
+    keys may have been deleted since they were marked.
+    """
+    dirty = self._dirty_consumers.get(consumer, _DirtyKeys())
+    self._dirty_consumers[consumer] = _DirtyKeys()
+    # Created keys may have been marked again after their deletion.
+    return ({vertex for vertex in dirty.vertices
+             if vertex in self.vertices
+             or vertex not in dirty.created_vertices},
+            {face for face in dirty.faces
+             if face in self.faces or face not in dirty.created_faces})
+
+  def drop_dirty_consumer(self, consumer: str = ''):
+    """Stops keeping the dirty keys of a consumer (see 'take_dirty')."""
+    self._dirty_consumers.pop(consumer, None)
+
+  def cached(self, name: str, build: Callable[[], T]) -> T:
+    """Returns the value cached under a name, (re)building it if the mesh's
+    connectivity changed since it was cached.
+
+    Cached values are shared between callers and must not be modified.
+    """
+    version, value = self._cache.get(name, (-1, None))
+    if version != self.version:
+      value = build()
+      self._cache[name] = (self.version, value)
+    return value
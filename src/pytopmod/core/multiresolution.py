@@ -0,0 +1,179 @@
+"""Multiresolution hierarchies of subdivided meshes.
+
+A hierarchy keeps every subdivision level of a mesh in array form, so switching
+between levels does not require subdividing again. Each level stores:
+ - The positions of its vertices, and its faces as CSR arrays: the vertex
+    indices of face i are corners[offsets[i]:offsets[i + 1]].
+ - For each vertex, its parents in the coarser level with their weights: the
+    vertex's predicted position is the weighted sum of its parents' positions,
+    and its actual position adds a detail vector to it.
+ - For each vertex, its children in the finer level (the inverse map), and for
+    each face, its parent face in the coarser level.
+
+Levels are built with the centroid triangulation of
+'dlfl.operations.subdivision.triangulate_faces', and match its result: each face
+of at least three vertices, including faces where a vertex appears several
+times, is split in a fan of triangles around a new vertex at its centroid (a
+repeated vertex counting once per occurrence). The existing vertices keep their
+indices.
+
+Moving vertices of a level updates their details, and only recomputes the
+positions of their descendants in the finer levels, which keep their own
+details.
+"""
+import dataclasses
+from typing import Mapping, Sequence, Tuple, cast
+
+from pytopmod.core import arrays, geometry
+from pytopmod.core.geometry import Point3D
+
+
+@dataclasses.dataclass(slots=True)
+class Level:
+  """A level of a multiresolution hierarchy (see module docstring)."""
+  positions: list[Point3D]
+  offsets: list[int]
+  corners: list[int]
+  details: list[Point3D]
+  parent_offsets: list[int]
+  parents: list[int]
+  parent_weights: list[float]
+  face_parents: list[int]
+  child_offsets: list[int] = dataclasses.field(default_factory=list)
+  children: list[int] = dataclasses.field(default_factory=list)
+
+  def polygons(self) -> list[list[int]]:
+    """Returns the faces of the level as lists of vertex indices, e.g to pass
+    them to 'primitives.polygon_mesh'."""
+    return [self.corners[self.offsets[face]:self.offsets[face + 1]]
+            for face in range(len(self.offsets) - 1)]
+
+
+class Hierarchy:
+  """A multiresolution hierarchy, starting from a base mesh given as vertex
+  positions and polygons (see e.g 'dlfl.arrays.polygons')."""
+
+  def __init__(
+          self,
+          positions: Sequence[Point3D], polygons: Sequence[Sequence[int]]):
+    offsets, corners = arrays.csr_polygons(polygons)
+    self.levels = [Level(
+        positions=list(positions), offsets=offsets, corners=corners,
+        details=[(0.0, 0.0, 0.0)] * len(positions),
+        parent_offsets=[0] * (len(positions) + 1), parents=[],
+        parent_weights=[], face_parents=[])]
+
+  def __len__(self) -> int:
+    return len(self.levels)
+
+  def level(self, index: int) -> Level:
+    """Returns a level of the hierarchy, 0 being the base mesh."""
+    return self.levels[index]
+
+  def subdivide(self, levels: int = 1) -> Level:
+    """Adds subdivision levels to the hierarchy, and returns the finest."""
+    for _ in range(levels):
+      self.levels.append(_triangulated(self.levels[-1]))
+    return self.levels[-1]
+
+  def move_vertices(
+          self, level: int, positions: Mapping[int, Point3D]
+  ) -> list[Tuple[int, set[int]]]:
+    """Moves vertices of a level, and propagates the change to finer levels.
+
+    Returns the indices of the moved vertices at each level, as pairs (level,
+    vertices).
+    """
+    current = self.levels[level]
+    for vertex, position in positions.items():
+      current.positions[vertex] = position
+      if level > 0:
+        predicted = _predicted(self.levels[level - 1], current, vertex)
+        current.details[vertex] = (position[0] - predicted[0],
+                                   position[1] - predicted[1],
+                                   position[2] - predicted[2])
+
+    moved = set(positions)
+    result = [(level, moved)]
+    for finer_index in range(level + 1, len(self.levels)):
+      coarser, finer = self.levels[finer_index - 1], self.levels[finer_index]
+      moved = {child
+               for vertex in moved
+               for child in coarser.children[
+                   coarser.child_offsets[vertex]:
+                   coarser.child_offsets[vertex + 1]]}
+      for vertex in moved:
+        predicted = _predicted(coarser, finer, vertex)
+        detail = finer.details[vertex]
+        finer.positions[vertex] = (predicted[0] + detail[0],
+                                   predicted[1] + detail[1],
+                                   predicted[2] + detail[2])
+      result.append((finer_index, moved))
+    return result
+
+
+def _predicted(coarser: Level, level: Level, vertex: int) -> Point3D:
+  """Returns the position of a vertex predicted from its parents."""
+  x = y = z = 0.0
+  for index in range(level.parent_offsets[vertex],
+                     level.parent_offsets[vertex + 1]):
+    parent = coarser.positions[level.parents[index]]
+    weight = level.parent_weights[index]
+    x += weight * parent[0]
+    y += weight * parent[1]
+    z += weight * parent[2]
+  return (x, y, z)
+
+
+def _triangulated(coarser: Level) -> Level:
+  """Returns the level obtained by triangulating each face of a level from its
+  centroid, and fills the children of the coarser level."""
+  vertex_count = len(coarser.positions)
+  face_count = len(coarser.offsets) - 1
+
+  # Existing vertices are their own single parent.
+  parent_offsets = list(range(vertex_count + 1))
+  parents = list(range(vertex_count))
+  parent_weights = [1.0] * vertex_count
+  positions = list(coarser.positions)
+
+  offsets = [0]
+  corners: list[int] = []
+  face_parents: list[int] = []
+  for face in range(face_count):
+    face_corners = coarser.corners[coarser.offsets[face]:
+                                   coarser.offsets[face + 1]]
+    # Faces with less than three vertices are left as is.
+    if len(face_corners) < 3:
+      corners.extend(face_corners)
+      offsets.append(len(corners))
+      face_parents.append(face)
+      continue
+
+    centroid = len(positions)
+    weight = 1.0 / len(face_corners)
+    parents.extend(face_corners)
+    parent_weights.extend([weight] * len(face_corners))
+    parent_offsets.append(len(parents))
+    positions.append(cast(Point3D, geometry.centroid(
+        coarser.positions[corner] for corner in face_corners)))
+
+    for index, corner in enumerate(face_corners):
+      corners.extend(
+          (corner, face_corners[(index + 1) % len(face_corners)], centroid))
+      offsets.append(len(corners))
+      face_parents.append(face)
+
+  # The children of each coarse vertex, i.e the inverse of the parents map.
+  children: list[list[int]] = [[] for _ in range(vertex_count)]
+  for vertex in range(len(positions)):
+    for parent in dict.fromkeys(
+            parents[parent_offsets[vertex]:parent_offsets[vertex + 1]]):
+      children[parent].append(vertex)
+  coarser.child_offsets, coarser.children = arrays.csr_polygons(children)
+
+  return Level(
+      positions=positions, offsets=offsets, corners=corners,
+      details=[(0.0, 0.0, 0.0)] * len(positions),
+      parent_offsets=parent_offsets, parents=parents,
+      parent_weights=parent_weights, face_parents=face_parents)
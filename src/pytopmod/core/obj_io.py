@@ -0,0 +1,106 @@
+"""Parallel export of meshes in array form to OBJ files.
+
+The vertex and face lines are formatted in chunks by a pool of worker
+processes, and written in order, so the output is byte-identical to the serial
+'mesh_to_obj' of each mesh representation (see 'dlfl.obj_io.write_obj' and
+'dcel.obj_io.write_obj').
+
+The CSR face boundaries (see 'arrays.csr_polygons') are handed to each worker
+once, as compact integer arrays, when the pool starts: they are inherited
+without copying where processes are forked. Vertex positions are sent with
+their chunks, so each coordinate is formatted with str() exactly like the
+serial writer does (e.g integer coordinates stay integers).
+"""
+import array
+import concurrent.futures
+import os
+from typing import BinaryIO, Iterator, Optional, Sequence, Tuple
+
+from pytopmod.core.geometry import Point3D
+
+# The face boundaries used by the worker processes (see '_initialize').
+_offsets: Sequence[int] = ()
+_corners: Sequence[int] = ()
+
+
+def format_vertices(positions: Sequence[Point3D]) -> bytes:
+  """Returns the OBJ lines of vertices, separated by line breaks."""
+  return '\n'.join(f'v {" ".join(str(coord) for coord in position)}'
+                   for position in positions).encode()
+
+
+def format_faces(
+        offsets: Sequence[int], corners: Sequence[int],
+        start: int, stop: int) -> bytes:
+  """Returns the OBJ lines of the faces in [start, stop), separated by line
+  breaks, from CSR face boundaries of 0-based vertex indices."""
+  lines = []
+  for face in range(start, stop):
+    indices = (str(index + 1)
+               for index in corners[offsets[face]:offsets[face + 1]])
+    lines.append(f'f {" ".join(indices)}')
+  return '\n'.join(lines).encode()
+
+
+def write_obj(
+    file: BinaryIO,
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], corners: Sequence[int],
+    workers: Optional[int] = None,
+    chunk_size: int = 65536
+):
+  """Writes a mesh given as vertex positions and CSR face boundaries to a
+  binary file in OBJ format.
+
+  'workers' is the number of worker processes (the number of CPUs by default),
+  and 'chunk_size' the number of vertices or faces formatted by a worker at a
+  time. Meshes fitting in a single chunk of each are formatted in-process.
+  """
+  face_count = len(offsets) - 1
+  if workers == 0 or (len(positions) <= chunk_size and
+                      face_count <= chunk_size):
+    file.write(format_vertices(positions) + b'\n' +
+               format_faces(offsets, corners, 0, face_count))
+    return
+
+  with concurrent.futures.ProcessPoolExecutor(
+          max_workers=workers or os.cpu_count(),
+          initializer=_initialize,
+          initargs=(array.array('q', offsets),
+                    array.array('q', corners))) as executor:
+    vertex_chunks = executor.map(
+        format_vertices,
+        (positions[start:start + chunk_size]
+         for start in range(0, len(positions), chunk_size)))
+    face_chunks = executor.map(
+        _format_faces,
+        *zip(*_chunk_bounds(face_count, chunk_size)))
+    _write_joined(file, vertex_chunks)
+    file.write(b'\n')
+    _write_joined(file, face_chunks)
+
+
+def _initialize(offsets: Sequence[int], corners: Sequence[int]):
+  """Sets the face boundaries of a worker process."""
+  global _offsets, _corners  # pylint: disable=global-statement
+  _offsets, _corners = offsets, corners
+
+
+def _format_faces(start: int, stop: int) -> bytes:
+  return format_faces(_offsets, _corners, start, stop)
+
+
+def _chunk_bounds(count: int, chunk_size: int) -> list[Tuple[int, int]]:
+  return [(start, min(start + chunk_size, count))
+          for start in range(0, count, chunk_size)] or [(0, 0)]
+
+
+def _write_joined(file: BinaryIO, chunks: Iterator[bytes]):
+  """Writes chunks of lines separated by line breaks, as '\\n'.join() of all
+  their lines would."""
+  first = True
+  for chunk in chunks:
+    if not first:
+      file.write(b'\n')
+    file.write(chunk)
+    first = False
@@ -0,0 +1,236 @@
+"""Parametric shape generators shared by the DLFL and DCEL primitives.
+
+Each generator returns a list of vertex positions and a list of polygons given
+as lists of indices into the positions. Polygons are ordered counter-clockwise
+when seen from outside the shape, and every edge is shared by exactly two
+polygons (open shapes are closed by extra boundary faces), so the result can be
+turned directly into a manifold mesh.
+
+Generators raise a ValueError when their resolution arguments are too small to
+form such a mesh.
+"""
+import math
+from typing import Tuple
+
+from pytopmod.core.geometry import Point3D
+
+
+def grid(
+    rows: int, columns: int, width: float = 2.0, height: float = 2.0
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Returns a planar grid of rows x columns quads, centered in the XY plane.
+
+  The quads face +Z, and a single boundary face facing -Z closes the grid.
+  """
+  _check_minimum(rows=(rows, 1), columns=(columns, 1))
+  positions: list[Point3D] = [
+      (width * (column / columns - 0.5), height * (row / rows - 0.5), 0.0)
+      for row in range(rows + 1) for column in range(columns + 1)]
+
+  stride = columns + 1
+  polygons = [
+      [row * stride + column, row * stride + column + 1,
+       (row + 1) * stride + column + 1, (row + 1) * stride + column]
+      for row in range(rows) for column in range(columns)]
+
+  # The counter-clockwise boundary loop, traversed backwards by the back face.
+  boundary = (
+      [column for column in range(columns)] +
+      [row * stride + columns for row in range(rows)] +
+      [rows * stride + column for column in range(columns, 0, -1)] +
+      [row * stride for row in range(rows, 0, -1)])
+  polygons.append(boundary[::-1])
+
+  return (positions, polygons)
+
+
+def cube(
+    resolution: int = 1, size: float = 2.0
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Returns a cube centered at the origin, each side split in resolution^2
+  quads."""
+  _check_minimum(resolution=(resolution, 1))
+  indices: dict[Tuple[int, int, int], int] = {}
+  positions: list[Point3D] = []
+
+  def index(lattice_point: Tuple[int, int, int]) -> int:
+    if lattice_point not in indices:
+      indices[lattice_point] = len(positions)
+      positions.append(tuple(
+          size * (coordinate / resolution - 0.5)
+          for coordinate in lattice_point))  # type: ignore
+    return indices[lattice_point]
+
+  # Each side is given by its origin and two axes (u, v) such that u x v is
+  # the outward normal.
+  n = resolution
+  sides = (
+      ((0, 0, 0), (0, 0, 1), (0, 1, 0)),  # -X
+      ((n, 0, 0), (0, 1, 0), (0, 0, 1)),  # +X
+      ((0, 0, 0), (1, 0, 0), (0, 0, 1)),  # -Y
+      ((0, n, 0), (0, 0, 1), (1, 0, 0)),  # +Y
+      ((0, 0, 0), (0, 1, 0), (1, 0, 0)),  # -Z
+      ((0, 0, n), (1, 0, 0), (0, 1, 0)),  # +Z
+  )
+
+  polygons = []
+  for origin, u, v in sides:
+    for i in range(n):
+      for j in range(n):
+        polygons.append([
+            index(tuple(o + (i + di) * a + (j + dj) * b
+                        for o, a, b in zip(origin, u, v)))  # type: ignore
+            for di, dj in ((0, 0), (1, 0), (1, 1), (0, 1))])
+
+  return (positions, polygons)
+
+
+def cylinder(
+    segments: int, rings: int = 1, radius: float = 1.0, height: float = 2.0
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Returns a closed cylinder along Z, centered at the origin.
+
+  The side is split in segments x rings quads, and closed by two n-gon caps.
+  """
+  _check_minimum(segments=(segments, 3), rings=(rings, 1))
+  angles = [2.0 * math.pi * segment / segments for segment in range(segments)]
+  positions: list[Point3D] = [
+      (radius * math.cos(angle), radius * math.sin(angle),
+       height * (ring / rings - 0.5))
+      for ring in range(rings + 1) for angle in angles]
+
+  polygons = [
+      [ring * segments + segment,
+       ring * segments + (segment + 1) % segments,
+       (ring + 1) * segments + (segment + 1) % segments,
+       (ring + 1) * segments + segment]
+      for ring in range(rings) for segment in range(segments)]
+
+  # Bottom cap (facing -Z), then top cap (facing +Z).
+  polygons.append(list(range(segments - 1, -1, -1)))
+  polygons.append(list(range(rings * segments, (rings + 1) * segments)))
+
+  return (positions, polygons)
+
+
+def torus(
+    segments: int, sides: int,
+    major_radius: float = 1.0, minor_radius: float = 0.25
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Returns a torus around Z, centered at the origin, made of segments x sides
+  quads."""
+  _check_minimum(segments=(segments, 3), sides=(sides, 3))
+  tube = [(math.cos(2.0 * math.pi * side / sides),
+           math.sin(2.0 * math.pi * side / sides)) for side in range(sides)]
+  positions: list[Point3D] = []
+  for segment in range(segments):
+    angle = 2.0 * math.pi * segment / segments
+    cos_angle, sin_angle = math.cos(angle), math.sin(angle)
+    for cos_tube, sin_tube in tube:
+      distance = major_radius + minor_radius * cos_tube
+      positions.append(
+          (distance * cos_angle, distance * sin_angle, minor_radius * sin_tube))
+
+  polygons = []
+  for segment in range(segments):
+    row = segment * sides
+    next_row = (segment + 1) % segments * sides
+    for side in range(sides):
+      next_side = (side + 1) % sides
+      polygons.append([row + side, next_row + side,
+                       next_row + next_side, row + next_side])
+
+  return (positions, polygons)
+
+
+def uv_sphere(
+    segments: int, rings: int, radius: float = 1.0
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Returns a UV sphere centered at the origin.
+
+  The sphere is split in 'segments' meridians and 'rings' parallel bands: the
+  polar bands are triangle fans, the others are quads.
+  """
+  _check_minimum(segments=(segments, 3), rings=(rings, 2))
+  positions: list[Point3D] = []
+  for ring in range(1, rings):
+    latitude = math.pi * (ring / rings - 0.5)
+    for segment in range(segments):
+      longitude = 2.0 * math.pi * segment / segments
+      positions.append((radius * math.cos(latitude) * math.cos(longitude),
+                        radius * math.cos(latitude) * math.sin(longitude),
+                        radius * math.sin(latitude)))
+  south_pole = len(positions)
+  north_pole = south_pole + 1
+  positions.append((0.0, 0.0, -radius))
+  positions.append((0.0, 0.0, radius))
+
+  polygons = []
+  for segment in range(segments):
+    next_segment = (segment + 1) % segments
+    polygons.append([next_segment, segment, south_pole])
+    for ring in range(rings - 2):
+      row = ring * segments
+      next_row = row + segments
+      polygons.append([row + segment, row + next_segment,
+                       next_row + next_segment, next_row + segment])
+    last_row = (rings - 2) * segments
+    polygons.append([last_row + segment, last_row + next_segment, north_pole])
+
+  return (positions, polygons)
+
+
+def ico_sphere(
+    subdivisions: int = 0, radius: float = 1.0
+) -> Tuple[list[Point3D], list[list[int]]]:
+  """Returns an icosphere centered at the origin.
+
+  Each subdivision splits every triangle of the icosahedron in four, the new
+  vertices being projected on the sphere.
+  """
+  _check_minimum(subdivisions=(subdivisions, 0))
+  t = (1.0 + math.sqrt(5.0)) / 2.0
+  points = [
+      (-1.0, t, 0.0), (1.0, t, 0.0), (-1.0, -t, 0.0), (1.0, -t, 0.0),
+      (0.0, -1.0, t), (0.0, 1.0, t), (0.0, -1.0, -t), (0.0, 1.0, -t),
+      (t, 0.0, -1.0), (t, 0.0, 1.0), (-t, 0.0, -1.0), (-t, 0.0, 1.0)]
+  triangles = [
+      [0, 11, 5], [0, 5, 1], [0, 1, 7], [0, 7, 10], [0, 10, 11],
+      [1, 5, 9], [5, 11, 4], [11, 10, 2], [10, 7, 6], [7, 1, 8],
+      [3, 9, 4], [3, 4, 2], [3, 2, 6], [3, 6, 8], [3, 8, 9],
+      [4, 9, 5], [2, 4, 11], [6, 2, 10], [8, 6, 7], [9, 8, 1]]
+
+  def project(point: Tuple[float, ...]) -> Point3D:
+    norm = math.sqrt(sum(coordinate * coordinate for coordinate in point))
+    return (radius * point[0] / norm, radius * point[1] / norm,
+            radius * point[2] / norm)
+
+  positions = [project(point) for point in points]
+
+  for _ in range(subdivisions):
+    midpoints: dict[Tuple[int, int], int] = {}
+
+    def midpoint(index_1: int, index_2: int) -> int:
+      key = (min(index_1, index_2), max(index_1, index_2))
+      if key not in midpoints:
+        midpoints[key] = len(positions)
+        positions.append(project(tuple(
+            (a + b) / 2.0
+            for a, b in zip(positions[index_1], positions[index_2]))))
+      return midpoints[key]
+
+    subdivided = []
+    for a, b, c in triangles:
+      ab, bc, ca = midpoint(a, b), midpoint(b, c), midpoint(c, a)
+      subdivided.extend(([a, ab, ca], [b, bc, ab], [c, ca, bc], [ab, bc, ca]))
+    triangles = subdivided
+
+  return (positions, triangles)
+
+
+def _check_minimum(**arguments: Tuple[int, int]):
+  """Raises a ValueError if an argument, given as (value, minimum), is below
+  its minimum."""
+  for name, (value, minimum) in arguments.items():
+    if value < minimum:
+      raise ValueError(f"'{name}' must be at least {minimum}, got {value}.")
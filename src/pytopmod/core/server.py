@@ -0,0 +1,346 @@
+"""A local server sharing meshes between processes over a Unix socket.
+
+The server owns named meshes, and clients send it requests as JSON objects, one
+per line:
+
+  {"id": 1, "mesh": "body", "op": "insert_edge", "args": ["v1", "f2", ...]}
+
+and receive responses in the same form, in completion order:
+
+  {"id": 1, "result": ..., "version": 3}   or   {"id": 1, "error": "..."}
+
+Operations are the mesh representation's operators (see 'dlfl.server' and
+'dcel.server' for the available ones). Lists in the arguments are passed as
+tuples, and sets in the results are returned as sorted lists.
+
+Write operations on a mesh are queued, and the requests queued while a batch is
+applied are coalesced into the next batch, applied in arrival order in a worker
+thread. After each batch, the server takes a snapshot of the mesh in array
+form: queries (see 'QUERIES') are answered from the latest snapshot, so they
+are consistent and never wait for writes in progress. The 'version' of a
+response is the mesh version of the snapshot reflecting it. Queries formatting
+a whole snapshot (see 'THREADED_QUERIES') are also answered in a worker thread.
+
+If an operation of a batch fails, its error is returned and the following ones
+are still applied: operators do not roll back partial changes. If the batch
+itself fails (e.g taking its snapshot), the error is returned for all of its
+operations, and the latest snapshot is kept.
+"""
+import asyncio
+import dataclasses
+import functools
+import io
+import json
+import os
+import types
+from typing import Any, Callable, Mapping, Optional, Tuple
+
+from pytopmod.core import arrays, obj_io
+from pytopmod.core.face import FaceKey
+from pytopmod.core.geometry import Point3D
+from pytopmod.core.mesh import Mesh
+from pytopmod.core.vertex import VertexKey
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Backend:
+  """The operations of a mesh representation served by a MeshServer.
+
+  'arrays' is the representation's array conversion module (e.g 'dlfl.arrays'),
+  used to take snapshots.
+  """
+  kind: str
+  operations: Mapping[str, Callable]
+  arrays: types.ModuleType
+
+
+@dataclasses.dataclass(frozen=True)
+class Snapshot:
+  """An immutable copy of a mesh in array form (see e.g 'dlfl.arrays')."""
+  version: int
+  vertices: list[VertexKey]
+  positions: list[Point3D]
+  faces: list[FaceKey]
+  polygons: list[list[int]]
+
+  @classmethod
+  def of(cls, mesh: Mesh, mesh_arrays: types.ModuleType) -> 'Snapshot':
+    # Connectivity arrays are cached on the mesh and replaced (not modified)
+    # when it changes, so they can be shared with the snapshot.
+    face_keys, polygons = mesh_arrays.faces(mesh)
+    return cls(mesh.version, mesh_arrays.vertices(mesh),
+               mesh_arrays.positions(mesh), face_keys, polygons)
+
+  @functools.cached_property
+  def vertex_indices(self) -> dict[VertexKey, int]:
+    return {vertex: index for index, vertex in enumerate(self.vertices)}
+
+  @functools.cached_property
+  def face_indices(self) -> dict[FaceKey, int]:
+    return {face: index for index, face in enumerate(self.faces)}
+
+  def to_obj(self) -> str:
+    """Returns the snapshot in OBJ format, as the 'mesh_to_obj' of its mesh
+    representation would (see 'obj_io')."""
+    file = io.BytesIO()
+    obj_io.write_obj(
+        file, self.positions, *arrays.csr_polygons(self.polygons), workers=0)
+    return file.getvalue().decode()
+
+
+def _summary(snapshot: Snapshot) -> dict[str, int]:
+  return {'version': snapshot.version, 'vertices': len(snapshot.vertices),
+          'faces': len(snapshot.faces)}
+
+
+def _vertex(snapshot: Snapshot, vertex: VertexKey) -> Point3D:
+  return snapshot.positions[snapshot.vertex_indices[vertex]]
+
+
+def _face(snapshot: Snapshot, face: FaceKey) -> list[VertexKey]:
+  return [snapshot.vertices[index]
+          for index in snapshot.polygons[snapshot.face_indices[face]]]
+
+
+def _arrays(snapshot: Snapshot) -> dict[str, list]:
+  return {'vertices': snapshot.vertices, 'positions': snapshot.positions,
+          'faces': snapshot.faces, 'polygons': snapshot.polygons}
+
+
+# Read-only queries, answered from the latest snapshot of a mesh.
+QUERIES: dict[str, Callable[..., Any]] = {
+    'summary': _summary,
+    'vertex': _vertex,
+    'face': _face,
+    'arrays': _arrays,
+    'export': Snapshot.to_obj,
+}
+
+# The queries answered in a worker thread, as they format a whole snapshot.
+THREADED_QUERIES = frozenset({'export'})
+
+
+class _ServedMesh:
+  """A mesh owned by the server, with its write queue and latest snapshot."""
+
+  def __init__(self, mesh: Mesh, backend: Backend):
+    self.mesh = mesh
+    self.backend = backend
+    self.snapshot = Snapshot.of(mesh, backend.arrays)
+    self.queue: asyncio.Queue[Tuple[str, tuple, asyncio.Future]] = (
+        asyncio.Queue())
+    self.writer: Optional[asyncio.Task] = None
+
+  async def write(self, operation: str, arguments: tuple) -> Tuple[Any, int]:
+    """Queues an operation, and returns its result and the version of the
+    snapshot reflecting it once its batch is applied."""
+    if operation not in self.backend.operations:
+      raise KeyError(f'Unknown operation {operation!r}.')
+    future = asyncio.get_running_loop().create_future()
+    self.queue.put_nowait((operation, arguments, future))
+    if self.writer is None:
+      self.writer = asyncio.create_task(self._apply_batches())
+    return await future
+
+  async def _apply_batches(self):
+    loop = asyncio.get_running_loop()
+    while True:
+      batch = [await self.queue.get()]
+      while not self.queue.empty():
+        batch.append(self.queue.get_nowait())
+      try:
+        outcomes, self.snapshot = await loop.run_in_executor(
+            None, self._apply, [(operation, arguments)
+                                for operation, arguments, _ in batch])
+      except Exception as error:  # pylint: disable=broad-except
+        # The writer keeps serving the following batches.
+        outcomes = [(True, error)] * len(batch)
+      for (_, _, future), (failed, value) in zip(batch, outcomes):
+        self.queue.task_done()
+        if future.cancelled():
+          continue
+        if failed:
+          future.set_exception(value)
+        else:
+          future.set_result((value, self.snapshot.version))
+
+  def _apply(
+          self, batch: list[Tuple[str, tuple]]
+  ) -> Tuple[list[Tuple[bool, Any]], Snapshot]:
+    """Applies a batch of operations (in a worker thread), and returns their
+    outcomes as pairs (failed, result or exception) and the new snapshot."""
+    outcomes: list[Tuple[bool, Any]] = []
+    for operation, arguments in batch:
+      try:
+        outcomes.append(
+            (False, self.backend.operations[operation](self.mesh, *arguments)))
+      except Exception as error:  # pylint: disable=broad-except
+        outcomes.append((True, error))
+    return (outcomes, Snapshot.of(self.mesh, self.backend.arrays))
+
+  async def close(self):
+    """Waits for the queued operations to be applied, and stops the writer."""
+    await self.queue.join()
+    if self.writer is not None:
+      self.writer.cancel()
+      try:
+        await self.writer
+      except asyncio.CancelledError:
+        pass
+      self.writer = None
+
+
+class MeshServer:
+  """Serves named meshes over a Unix socket (see module docstring).
+
+  Meshes must only be modified through the server while it runs.
+  """
+
+  def __init__(self):
+    self._meshes: dict[str, _ServedMesh] = {}
+    self._server: Optional[asyncio.AbstractServer] = None
+
+  def add_mesh(self, name: str, mesh: Mesh, backend: Backend):
+    """Serves a mesh under a name, with the operations of its backend (e.g
+    'dlfl.server.BACKEND')."""
+    self._meshes[name] = _ServedMesh(mesh, backend)
+
+  def snapshot(self, name: str) -> Snapshot:
+    """Returns the latest snapshot of a mesh."""
+    return self._meshes[name].snapshot
+
+  async def start(self, path: str | os.PathLike):
+    """Starts listening on a Unix socket at the passed path."""
+    self._server = await asyncio.start_unix_server(self._serve, path)
+
+  async def close(self):
+    """Stops listening and waits for the pending batches to be applied."""
+    if self._server is not None:
+      self._server.close()
+      await self._server.wait_closed()
+      self._server = None
+    for served_mesh in self._meshes.values():
+      await served_mesh.close()
+
+  async def handle(self, request: Mapping[str, Any]) -> dict[str, Any]:
+    """Returns the response to a request."""
+    response: dict[str, Any] = {'id': request.get('id')}
+    try:
+      served_mesh = self._meshes[request['mesh']]
+      operation = request['op']
+      arguments = _from_json(request.get('args', []))
+      if operation in QUERIES:
+        snapshot = served_mesh.snapshot
+        if operation in THREADED_QUERIES:
+          result = await asyncio.get_running_loop().run_in_executor(
+              None, QUERIES[operation], snapshot, *arguments)
+        else:
+          result = QUERIES[operation](snapshot, *arguments)
+        version = snapshot.version
+      else:
+        result, version = await served_mesh.write(operation, arguments)
+      response['result'] = _to_json(result)
+      response['version'] = version
+    except Exception as error:  # pylint: disable=broad-except
+      response['error'] = f'{type(error).__name__}: {error}'
+    return response
+
+  async def _serve(
+          self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Handles the requests of a connection concurrently, so that requests
+    sent without waiting for their responses can be batched."""
+    async def respond(line: bytes):
+      try:
+        response = await self.handle(json.loads(line))
+      except json.JSONDecodeError as error:
+        response = {'id': None, 'error': f'JSONDecodeError: {error}'}
+      writer.write(json.dumps(response).encode() + b'\n')
+      await writer.drain()
+
+    tasks = set()
+    try:
+      while line := await reader.readline():
+        task = asyncio.create_task(respond(line))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+      if tasks:
+        await asyncio.wait(tasks)
+    except ConnectionError:
+      pass
+    finally:
+      writer.close()
+
+
+class MeshClient:
+  """A client of a MeshServer.
+
+  Requests can be sent concurrently (e.g with asyncio.gather): their responses
+  are matched by id.
+  """
+
+  def __init__(
+          self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    self._reader = reader
+    self._writer = writer
+    self._next_id = 0
+    self._pending: dict[int, asyncio.Future] = {}
+    self._receiver = asyncio.create_task(self._receive())
+
+  @classmethod
+  async def connect(cls, path: str | os.PathLike) -> 'MeshClient':
+    return cls(*await asyncio.open_unix_connection(path))
+
+  async def request(self, mesh: str, operation: str, *arguments: Any) -> Any:
+    """Sends a request and returns its result.
+
+    Raises a RuntimeError with the server's message if the request failed.
+    """
+    self._next_id += 1
+    request_id = self._next_id
+    future = asyncio.get_running_loop().create_future()
+    self._pending[request_id] = future
+    self._writer.write(json.dumps(
+        {'id': request_id, 'mesh': mesh, 'op': operation,
+         'args': list(arguments)}).encode() + b'\n')
+    await self._writer.drain()
+    response = await future
+    if 'error' in response:
+      raise RuntimeError(response['error'])
+    return response['result']
+
+  async def close(self):
+    self._writer.close()
+    await self._writer.wait_closed()
+    self._receiver.cancel()
+    try:
+      await self._receiver
+    except asyncio.CancelledError:
+      pass
+
+  async def _receive(self):
+    while line := await self._reader.readline():
+      response = json.loads(line)
+      future = self._pending.pop(response['id'], None)
+      if future is not None and not future.done():
+        future.set_result(response)
+    for future in self._pending.values():
+      future.set_exception(ConnectionError('Connection to the server closed.'))
+    self._pending.clear()
+
+
+def _from_json(value: Any) -> Any:
+  """Converts the lists of decoded JSON arguments to tuples."""
+  if isinstance(value, list):
+    return tuple(_from_json(item) for item in value)
+  return value
+
+
+def _to_json(value: Any) -> Any:
+  """Converts a result to JSON-compatible values."""
+  if isinstance(value, (set, frozenset)):
+    return sorted(_to_json(item) for item in value)
+  if isinstance(value, (list, tuple)):
+    return [_to_json(item) for item in value]
+  if isinstance(value, dict):
+    return {key: _to_json(item) for key, item in value.items()}
+  return value
@@ -0,0 +1,79 @@
+"""Laplacian and Taubin smoothing of vertex positions.
+
+Smoothing works on index-based positions and a compressed sparse row (CSR)
+vertex adjacency: the neighbours of vertex i are
+neighbours[offsets[i]:offsets[i + 1]]. The adjacency is built once from the
+mesh edges (see 'arrays.csr_adjacency'), and every iteration is then a single
+pass over flat lists, without touching the mesh structure.
+"""
+from typing import Sequence, Tuple
+
+from pytopmod.core.geometry import Point3D
+
+
+def laplacian_smooth(
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], neighbours: Sequence[int],
+    iterations: int = 1, factor: float = 0.5
+) -> list[Point3D]:
+  """Returns the positions after Laplacian smoothing.
+
+  Each iteration moves every vertex by 'factor' towards the centroid of its
+  neighbours. Vertices without neighbours are left in place.
+  """
+  coordinates = _split(positions)
+  for _ in range(iterations):
+    coordinates = _step(coordinates, offsets, neighbours, factor)
+  return list(zip(*coordinates))
+
+
+def taubin_smooth(
+    positions: Sequence[Point3D],
+    offsets: Sequence[int], neighbours: Sequence[int],
+    iterations: int = 10, factor: float = 0.5, inflation: float = -0.53
+) -> list[Point3D]:
+  """Returns the positions after Taubin (lambda|mu) smoothing.
+
+  Each iteration is a Laplacian step by 'factor' followed by one by
+  'inflation', which must be negative and slightly larger in magnitude: this
+  removes noise without shrinking the shape like plain Laplacian smoothing.
+  """
+  coordinates = _split(positions)
+  for _ in range(iterations):
+    coordinates = _step(coordinates, offsets, neighbours, factor)
+    coordinates = _step(coordinates, offsets, neighbours, inflation)
+  return list(zip(*coordinates))
+
+
+def _split(
+    positions: Sequence[Point3D]
+) -> Tuple[list[float], list[float], list[float]]:
+  """Splits positions into lists of x, y and z coordinates."""
+  return ([position[0] for position in positions],
+          [position[1] for position in positions],
+          [position[2] for position in positions])
+
+
+def _step(
+    coordinates: Tuple[list[float], list[float], list[float]],
+    offsets: Sequence[int], neighbours: Sequence[int],
+    factor: float
+) -> Tuple[list[float], list[float], list[float]]:
+  """Returns the coordinates after one Laplacian step."""
+  xs, ys, zs = coordinates
+  new_xs, new_ys, new_zs = list(xs), list(ys), list(zs)
+  for vertex in range(len(xs)):
+    start, end = offsets[vertex], offsets[vertex + 1]
+    if start == end:
+      continue
+    weight = factor / (end - start)
+    x, y, z = xs[vertex], ys[vertex], zs[vertex]
+    sum_x = sum_y = sum_z = 0.0
+    for neighbour in neighbours[start:end]:
+      sum_x += xs[neighbour]
+      sum_y += ys[neighbour]
+      sum_z += zs[neighbour]
+    new_xs[vertex] = x + weight * (sum_x - (end - start) * x)
+    new_ys[vertex] = y + weight * (sum_y - (end - start) * y)
+    new_zs[vertex] = z + weight * (sum_z - (end - start) * z)
+  return (new_xs, new_ys, new_zs)
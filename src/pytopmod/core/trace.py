@@ -0,0 +1,293 @@
+"""Recording and replay of operation traces.
+
+A trace is the sequence of operations applied to a mesh, e.g. during an editing
+session, stored in a compact binary format:
+ - A header: the b'PTMT' magic, a format version byte, then the length and
+    name of the mesh representation (e.g b'dlfl').
+ - Each operation: its opcode (its index in the representation's operation
+    table, see 'dlfl.trace' and 'dcel.trace') as a byte, followed by its
+    arguments. Vertex, face and edge keys are stored as the variable-length
+    (LEB128) encoding of their index, integers as the variable-length encoding
+    of their zigzag mapping to non-negative integers, floats as little-endian
+    doubles, points as three little-endian doubles, and optional points as a
+    byte (0 for None, 1 otherwise) followed by the point if any.
+
+Mesh keys are generated deterministically, so replaying a trace on a mesh in
+the same state as the recorded one (e.g. the same primitive) reproduces the
+recorded session.
+
+Traced operations are decorated with 'traced', so their calls on a mesh are
+logged by its recorders (see 'Recorder').
+"""
+import dataclasses
+import functools
+import inspect
+import struct
+import threading
+import time
+import types
+from typing import Any, Callable, Optional, Sequence, Tuple, TypeVar
+
+MAGIC = b'PTMT'
+VERSION = 1
+
+# Key argument kinds are also the prefixes of their keys (e.g 'v1').
+_POINT = struct.Struct('<3d')
+_FLOAT = struct.Struct('<d')
+
+# Type alias for a recorded operation: its name and arguments (without the
+# mesh).
+Operation = Tuple[str, Tuple[Any, ...]]
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# The open recorders, by id of their mesh (see 'Recorder').
+_recorders: dict[int, list['Recorder']] = {}
+_recorders_lock = threading.Lock()
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OperationSpec:
+  """An operation that can be traced: a function of a module taking a mesh
+  followed by arguments of the kinds listed in 'signature' (v, f, e for
+  vertex, face and edge keys, i for an integer, d for a float, p for a point
+  and o for an optional point)."""
+  name: str
+  module: types.ModuleType
+  signature: str
+
+  def function(self) -> Callable:
+    return getattr(self.module, self.name)
+
+
+def encode(
+        kind: str, specs: Sequence[OperationSpec],
+        operations: Sequence[Operation]) -> bytes:
+  """Returns the binary trace of a sequence of operations.
+
+  Raises a ValueError if an operation's arguments do not match its signature.
+  """
+  opcodes = {spec.name: opcode for opcode, spec in enumerate(specs)}
+  data = bytearray(MAGIC)
+  data.append(VERSION)
+  data.append(len(kind))
+  data.extend(kind.encode())
+  for name, arguments in operations:
+    opcode = opcodes[name]
+    if len(arguments) != len(specs[opcode].signature):
+      raise ValueError(
+          f'{name} takes {len(specs[opcode].signature)} traced arguments, got '
+          f'{len(arguments)}.')
+    data.append(opcode)
+    for argument_kind, argument in zip(specs[opcode].signature, arguments):
+      _write_argument(data, argument_kind, argument)
+  return bytes(data)
+
+
+def decode(
+        data: bytes,
+        specs: Sequence[OperationSpec]) -> Tuple[str, list[Operation]]:
+  """Returns the mesh representation and the operations of a binary trace."""
+  if data[:len(MAGIC)] != MAGIC:
+    raise ValueError('Not an operation trace.')
+  position = len(MAGIC)
+  if data[position] != VERSION:
+    raise ValueError(f'Unsupported trace version {data[position]}.')
+  kind_length = data[position + 1]
+  position += 2
+  kind = data[position:position + kind_length].decode()
+  position += kind_length
+
+  operations: list[Operation] = []
+  while position < len(data):
+    spec = specs[data[position]]
+    position += 1
+    arguments: list[Any] = []
+    for argument_kind in spec.signature:
+      argument, position = _read_argument(data, position, argument_kind)
+      arguments.append(argument)
+    operations.append((spec.name, tuple(arguments)))
+  return (kind, operations)
+
+
+def replay(
+        mesh: Any, data: bytes, kind: str, specs: Sequence[OperationSpec],
+        timings: bool = False) -> Optional[list[float]]:
+  """Applies the operations of a binary trace to a mesh.
+
+  If 'timings' is set, returns the duration of each operation in seconds.
+  """
+  trace_kind, operations = decode(data, specs)
+  if trace_kind != kind:
+    raise ValueError(f'Cannot replay a {trace_kind} trace on a {kind} mesh.')
+  functions = {spec.name: spec.function() for spec in specs}
+
+  if not timings:
+    for name, arguments in operations:
+      functions[name](mesh, *arguments)
+    return None
+
+  durations = []
+  for name, arguments in operations:
+    start = time.perf_counter()
+    functions[name](mesh, *arguments)
+    durations.append(time.perf_counter() - start)
+  return durations
+
+
+def traced(function: F) -> F:
+  """Decorates an operation taking a mesh as first argument, so its calls are
+  logged by the open recorders of the mesh (see 'Recorder')."""
+  signature = inspect.signature(function)
+
+  @functools.wraps(function)
+  def wrapper(mesh: Any, *arguments: Any, **keyword_arguments: Any) -> Any:
+    recorders = [recorder for recorder in _recorders.get(id(mesh), ())
+                 if recorder.logs(function)]
+    if not recorders:
+      return function(mesh, *arguments, **keyword_arguments)
+    bound = signature.bind(mesh, *arguments, **keyword_arguments)
+    bound.apply_defaults()
+    for recorder in recorders:
+      recorder.depth += 1
+    try:
+      result = function(*bound.args, **bound.kwargs)
+    finally:
+      for recorder in recorders:
+        recorder.depth -= 1
+    for recorder in recorders:
+      recorder.operations.append((function.__name__, bound.args[1:]))
+    return result
+
+  return wrapper  # type: ignore
+
+
+class Recorder:
+  """Records the traced operations applied to a mesh.
+
+  Until the recorder is closed, the operations of the representation's table
+  (see 'dlfl.trace' and 'dcel.trace') called on its mesh are logged with all
+  their arguments, defaults included, whether they are called directly or
+  through the recorder:
+
+    with dlfl.trace.recorder(mesh) as recorder:
+      operators.insert_edge(mesh, vertex_1, face_1, vertex_2, face_2)
+      recorder.apply('triangulate_face', face)
+
+  Calls on other meshes are not logged, and neither are the operations called
+  by a logged one (e.g 'insert_edge' within 'subdivide_edge'), since replaying
+  it repeats them. Operations raising an error are not logged.
+  """
+
+  def __init__(self, mesh: Any, kind: str, specs: Sequence[OperationSpec]):
+    self.mesh = mesh
+    self.kind = kind
+    self.specs = specs
+    self.operations: list[Operation] = []
+    # The number of logged operations being applied.
+    self.depth = 0
+    self._specs = {spec.name: spec for spec in specs}
+    with _recorders_lock:
+      _recorders.setdefault(id(mesh), []).append(self)
+
+  def __enter__(self) -> 'Recorder':
+    return self
+
+  def __exit__(self, *_):
+    self.close()
+
+  def close(self):
+    """Stops logging the operations called on the mesh."""
+    with _recorders_lock:
+      recorders = _recorders.get(id(self.mesh), [])
+      if self in recorders:
+        recorders.remove(self)
+      if not recorders:
+        _recorders.pop(id(self.mesh), None)
+
+  def logs(self, function: Callable) -> bool:
+    """Returns whether a call of a function on the mesh is logged, i.e it is
+    an operation of the table, not called by a logged one."""
+    spec = self._specs.get(function.__name__)
+    return (self.depth == 0 and spec is not None and
+            spec.module.__name__ == function.__module__)
+
+  def apply(self, name: str, *arguments: Any, **keyword_arguments: Any) -> Any:
+    """Applies an operation to the mesh, logs it and returns its result.
+
+    Raises a KeyError if the operation is not traced.
+    """
+    if name not in self._specs:
+      raise KeyError(f'Operation {name!r} is not traced.')
+    function = self._specs[name].function()
+    bound = inspect.signature(function).bind(
+        self.mesh, *arguments, **keyword_arguments)
+    bound.apply_defaults()
+    # The call is logged below, even once the recorder is closed.
+    self.depth += 1
+    try:
+      result = function(*bound.args, **bound.kwargs)
+    finally:
+      self.depth -= 1
+    self.operations.append((name, bound.args[1:]))
+    return result
+
+  def trace(self) -> bytes:
+    """Returns the binary trace of the recorded operations."""
+    return encode(self.kind, self.specs, self.operations)
+
+
+def _write_argument(data: bytearray, kind: str, argument: Any):
+  if kind == 'i':
+    _write_varint(data, argument * 2 if argument >= 0 else -argument * 2 - 1)
+  elif kind == 'd':
+    data.extend(_FLOAT.pack(argument))
+  elif kind == 'p':
+    data.extend(_POINT.pack(*argument))
+  elif kind == 'o':
+    data.append(argument is not None)
+    if argument is not None:
+      data.extend(_POINT.pack(*argument))
+  else:
+    _write_varint(data, _key_index(argument, kind))
+
+
+def _read_argument(data: bytes, position: int, kind: str) -> Tuple[Any, int]:
+  if kind == 'i':
+    value, position = _read_varint(data, position)
+    return (value // 2 if value % 2 == 0 else -(value + 1) // 2, position)
+  if kind == 'd':
+    return (_FLOAT.unpack_from(data, position)[0], position + _FLOAT.size)
+  if kind == 'o':
+    if not data[position]:
+      return (None, position + 1)
+    position += 1
+    kind = 'p'
+  if kind == 'p':
+    return (_POINT.unpack_from(data, position), position + _POINT.size)
+  index, position = _read_varint(data, position)
+  return (f'{kind}{index}', position)
+
+
+def _key_index(key: str, prefix: str) -> int:
+  if not key.startswith(prefix) or not key[len(prefix):].isdigit():
+    raise ValueError(f'Cannot encode key {key!r}.')
+  return int(key[len(prefix):])
+
+
+def _write_varint(data: bytearray, value: int):
+  while value >= 0x80:
+    data.append((value & 0x7f) | 0x80)
+    value >>= 7
+  data.append(value)
+
+
+def _read_varint(data: bytes, position: int) -> Tuple[int, int]:
+  value = shift = 0
+  while True:
+    byte = data[position]
+    position += 1
+    value |= (byte & 0x7f) << shift
+    if byte < 0x80:
+      return (value, position)
+    shift += 7
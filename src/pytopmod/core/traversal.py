@@ -0,0 +1,44 @@
+"""Generic lazy traversals over mesh element adjacency."""
+import collections
+from typing import Callable, Generator, Iterable, TypeVar
+
+T = TypeVar('T')
+
+
+def breadth_first(
+        start: T, neighbours: Callable[[T], Iterable[T]]
+) -> Generator[T, None, None]:
+  """Returns a generator over the items reachable from 'start', breadth-first.
+
+  The 'neighbours' callable is only called on an item once it is yielded, so
+  stopping the generator early avoids visiting the rest of the mesh.
+  """
+  visited = {start}
+  queue = collections.deque([start])
+  while queue:
+    item = queue.popleft()
+    yield item
+    for neighbour in neighbours(item):
+      if neighbour not in visited:
+        visited.add(neighbour)
+        queue.append(neighbour)
+
+
+def depth_first(
+        start: T, neighbours: Callable[[T], Iterable[T]]
+) -> Generator[T, None, None]:
+  """Returns a generator over the items reachable from 'start', depth-first.
+
+  Items are yielded in pre-order, the neighbours of an item being visited in the
+  order they are returned by the 'neighbours' callable.
+  """
+  visited = set()
+  stack = [start]
+  while stack:
+    item = stack.pop()
+    if item in visited:
+      continue
+    visited.add(item)
+    yield item
+    stack.extend(reversed([neighbour for neighbour in neighbours(item)
+                           if neighbour not in visited]))
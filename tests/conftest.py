@@ -0,0 +1,34 @@
+"""Shared fixtures."""
+import pytest
+
+from pytopmod.core import parametric
+from pytopmod.core.dcel import arrays
+from pytopmod.core.dcel import operators as dcel_operators
+from pytopmod.core.dcel import primitives as dcel_primitives
+
+
+def two_cubes():
+  """Returns the positions and polygons of two disjoint unit cubes."""
+  positions, polygons = parametric.cube(1)
+  count = len(positions)
+  return (positions + [(x + 3.0, y, z) for x, y, z in positions],
+          polygons + [[index + count for index in polygon]
+                      for polygon in polygons])
+
+
+@pytest.fixture
+def unbridged_dcel_cubes():
+  """Two DCEL cubes joined by an edge, which is then deleted again (a
+  non-cofacial insertion followed by a cofacial deletion)."""
+  mesh = dcel_primitives.polygon_mesh(*two_cubes())
+  face_1, face_2 = 'f1', 'f7'
+  vertex_1 = next(arrays.face_vertices(mesh, face_1))
+  vertex_2 = next(arrays.face_vertices(mesh, face_2))
+  dcel_operators.insert_edge(
+      mesh, vertex_1, mesh.corner_of(vertex_1, face_1),
+      vertex_2, mesh.corner_of(vertex_2, face_2))
+  assert len(mesh.components) == 1
+  bridge = next(edge for edge, node in mesh.edge_nodes.items()
+                if {node.vertex_1, node.vertex_2} == {vertex_1, vertex_2})
+  dcel_operators.delete_edge(mesh, bridge)
+  return mesh
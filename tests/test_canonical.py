@@ -0,0 +1,59 @@
+"""Tests for the canonical forms of meshes."""
+import random
+
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dlfl import arrays, primitives
+
+
+def _relabelled(mesh, seed):
+  """Returns a copy of a DLFL mesh with shuffled vertices and faces."""
+  generator = random.Random(seed)
+  _, positions, polygons = arrays.polygons(mesh)
+  permutation = list(range(len(positions)))
+  generator.shuffle(permutation)
+  indices = {old: new for new, old in enumerate(permutation)}
+  shuffled = []
+  for polygon in polygons:
+    offset = generator.randrange(len(polygon))
+    shuffled.append([indices[index]
+                     for index in polygon[offset:] + polygon[:offset]])
+  generator.shuffle(shuffled)
+  return primitives.polygon_mesh(
+      [positions[old] for old in permutation], shuffled)
+
+
+def test_relabelled_meshes_are_isomorphic():
+  for mesh in (primitives.cube(3), primitives.torus(8, 5),
+               primitives.ico_sphere(2), primitives.grid(3, 4)):
+    for seed in range(3):
+      copy = _relabelled(mesh, seed)
+      assert arrays.isomorphic(mesh, copy)
+      assert arrays.isomorphic(mesh, copy, include_positions=False)
+
+
+def test_positions_and_connectivity_tell_meshes_apart():
+  mesh = primitives.cube(2)
+  moved = _relabelled(mesh, 0)
+  vertex = next(iter(moved.vertices))
+  moved.move_vertices([(vertex, (9.0, 9.0, 9.0))])
+  assert not arrays.isomorphic(mesh, moved)
+  assert arrays.isomorphic(mesh, moved, include_positions=False)
+  assert not arrays.isomorphic(
+      primitives.cube(2), primitives.uv_sphere(4, 4), include_positions=False)
+
+
+def test_representations_have_the_same_form():
+  mesh = primitives.torus(6, 4)
+  _, positions, polygons = arrays.polygons(mesh)
+  copy = dcel_primitives.polygon_mesh(positions, polygons)
+  assert dcel_arrays.canonical_form(copy) == arrays.canonical_form(mesh)
+
+
+def test_symmetric_meshes():
+  # Every dart of a torus is equivalent: the orbits of the automorphisms found
+  # keep this from traversing the mesh once per dart.
+  mesh = primitives.torus(40, 40)
+  copy = _relabelled(mesh, 1)
+  assert arrays.isomorphic(mesh, copy)
+  assert arrays.isomorphic(mesh, copy, include_positions=False)
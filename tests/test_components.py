@@ -0,0 +1,105 @@
+"""Tests for component tracking and the adjacency traversals."""
+import pytest
+
+from pytopmod.core import traversal
+from pytopmod.core.components import ComponentTracker
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel import traversal as dcel_traversal
+from pytopmod.core.dlfl import operators, primitives
+from pytopmod.core.dlfl import traversal as dlfl_traversal
+
+from conftest import two_cubes
+
+
+def test_tracker_merge_and_split():
+  edges = {('a', 'b'), ('b', 'c'), ('c', 'd')}
+
+  def neighbours(vertex):
+    return [other for edge in edges if vertex in edge
+            for other in edge if other != vertex]
+
+  tracker = ComponentTracker()
+  for vertex in 'abcde':
+    tracker.add(vertex)
+  assert len(tracker) == 5
+  for vertex_1, vertex_2 in edges:
+    tracker.merge(vertex_1, vertex_2)
+  assert len(tracker) == 2
+  assert tracker.connected('a', 'd')
+  assert not tracker.connected('a', 'e')
+
+  edges.add(('d', 'a'))
+  tracker.merge('d', 'a')
+  edges.remove(('b', 'c'))
+  # The cycle a-b-c-d keeps them connected.
+  assert not tracker.split('b', 'c', neighbours)
+  edges.remove(('d', 'a'))
+  assert tracker.split('d', 'a', neighbours)
+  assert len(tracker) == 3
+  assert tracker.connected('a', 'b') and tracker.connected('c', 'd')
+  assert not tracker.connected('b', 'c')
+  assert set(tracker.vertices(tracker.component('a'))) == {'a', 'b'}
+
+  tracker.remove('e')
+  assert len(tracker) == 2
+  assert tracker.merge_all('abcd') == tracker.component('c')
+  assert len(tracker) == 1
+
+
+def test_generic_traversals():
+  graph = {1: [2, 3], 2: [4], 3: [4], 4: [1]}
+  assert list(traversal.breadth_first(1, graph.__getitem__)) == [1, 2, 3, 4]
+  assert list(traversal.depth_first(1, graph.__getitem__)) == [1, 2, 4, 3]
+
+
+def test_dlfl_traversals_and_components():
+  mesh = primitives.cube(1)
+  face = next(iter(mesh.faces))
+  assert len(list(dlfl_traversal.face_neighbours(mesh, face))) == 4
+  vertex = mesh.face_vertices[face][0]
+  assert len(list(dlfl_traversal.vertex_neighbours(mesh, vertex))) == 3
+  assert set(dlfl_traversal.breadth_first_faces(mesh, face)) == set(mesh.faces)
+  assert set(dlfl_traversal.depth_first_vertices(mesh, vertex)) == set(
+      mesh.vertices)
+
+  sphere_vertex, sphere_face = operators.create_point_sphere(
+      mesh, (5.0, 0.0, 0.0))
+  assert len(mesh.components) == 2
+  assert set(dlfl_traversal.component_faces(mesh, face)) == set(
+      mesh.faces) - {sphere_face}
+  joined_face, _ = operators.insert_edge(
+      mesh, vertex, face, sphere_vertex, sphere_face)
+  assert len(mesh.components) == 1
+  sphere_face, face = operators.delete_edge(
+      mesh, vertex, joined_face, sphere_vertex, joined_face)
+  assert len(mesh.components) == 2
+  assert mesh.face_vertices[sphere_face] == [sphere_vertex]
+  assert set(dlfl_traversal.component_faces(mesh, face)) == set(
+      mesh.faces) - {sphere_face}
+
+
+@pytest.mark.parametrize('bridged', [False, True])
+def test_dcel_traversals_and_components(bridged, unbridged_dcel_cubes):
+  mesh = (unbridged_dcel_cubes if bridged
+          else dcel_primitives.polygon_mesh(*two_cubes()))
+  assert len(mesh.components) == 2
+  for face in mesh.faces:
+    component = set(dcel_traversal.component_faces(mesh, face))
+    assert component <= set(mesh.faces)
+    assert len(component) == 6
+    assert component == set(dcel_traversal.breadth_first_faces(mesh, face))
+    assert component == set(dcel_traversal.depth_first_faces(mesh, face))
+  for vertex in mesh.vertices:
+    assert len(list(dcel_traversal.vertex_neighbours(mesh, vertex))) == 3
+    assert len(set(dcel_traversal.breadth_first_vertices(mesh, vertex))) == 8
+
+
+def test_dcel_cofacial_deletion_relinks_faces(unbridged_dcel_cubes):
+  mesh = unbridged_dcel_cubes
+  for node in mesh.edge_nodes.values():
+    assert node.face_1 in mesh.faces and node.face_2 in mesh.faces
+  for face in mesh.faces:
+    assert len(list(dcel_arrays.face_vertices(mesh, face))) == 4
+  assert dcel_arrays.isomorphic(
+      mesh, dcel_primitives.polygon_mesh(*two_cubes()))
@@ -0,0 +1,54 @@
+"""Tests for the quadric error metric decimation."""
+import pytest
+
+from pytopmod.core import decimation
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel.operations import decimation as dcel_decimation
+from pytopmod.core.dlfl import arrays, primitives
+
+
+def _assert_closed_manifold(polygons):
+  edges = {}
+  for polygon in polygons:
+    for index, vertex in enumerate(polygon):
+      edge = (vertex, polygon[(index + 1) % len(polygon)])
+      assert edge not in edges, 'Half-edge appears twice.'
+      edges[edge] = True
+  for vertex_1, vertex_2 in edges:
+    assert (vertex_2, vertex_1) in edges, 'Boundary edge.'
+  vertex_count = len({vertex for polygon in polygons for vertex in polygon})
+  assert vertex_count - len(edges) // 2 + len(polygons) == 2
+
+
+@pytest.mark.parametrize('mesh', [primitives.tetrahedron(), primitives.cube(1)])
+def test_decimate_stops_at_tetrahedron(mesh):
+  _, positions, polygons = arrays.polygons(mesh)
+  new_positions, triangles = decimation.decimate(positions, polygons, 1)
+  assert len(triangles) == 4
+  assert len(new_positions) == 4
+  _assert_closed_manifold(triangles)
+
+
+def test_decimate_keeps_components():
+  _, positions, polygons = arrays.polygons(primitives.cube(2))
+  offset = len(positions)
+  polygons = list(polygons) + [
+      [vertex + offset for vertex in polygon] for polygon in polygons]
+  _, triangles = decimation.decimate(positions * 2, polygons, 1)
+  assert len(triangles) == 8
+  _assert_closed_manifold(triangles[:4])
+  _assert_closed_manifold(triangles[4:])
+
+
+def test_decimate_dcel_cube():
+  mesh = dcel_decimation.decimate(dcel_primitives.cube(1), 1)
+  assert len(mesh.faces) == 4
+
+
+def test_decimate_retries_rejected_collapses():
+  # Some collapses of the grid are first rejected, and only become possible
+  # after the collapses of neighbouring edges.
+  _, positions, polygons = arrays.polygons(primitives.grid(4, 6))
+  _, triangles = decimation.decimate(positions, polygons, 10)
+  assert len(triangles) == 10
+  _assert_closed_manifold(triangles)
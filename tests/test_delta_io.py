@@ -0,0 +1,104 @@
+"""Tests for the streaming of mesh deltas to live viewers."""
+import asyncio
+import functools
+import socket
+
+import pytest
+
+from pytopmod.core import delta_io
+from pytopmod.core.dcel import delta_io as dcel_delta_io
+from pytopmod.core.dcel import obj_io as dcel_obj_io
+from pytopmod.core.dcel import operators as dcel_operators
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel.operations import extrusion as dcel_extrusion
+from pytopmod.core.dcel.operations import smoothing as dcel_smoothing
+from pytopmod.core.dlfl import delta_io as dlfl_delta_io
+from pytopmod.core.dlfl import obj_io as dlfl_obj_io
+from pytopmod.core.dlfl import operators, primitives
+from pytopmod.core.dlfl.operations import extrusion, smoothing, subdivision
+
+
+def _apply_deltas(data):
+  """Applies the deltas of a stream, as a viewer would, and returns the OBJ
+  export of the resulting vertices and faces, in key order."""
+  vertices, faces = {}, {}
+  for line in filter(None, data.splitlines()):
+    kind, key, *values = line.split()
+    if kind == 'v':
+      vertices[key] = values
+    elif kind == 'f':
+      faces[key] = values
+    elif kind == 'dv':
+      del vertices[key]
+    elif kind == 'df':
+      del faces[key]
+
+  def key_order(key):
+    return int(key[1:])
+
+  vertex_indices = {vertex: index for index, vertex in enumerate(
+      sorted(vertices, key=key_order))}
+  obj_vertices = [f'v {" ".join(vertices[vertex])}'
+                  for vertex in sorted(vertices, key=key_order)]
+  obj_faces = [
+      f'f {" ".join(str(vertex_indices[vertex] + 1) for vertex in faces[face])}'
+      for face in sorted(faces, key=key_order)]
+  return '\n'.join(obj_vertices) + '\n' + '\n'.join(obj_faces)
+
+
+def _delete_dlfl_edge(mesh):
+  vertex_1, vertex_2 = next(mesh.edges())
+  (_, face_1), (_, face_2) = mesh.corners_of_edge(vertex_1, vertex_2)
+  operators.delete_edge(mesh, vertex_1, face_1, vertex_2, face_2)
+
+
+def _delete_dcel_edge(mesh):
+  dcel_operators.delete_edge(mesh, next(
+      edge for edge, node in mesh.edge_nodes.items()
+      if node.face_1 != node.face_2))
+
+
+_DLFL_EDITS = [
+    lambda mesh: subdivision.triangulate_faces(mesh, list(mesh.faces)[:2]),
+    _delete_dlfl_edge,
+    lambda mesh: extrusion.extrude_faces(mesh, list(mesh.faces)[:2], 0.5),
+    smoothing.laplacian_smooth]
+
+_DCEL_EDITS = [
+    _delete_dcel_edge,
+    lambda mesh: dcel_extrusion.extrude_faces(mesh, list(mesh.faces)[:2], 0.5),
+    dcel_smoothing.laplacian_smooth]
+
+
+@pytest.mark.parametrize('mesh, mesh_to_delta, mesh_to_obj, edits', [
+    (primitives.cube(1), dlfl_delta_io.mesh_to_delta, dlfl_obj_io.mesh_to_obj,
+     _DLFL_EDITS),
+    (dcel_primitives.cube(1), dcel_delta_io.mesh_to_delta,
+     dcel_obj_io.mesh_to_obj, _DCEL_EDITS)])
+def test_streamed_deltas_rebuild_the_mesh(
+        mesh, mesh_to_delta, mesh_to_obj, edits):
+  async def stream() -> str:
+    sender, receiver = socket.socketpair()
+    _, writer = await asyncio.open_connection(sock=sender)
+    reader, reader_writer = await asyncio.open_connection(sock=receiver)
+    delta_stream = delta_io.DeltaStream(
+        writer, functools.partial(mesh_to_delta, mesh, consumer='viewer'),
+        frame_rate=1000.0)
+    delta_stream.start()
+    for edit in edits:
+      # Let a frame pass before each edit, so they are sent in several deltas
+      # after the full one.
+      await asyncio.sleep(0.005)
+      edit(mesh)
+    await delta_stream.close()
+    data = await reader.read()
+    reader_writer.close()
+    return data.decode()
+
+  data = asyncio.run(stream())
+  deltas = data.split('\n\n')[:-1]
+  assert len(deltas) > 2
+  assert '\ndf ' in data
+  # The first delta lists the whole cube.
+  assert len(deltas[0].splitlines()) == 8 + 6
+  assert _apply_deltas(data) == mesh_to_obj(mesh)
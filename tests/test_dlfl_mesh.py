@@ -0,0 +1,116 @@
+"""Tests for the edge and corner indexes of DLFL Meshes."""
+import collections
+
+import pytest
+
+from pytopmod.core import circular_list
+from pytopmod.core.dlfl import operators, primitives, trace
+from pytopmod.core.dlfl.operations import subdivision
+
+
+def _half_edge_count(mesh):
+  return sum(len(vertices) for vertices in mesh.face_vertices.values()
+             if len(vertices) > 1)
+
+
+def _check_indexes(mesh):
+  mesh.build_indexes()
+  half_edges = collections.Counter(
+      (half_edge, face) for face, vertices in mesh.face_vertices.items()
+      if len(vertices) > 1 for half_edge in circular_list.pairs(vertices))
+  assert half_edges == collections.Counter(
+      (half_edge, face)
+      for half_edge, positions in mesh.half_edge_positions.items()
+      for face, _ in positions)
+  assert 2 * len(list(mesh.edges())) == _half_edge_count(mesh)
+  # Each vertex rotation visits all its corners once.
+  for vertex in mesh.vertices:
+    corners = list(mesh.rotation_corners(vertex))
+    assert len(set(corners)) == len(corners) == sum(
+        vertices.count(vertex) for vertices in mesh.face_vertices.values())
+    for face, position in corners:
+      assert mesh.face_vertices[face][position] == vertex
+
+
+def test_indexes_are_built_on_first_query():
+  mesh = primitives.cube(1)
+  subdivision.triangulate_faces(mesh, list(mesh.faces))
+  assert not mesh.indexed
+  assert len(list(mesh.edges())) == 3 * len(mesh.faces) // 2
+  assert mesh.indexed
+  _check_indexes(mesh)
+
+
+def test_insert_parallel_edge():
+  mesh = primitives.triangle()
+  face = next(iter(mesh.faces))
+  vertex_1, vertex_2, _ = mesh.face_vertices[face]
+  face_1, face_2 = operators.insert_edge(mesh, vertex_1, face, vertex_2, face)
+  # The indexes are built to pair the parallel edge.
+  assert mesh.indexed
+  assert sorted([mesh.face_vertices[face_1], mesh.face_vertices[face_2]],
+                key=len)[0] in ([vertex_1, vertex_2], [vertex_2, vertex_1])
+  assert len(mesh.faces) == 3
+  assert len(list(mesh.edges())) == 4
+  _check_indexes(mesh)
+
+  operators.delete_edge(mesh, vertex_1, face_1, vertex_2, face_2)
+  assert len(mesh.faces) == 2
+  _check_indexes(mesh)
+
+
+def test_triangulate_face_with_repeated_vertex():
+  mesh = primitives.triangle()
+  face = next(iter(mesh.faces))
+  vertex = mesh.face_vertices[face][0]
+  sphere_vertex, sphere_face = operators.create_point_sphere(
+      mesh, (0.0, 0.0, 1.0))
+  face, _ = operators.insert_edge(
+      mesh, vertex, face, sphere_vertex, sphere_face)
+  assert mesh.face_vertices[face].count(vertex) == 2
+
+  _, faces = subdivision.triangulate_face(mesh, face)
+  assert len(faces) == 5
+  assert all(len(mesh.face_vertices[face]) == 3 for face in mesh.faces)
+  assert len(mesh.vertices) - len(list(mesh.edges())) + len(mesh.faces) == 2
+  _check_indexes(mesh)
+
+  # The surface can still be edited around the parallel edges.
+  subdivision.triangulate_faces(mesh, list(mesh.faces))
+  _check_indexes(mesh)
+
+
+def test_parallel_edges_stay_paired():
+  mesh = primitives.cube(1)
+  vertex_1, vertex_2 = next(mesh.edges())
+  (_, face_1), (_, face_2) = mesh.corners_of_edge(vertex_1, vertex_2)
+  # Join the edge's vertices again across its two faces: the merged face
+  # contains both half-edges of both edges.
+  face, _ = operators.insert_edge(mesh, vertex_1, face_2, vertex_2, face_1)
+  assert len(mesh.half_edge_positions[(vertex_1, vertex_2)]) == 2
+  _check_indexes(mesh)
+
+  vertices = [vertex for vertex in mesh.face_vertices[face]
+              if vertex not in (vertex_1, vertex_2)]
+  operators.insert_edge(mesh, vertices[0], face, vertex_1, face)
+  _check_indexes(mesh)
+  subdivision.triangulate_faces(mesh, list(mesh.faces))
+  _check_indexes(mesh)
+
+  (_, face_1), (_, face_2) = mesh.corners_of_edge(vertex_1, vertex_2)
+  operators.delete_edge(mesh, vertex_1, face_1, vertex_2, face_2)
+  assert len(mesh.half_edge_positions[(vertex_1, vertex_2)]) == 1
+  _check_indexes(mesh)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_edge_index_matches_faces(seed):
+  mesh = primitives.cube(2)
+  trace.random_trace(mesh, 100, seed)
+  _check_indexes(mesh)
+  for vertex_1, vertex_2 in mesh.edges():
+    (_, face_1), (_, face_2) = mesh.corners_of_edge(vertex_1, vertex_2)
+    assert (vertex_1, vertex_2) in circular_list.pairs(
+        mesh.face_vertices[face_1])
+    assert (vertex_2, vertex_1) in circular_list.pairs(
+        mesh.face_vertices[face_2])
@@ -0,0 +1,67 @@
+"""Tests for the dual operations."""
+import pytest
+
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel.operations import dual as dcel_dual
+from pytopmod.core.dlfl import arrays, operators, primitives
+from pytopmod.core.dlfl.operations import dual, subdivision
+
+PRIMITIVES = [
+    ('tetrahedron', ()),
+    ('grid', (1, 1)),
+    ('grid', (2, 3)),
+    ('cube', (2,)),
+    ('cylinder', (5, 2)),
+    ('torus', (4, 3)),
+    ('uv_sphere', (5, 3)),
+    ('ico_sphere', (1,)),
+]
+
+
+@pytest.mark.parametrize('name, arguments', PRIMITIVES + [('square', ())])
+def test_dcel_dual_of_primitives(name, arguments):
+  mesh = getattr(dcel_primitives, name)(*arguments)
+  dual_mesh = dcel_dual.dual(mesh)
+  assert len(dual_mesh.vertices) == len(mesh.faces)
+  assert len(dual_mesh.faces) == len(mesh.vertices)
+  assert len(dual_mesh.edge_nodes) == len(mesh.edge_nodes)
+  assert dcel_arrays.isomorphic(
+      dcel_dual.dual(dual_mesh), mesh, include_positions=False)
+
+
+@pytest.mark.parametrize('name, arguments', PRIMITIVES + [('triangle', ())])
+def test_dlfl_dual_of_primitives(name, arguments):
+  mesh = getattr(primitives, name)(*arguments)
+  if name in ('grid', 'triangle'):
+    # Their boundary face shares several edges with another face.
+    with pytest.raises(ValueError):
+      dual.dual(mesh)
+    return
+  dual_mesh = dual.dual(mesh)
+  assert len(dual_mesh.vertices) == len(mesh.faces)
+  assert len(dual_mesh.faces) == len(mesh.vertices)
+  assert len(list(dual_mesh.edges())) == len(list(mesh.edges()))
+  assert arrays.isomorphic(
+      dual.dual(dual_mesh), mesh, include_positions=False)
+
+
+def test_dlfl_dual_of_faces_with_repeated_vertices():
+  mesh = primitives.tetrahedron()
+  subdivision.triangulate_faces(mesh, list(mesh.faces))
+  # Joins two faces into one, going twice through both vertices.
+  operators.insert_edge(mesh, 'v5', 'f16', 'v6', 'f22')
+  rotation = list(mesh.rotation_corners('v5'))
+  assert len(rotation) == len(set(rotation)) == 4
+  with pytest.raises(ValueError):
+    dual.dual(mesh)
+
+
+def test_dcel_dual_after_cofacial_deletion(unbridged_dcel_cubes):
+  dual_mesh = dcel_dual.dual(unbridged_dcel_cubes)
+  assert len(dual_mesh.vertices) == 12
+  assert len(dual_mesh.faces) == 16
+  assert len(dual_mesh.components) == 2
+  assert dcel_arrays.isomorphic(
+      dcel_dual.dual(dual_mesh), unbridged_dcel_cubes,
+      include_positions=False)
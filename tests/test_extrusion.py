@@ -0,0 +1,57 @@
+"""Tests for the extrusion of DLFL and DCEL Meshes."""
+import pytest
+
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel.operations import extrusion as dcel_extrusion
+from pytopmod.core.dlfl import arrays, primitives
+from pytopmod.core.dlfl.operations import extrusion
+
+
+def _edge_count(mesh):
+  return len(list(mesh.edges()))
+
+
+def _dcel_edge_count(mesh):
+  return len(mesh.edge_nodes)
+
+
+@pytest.mark.parametrize('module, extrusion_module, edge_count', [
+    (primitives, extrusion, _edge_count),
+    (dcel_primitives, dcel_extrusion, _dcel_edge_count)])
+def test_extrude_faces_topology(module, extrusion_module, edge_count):
+  mesh = module.cube(2)
+  faces = sorted(mesh.faces)[:5]
+  vertex_count, face_count = len(mesh.vertices), len(mesh.faces)
+  edges = edge_count(mesh)
+  results = extrusion_module.extrude_faces(mesh, faces, 0.5, scale=0.5)
+
+  # Each extruded quad adds four vertices, four side faces and eight edges.
+  assert len(mesh.vertices) == vertex_count + 4 * len(faces)
+  assert len(mesh.faces) == face_count + 4 * len(faces)
+  assert edge_count(mesh) == edges + 8 * len(faces)
+  assert len(mesh.vertices) - edge_count(mesh) + len(mesh.faces) == 2
+  for vertices, side_faces in results:
+    assert len(vertices) == len(side_faces) == 4
+
+
+def test_extrusion_backends_agree():
+  mesh = primitives.cube(2)
+  dcel_mesh = dcel_primitives.cube(2)
+  faces = sorted(mesh.faces)[::3]
+  assert faces == sorted(dcel_mesh.faces)[::3]
+  extrusion.extrude_faces(mesh, faces, 0.5, (0.0, 0.0, 1.0), 0.5, 0.25)
+  dcel_extrusion.extrude_faces(
+      dcel_mesh, faces, 0.5, (0.0, 0.0, 1.0), 0.5, 0.25)
+  assert arrays.canonical_form(mesh) == dcel_arrays.canonical_form(dcel_mesh)
+
+
+@pytest.mark.parametrize('module, extrusion_module', [
+    (primitives, extrusion), (dcel_primitives, dcel_extrusion)])
+def test_extrude_a_face_twice(module, extrusion_module):
+  mesh = module.cube(1)
+  face = next(iter(mesh.faces))
+  with pytest.raises(ValueError):
+    extrusion_module.extrude_faces(mesh, [face, face])
+  assert len(mesh.vertices) == 8
+  assert len(mesh.faces) == 6
@@ -0,0 +1,67 @@
+"""Tests for the geometry kernels, against hand-computed values."""
+import pytest
+
+from pytopmod.core import arrays, geometry
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dlfl import arrays as dlfl_arrays
+from pytopmod.core.dlfl import primitives
+
+# A right triangle with legs 2 (along x) and 3 (along y), a unit square in the
+# xz plane facing -y, and a degenerate face along the x axis.
+POSITIONS = [(0.0, 0.0, 0.0), (2.0, 0.0, 0.0), (0.0, 3.0, 0.0),
+             (1.0, 0.0, 0.0), (1.0, 0.0, 1.0), (0.0, 0.0, 1.0)]
+POLYGONS = [[0, 1, 2], [0, 3, 4, 5], [0, 3, 1]]
+
+
+def test_polygon_normal_and_centroid():
+  assert geometry.normal(POSITIONS[index] for index in POLYGONS[0]) == (
+      0.0, 0.0, 1.0)
+  assert geometry.normal(POSITIONS[index] for index in POLYGONS[2]) == (
+      0.0, 0.0, 0.0)
+  assert geometry.centroid(POSITIONS[index] for index in POLYGONS[1]) == (
+      0.5, 0.0, 0.5)
+  assert geometry.midpoint((0.0, 1.0, 2.0), (2.0, 3.0, 4.0)) == (
+      1.0, 2.0, 3.0)
+
+
+def test_face_normals_and_areas():
+  offsets, corners = arrays.csr_polygons(POLYGONS)
+  assert geometry.face_normals(POSITIONS, offsets, corners) == [
+      (0.0, 0.0, 1.0), (0.0, -1.0, 0.0), (0.0, 0.0, 0.0)]
+  assert geometry.face_areas(POSITIONS, offsets, corners) == [3.0, 1.0, 0.0]
+
+
+def test_vertex_normals():
+  offsets, corners = arrays.csr_polygons(POLYGONS)
+  normals = geometry.vertex_normals(POSITIONS, offsets, corners)
+  # Vertex 0 weighs the triangle's normal by 3 and the square's by 1.
+  assert normals[0] == pytest.approx((0.0, -1 / 10 ** 0.5, 3 / 10 ** 0.5))
+  assert normals[2] == (0.0, 0.0, 1.0)
+  assert normals[4] == (0.0, -1.0, 0.0)
+
+
+@pytest.mark.parametrize('primitive, arrays_module', [
+    (primitives.cube, dlfl_arrays), (dcel_primitives.cube, dcel_arrays)])
+def test_kernels_on_a_cube(primitive, arrays_module):
+  mesh = primitive(1)
+  positions = arrays_module.positions(mesh)
+  offsets, corners = arrays_module.face_corners(mesh)
+  assert geometry.face_areas(positions, offsets, corners) == [4.0] * 6
+  # The corners of the cube are at (+-1, +-1, +-1): their normals point
+  # outwards, along the diagonals.
+  for position, normal in zip(
+          positions, geometry.vertex_normals(positions, offsets, corners)):
+    assert normal == pytest.approx(
+        tuple(coordinate / 3 ** 0.5 for coordinate in position))
+  for (x, y, z), normal in zip(
+          [geometry.centroid(positions[corner]
+                             for corner in corners[start:end])
+           for start, end in zip(offsets, offsets[1:])],
+          geometry.face_normals(positions, offsets, corners)):
+    # Each face centroid is the center of a side, along its normal.
+    assert normal == (x, y, z)
+
+  assert geometry.bounds(positions) == ((-1.0, -1.0, -1.0), (1.0, 1.0, 1.0))
+  _, _, edges = arrays_module.edges(mesh)
+  assert geometry.edge_lengths(positions, edges) == [2.0] * 12
@@ -0,0 +1,109 @@
+"""Tests for mesh fingerprints and the on-disk memo cache."""
+import os
+
+import pytest
+
+from pytopmod.core import memo
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import obj_io as dcel_obj_io
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dlfl import arrays, obj_io, primitives
+from pytopmod.core.dlfl.operations import subdivision
+
+
+def _renamed_edge(mesh, edge, new_edge):
+  """Renames an edge of a DCEL mesh in place."""
+  nodes = {}
+  for key, node in mesh.edge_nodes.items():
+    if node.vertex_1_next == edge:
+      node.vertex_1_next = new_edge
+    if node.vertex_2_next == edge:
+      node.vertex_2_next = new_edge
+    nodes[new_edge if key == edge else key] = node
+  mesh.edge_nodes = nodes
+  for incident_edges in (mesh.vertex_edge, mesh.face_edge):
+    for key, incident_edge in incident_edges.items():
+      if incident_edge == edge:
+        incident_edges[key] = new_edge
+  return mesh
+
+
+def test_dcel_fingerprint_covers_edge_keys():
+  mesh = dcel_primitives.cube(1)
+  renamed = _renamed_edge(dcel_primitives.cube(1), 'e1', 'e100')
+  assert dcel_arrays.isomorphic(mesh, renamed)
+  assert dcel_arrays.fingerprint(mesh) != dcel_arrays.fingerprint(renamed)
+  assert (dcel_arrays.fingerprint(mesh) ==
+          dcel_arrays.fingerprint(dcel_primitives.cube(1)))
+
+
+def test_get_treats_concurrent_eviction_as_miss(tmp_path, monkeypatch):
+  cache = memo.MemoCache(tmp_path)
+  cache.put('key', 1)
+
+  def evicted(path):
+    os.unlink(path)
+    raise FileNotFoundError(path)
+
+  monkeypatch.setattr(os, 'utime', evicted)
+  with pytest.raises(KeyError):
+    cache.get('key')
+  assert cache.memoize('operation', 'fingerprint', lambda: 2) == 2
+
+
+def test_failed_put_removes_temporary_file(tmp_path):
+  cache = memo.MemoCache(tmp_path)
+  with pytest.raises(Exception):
+    cache.put('key', lambda: None)
+  assert not os.listdir(tmp_path)
+  assert 'key' not in cache
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+  cache = memo.MemoCache(tmp_path, max_entries=2)
+  for index, key in enumerate(('a', 'b', 'c')):
+    cache.put(key, index)
+    # pylint: disable-next=protected-access
+    os.utime(cache._path(key), (index, index))
+  assert len(cache) == 2
+  assert 'a' not in cache
+  assert cache.get('c') == 2
+
+
+def test_dcel_fingerprint_after_cofacial_deletion(unbridged_dcel_cubes):
+  fingerprint = dcel_arrays.fingerprint(unbridged_dcel_cubes)
+  assert fingerprint == dcel_arrays.fingerprint(unbridged_dcel_cubes)
+  unbridged_dcel_cubes.move_vertices([('v1', (9.0, 9.0, 9.0))])
+  assert fingerprint != dcel_arrays.fingerprint(unbridged_dcel_cubes)
+
+
+def test_obj_export_is_memoized(tmp_path, monkeypatch):
+  cache = memo.MemoCache(tmp_path)
+  mesh = primitives.cube(2)
+  dcel_mesh = dcel_primitives.cube(2)
+  expected = (obj_io.mesh_to_obj(mesh), dcel_obj_io.mesh_to_obj(dcel_mesh))
+  assert obj_io.mesh_to_obj(mesh, cache) == expected[0]
+  assert dcel_obj_io.mesh_to_obj(dcel_mesh, cache) == expected[1]
+  assert len(cache) == 2
+
+  monkeypatch.setattr(mesh, 'faces', None)
+  monkeypatch.setattr(dcel_mesh, 'faces', None)
+  # Hits do not read the faces again (their fingerprint is cached on the
+  # meshes).
+  assert obj_io.mesh_to_obj(mesh, cache) == expected[0]
+  assert dcel_obj_io.mesh_to_obj(dcel_mesh, cache) == expected[1]
+
+
+def test_triangulation_is_memoized(tmp_path, monkeypatch):
+  cache = memo.MemoCache(tmp_path)
+  mesh = primitives.cube(1)
+  result = subdivision.triangulated(mesh, cache)
+  assert len(result.faces) == 24 and len(mesh.faces) == 6
+
+  def fail(*_):
+    raise AssertionError('The triangulation was not memoized.')
+
+  monkeypatch.setattr(subdivision, 'triangulate_faces', fail)
+  cached = subdivision.triangulated(primitives.cube(1), cache)
+  assert cached is not result
+  assert arrays.fingerprint(cached) == arrays.fingerprint(result)
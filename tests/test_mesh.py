@@ -0,0 +1,87 @@
+"""Tests for the base Mesh's change tracking."""
+from pytopmod.core.dlfl import delta_io, operators, primitives
+from pytopmod.core.dlfl.mesh import DLFLMesh
+from pytopmod.core.dlfl.operations import subdivision
+
+
+def test_consumers_take_dirty_keys_independently():
+  mesh = DLFLMesh()
+  assert mesh.take_dirty('viewer') == (set(), set())
+  vertex_1 = mesh.create_vertex((0.0, 0.0, 0.0))
+  assert mesh.take_dirty('pass') == (set(), set())
+  assert mesh.take_dirty('viewer') == ({vertex_1}, set())
+
+  vertex_2 = mesh.create_vertex((1.0, 0.0, 0.0))
+  assert mesh.take_dirty('viewer') == ({vertex_2}, set())
+  mesh.move_vertices([(vertex_1, (0.0, 1.0, 0.0))])
+  assert mesh.take_dirty('pass') == ({vertex_1, vertex_2}, set())
+  assert mesh.take_dirty('viewer') == ({vertex_1}, set())
+  assert mesh.take_dirty('viewer') == (set(), set())
+
+  mesh.drop_dirty_consumer('pass')
+  mesh.create_vertex((2.0, 0.0, 0.0))
+  mesh.take_dirty('viewer')
+  assert 'pass' not in mesh._dirty_consumers  # pylint: disable=protected-access
+
+
+def test_dirty_keys_are_only_recorded_for_consumers():
+  mesh = primitives.tetrahedron()
+  subdivision.triangulate_faces(mesh, list(mesh.faces))
+  assert mesh.take_dirty() == (set(), set())
+
+  vertex = next(iter(mesh.vertices))
+  mesh.move_vertices([(vertex, (0.0, 0.0, 0.0))])
+  assert mesh.take_dirty() == ({vertex}, set())
+
+
+def test_created_and_deleted_keys_are_left_out():
+  mesh = primitives.tetrahedron()
+  faces = set(mesh.faces)
+  mesh.take_dirty()
+  for _ in range(3):
+    subdivision.triangulate_faces(mesh, list(mesh.faces))
+  # The intermediate faces are left out: only the faces of the last level
+  # remain, along with the deleted faces of the tetrahedron.
+  assert mesh.take_dirty() == (set(mesh.vertices), set(mesh.faces) | faces)
+
+
+def test_delta_streams_of_the_same_mesh():
+  mesh = primitives.cube(1)
+  delta_io.mesh_to_delta(mesh, True, 'viewer_1')
+  delta_io.mesh_to_delta(mesh, True, 'viewer_2')
+  vertex = next(iter(mesh.vertices))
+  mesh.move_vertices([(vertex, (2.0, 2.0, 2.0))])
+  expected = f'v {vertex} 2.0 2.0 2.0\n\n'
+  assert delta_io.mesh_to_delta(mesh, consumer='viewer_1') == expected
+  assert delta_io.mesh_to_delta(mesh, consumer='viewer_2') == expected
+  assert delta_io.mesh_to_delta(mesh, consumer='viewer_1') == ''
+
+
+def test_cached_values_are_rebuilt_after_a_version_bump():
+  mesh = primitives.tetrahedron()
+  builds = []
+
+  def build():
+    builds.append(mesh.version)
+    return len(mesh.faces)
+
+  assert mesh.cached('face_count', build) == 4
+  assert mesh.cached('face_count', build) == 4
+  assert len(builds) == 1
+  # Moving vertices leaves the connectivity, and the cached values, unchanged.
+  mesh.move_vertices([(next(iter(mesh.vertices)), (1.0, 1.0, 1.0))])
+  assert mesh.cached('face_count', build) == 4
+  assert len(builds) == 1
+
+  subdivision.triangulate_face(mesh, next(iter(mesh.faces)))
+  assert mesh.cached('face_count', build) == 6
+  assert builds == [builds[0], mesh.version]
+
+
+def test_components_are_found_on_first_access():
+  mesh = primitives.cube(1)
+  subdivision.triangulate_faces(mesh, list(mesh.faces))
+  assert mesh.component_tracker is None
+  operators.create_point_sphere(mesh, (5.0, 0.0, 0.0))
+  assert len(mesh.components) == 2
+  assert mesh.component_tracker is mesh.components
@@ -0,0 +1,68 @@
+"""Tests for multiresolution hierarchies."""
+import pytest
+
+from pytopmod.core import canonical, multiresolution
+from pytopmod.core.dlfl import arrays, operators, primitives
+from pytopmod.core.dlfl.operations import subdivision
+
+
+def _with_repeated_vertex():
+  """Returns a triangle with a dangling edge, whose boundary face contains a
+  vertex twice."""
+  mesh = primitives.triangle()
+  face = next(iter(mesh.faces))
+  vertex = mesh.face_vertices[face][0]
+  sphere_vertex, sphere_face = operators.create_point_sphere(
+      mesh, (0.0, 0.0, 1.0))
+  operators.insert_edge(mesh, vertex, face, sphere_vertex, sphere_face)
+  return mesh
+
+
+def _rounded(positions):
+  return sorted(tuple(round(coord, 9) for coord in position)
+                for position in positions)
+
+
+@pytest.mark.parametrize('build', [
+    lambda: primitives.cube(1), _with_repeated_vertex])
+def test_levels_match_triangulate_faces(build):
+  mesh = build()
+  _, positions, polygons = arrays.polygons(mesh)
+  level = multiresolution.Hierarchy(positions, polygons).subdivide(2)
+  for _ in range(2):
+    subdivision.triangulate_faces(mesh, list(mesh.faces))
+  assert canonical.canonical_form(
+      len(level.positions), level.polygons()) == arrays.canonical_form(
+          mesh, include_positions=False)
+  # Centroids may be summed from another vertex of their face.
+  assert _rounded(level.positions) == _rounded(arrays.positions(mesh))
+
+
+def test_moves_propagate_to_finer_levels():
+  _, positions, polygons = arrays.polygons(primitives.cube(1))
+  hierarchy = multiresolution.Hierarchy(positions, polygons)
+  hierarchy.subdivide(2)
+  finest = hierarchy.level(2)
+  # The centroid of the first face of level 0 gets a detail at level 1.
+  centroid = len(positions)
+  x, y, z = hierarchy.level(1).positions[centroid]
+  hierarchy.move_vertices(1, {centroid: (x, y, z + 1.0)})
+  assert hierarchy.level(1).details[centroid] == (0.0, 0.0, 1.0)
+  assert finest.positions[centroid] == (x, y, z + 1.0)
+  before = list(finest.positions)
+
+  # Moving a corner of that face moves its copies, and the centroids around it
+  # by their weights, while the moved centroid keeps its detail.
+  x, y, z = positions[0]
+  moved = hierarchy.move_vertices(0, {0: (x + 1.0, y, z)})
+  assert [level for level, _ in moved] == [0, 1, 2]
+  assert moved[0][1] == {0}
+  assert 0 in moved[1][1] and 0 in moved[2][1]
+  assert hierarchy.level(1).positions[0] == finest.positions[0] == (
+      x + 1.0, y, z)
+  for vertex, (old, new) in enumerate(zip(before, finest.positions)):
+    if vertex not in moved[2][1]:
+      assert new == old
+  assert finest.positions[centroid] == pytest.approx(
+      (before[centroid][0] + 0.25, before[centroid][1], before[centroid][2]))
+  assert hierarchy.level(1).details[centroid] == (0.0, 0.0, 1.0)
@@ -0,0 +1,36 @@
+"""Tests for the parallel OBJ writers."""
+import io
+
+import pytest
+
+from pytopmod.core.dcel import obj_io as dcel_obj_io
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel.operations import smoothing as dcel_smoothing
+from pytopmod.core.dlfl import obj_io, operators, primitives
+from pytopmod.core.dlfl.operations import smoothing, subdivision
+
+
+def _dlfl_mesh():
+  # Triangles, quads and a point-sphere, at coordinates that are not round.
+  mesh = primitives.cube(2)
+  subdivision.triangulate_faces(mesh, list(mesh.faces)[:3])
+  smoothing.laplacian_smooth(mesh)
+  operators.create_point_sphere(mesh, (0.1, 0.2, 0.3))
+  return mesh
+
+
+def _dcel_mesh():
+  mesh = dcel_primitives.uv_sphere(7, 5)
+  dcel_smoothing.laplacian_smooth(mesh)
+  return mesh
+
+
+@pytest.mark.parametrize('workers, chunk_size', [
+    (0, 65536), (0, 3), (None, 65536), (2, 3), (2, 7)])
+@pytest.mark.parametrize('make_mesh, module', [
+    (_dlfl_mesh, obj_io), (_dcel_mesh, dcel_obj_io)])
+def test_write_obj_matches_mesh_to_obj(make_mesh, module, workers, chunk_size):
+  mesh = make_mesh()
+  file = io.BytesIO()
+  module.write_obj(mesh, file, workers, chunk_size)
+  assert file.getvalue() == module.mesh_to_obj(mesh).encode()
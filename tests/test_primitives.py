@@ -0,0 +1,67 @@
+"""Tests for the parametric generators and the polygon mesh constructors."""
+import pytest
+
+from pytopmod.core import parametric
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import operators as dcel_operators
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dlfl import primitives
+
+
+@pytest.mark.parametrize('generator, arguments', [
+    (parametric.grid, (0, 2)),
+    (parametric.grid, (2, 0)),
+    (parametric.cube, (0,)),
+    (parametric.cylinder, (2,)),
+    (parametric.cylinder, (4, 0)),
+    (parametric.torus, (2, 4)),
+    (parametric.torus, (4, 2)),
+    (parametric.uv_sphere, (4, 1)),
+    (parametric.uv_sphere, (2, 4)),
+    (parametric.ico_sphere, (-1,)),
+])
+def test_generators_reject_small_arguments(generator, arguments):
+  with pytest.raises(ValueError):
+    generator(*arguments)
+
+
+@pytest.mark.parametrize('generator, arguments', [
+    (parametric.grid, (1, 1)),
+    (parametric.cube, (1,)),
+    (parametric.cylinder, (3,)),
+    (parametric.torus, (3, 3)),
+    (parametric.uv_sphere, (3, 2)),
+    (parametric.ico_sphere, (0,)),
+])
+def test_generators_accept_minimum_arguments(generator, arguments):
+  positions, polygons = generator(*arguments)
+  primitives.polygon_mesh(positions, polygons)
+  dcel_primitives.polygon_mesh(positions, polygons)
+
+
+def test_dlfl_polygon_mesh_rejects_parallel_edges():
+  with pytest.raises(ValueError):
+    primitives.polygon_mesh(
+        [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)],
+        [[0, 1, 2], [2, 1, 0], [0, 1], [1, 0]])
+
+
+def test_dcel_polygon_mesh_round_trips_parallel_edges():
+  mesh = dcel_primitives.cube(1)
+  face = next(iter(mesh.faces))
+  vertex_1, vertex_2, _, _ = dcel_arrays.face_vertices(mesh, face)
+  dcel_operators.insert_edge(
+      mesh, vertex_1, mesh.corner_of(vertex_1, face),
+      vertex_2, mesh.corner_of(vertex_2, face))
+
+  _, positions, polygons = dcel_arrays.polygons(mesh)
+  copy = dcel_primitives.polygon_mesh(positions, polygons)
+  assert len(copy.edge_nodes) == len(mesh.edge_nodes) == 13
+  assert dcel_arrays.isomorphic(mesh, copy)
+
+
+def test_dcel_polygon_mesh_rejects_unpaired_half_edges():
+  with pytest.raises(ValueError):
+    dcel_primitives.polygon_mesh(
+        [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)],
+        [[0, 1, 2], [2, 1, 0], [0, 1, 2]])
@@ -0,0 +1,106 @@
+"""Tests for the MeshServer and its client, over a Unix socket."""
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from pytopmod.core import server
+from pytopmod.core.dlfl import obj_io, primitives
+from pytopmod.core.dlfl import server as dlfl_server
+
+
+def _serve(test):
+  """Runs a test coroutine with a client of a server of a DLFL cube, named
+  'cube', listening on a temporary socket."""
+  async def run():
+    mesh_server = server.MeshServer()
+    mesh = primitives.cube(1)
+    mesh_server.add_mesh('cube', mesh, dlfl_server.BACKEND)
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'server.sock')
+      await mesh_server.start(path)
+      client = await server.MeshClient.connect(path)
+      try:
+        await test(mesh_server, mesh, client)
+      finally:
+        await client.close()
+        await mesh_server.close()
+
+  asyncio.run(run())
+
+
+def test_batched_writes_and_snapshot_versions():
+  async def test(mesh_server, mesh, client):
+    summary = await client.request('cube', 'summary')
+    assert summary == {'version': mesh.version, 'vertices': 8, 'faces': 6}
+
+    # Requests sent without waiting for their responses can be batched: their
+    # results are those of operations applied in arrival order.
+    results = await asyncio.gather(*(
+        client.request('cube', 'create_point_sphere', [float(index), 0, 0])
+        for index in range(5)))
+    assert [mesh.vertex_coordinates[vertex] for vertex, _ in results] == [
+        (float(index), 0, 0) for index in range(5)]
+
+    # Queries are answered from the snapshot taken after the last batch.
+    snapshot = mesh_server.snapshot('cube')
+    assert snapshot.version == mesh.version
+    summary = await client.request('cube', 'summary')
+    assert summary == {'version': mesh.version, 'vertices': 13, 'faces': 11}
+    assert await client.request('cube', 'export') == obj_io.mesh_to_obj(mesh)
+
+  _serve(test)
+
+
+def test_writes_queued_during_a_batch_share_its_snapshot():
+  async def test(mesh_server, mesh, _):
+    responses = await asyncio.gather(*(
+        mesh_server.handle({'id': index, 'mesh': 'cube',
+                            'op': 'create_point_sphere', 'args': [[0, 0, 0]]})
+        for index in range(3)))
+    assert [response['id'] for response in responses] == [0, 1, 2]
+    assert {response['version'] for response in responses} == {mesh.version}
+
+  _serve(test)
+
+
+def test_errors_are_returned_to_their_request():
+  async def test(mesh_server, mesh, client):
+    with pytest.raises(RuntimeError, match='KeyError'):
+      await client.request('cube', 'unknown_operation')
+    with pytest.raises(RuntimeError, match='KeyError'):
+      await client.request('sphere', 'summary')
+
+    # A failed operation does not prevent the following ones of its batch.
+    failed, applied = await asyncio.gather(
+        client.request('cube', 'triangulate_face', 'f0'),
+        client.request('cube', 'create_point_sphere', [0, 0, 0]),
+        return_exceptions=True)
+    assert isinstance(failed, RuntimeError)
+    assert applied[0] in mesh.vertices
+
+  _serve(test)
+
+
+def test_failed_batches_are_returned_to_all_their_requests(monkeypatch):
+  async def test(mesh_server, mesh, client):
+    snapshot = mesh_server.snapshot('cube')
+
+    def fail(*_):
+      raise MemoryError('No snapshot.')
+
+    with monkeypatch.context() as patch:
+      patch.setattr(server.Snapshot, 'of', fail)
+      results = await asyncio.gather(*(
+          client.request('cube', 'create_point_sphere', [0, 0, 0])
+          for _ in range(2)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) and 'MemoryError' in str(
+        result) for result in results)
+    assert mesh_server.snapshot('cube') is snapshot
+
+    # The writer keeps applying the following batches.
+    await client.request('cube', 'create_point_sphere', [0, 0, 0])
+    assert mesh_server.snapshot('cube').version == mesh.version
+
+  _serve(test)
@@ -0,0 +1,40 @@
+"""Tests for the Laplacian and Taubin smoothing of meshes."""
+import pytest
+
+from pytopmod.core import smoothing
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel.operations import smoothing as dcel_smoothing
+from pytopmod.core.dlfl import primitives
+from pytopmod.core.dlfl.operations import smoothing as dlfl_smoothing
+
+
+def test_laplacian_step():
+  # A path 0 - 1 - 2, and a vertex 3 without neighbours.
+  positions = [(0.0, 0.0, 0.0), (1.0, 1.0, 0.0), (2.0, 0.0, 0.0),
+               (5.0, 5.0, 5.0)]
+  offsets = [0, 1, 3, 4, 4]
+  neighbours = [1, 0, 2, 1]
+  assert smoothing.laplacian_smooth(positions, offsets, neighbours) == [
+      (0.5, 0.5, 0.0), (1.0, 0.5, 0.0), (1.5, 0.5, 0.0), (5.0, 5.0, 5.0)]
+
+
+@pytest.mark.parametrize('module, smoothing_module', [
+    (primitives, dlfl_smoothing), (dcel_primitives, dcel_smoothing)])
+def test_smoothing_a_cube(module, smoothing_module):
+  # The neighbours of a corner p of the cube have their centroid at p / 3: a
+  # step by a factor f scales the cube by 1 - 2f / 3.
+  mesh = module.cube(1)
+  positions = dict(mesh.vertex_coordinates)
+  mesh.take_dirty('test')
+  smoothing_module.laplacian_smooth(mesh)
+  for vertex, (x, y, z) in positions.items():
+    assert mesh.vertex_coordinates[vertex] == pytest.approx(
+        (x * 2 / 3, y * 2 / 3, z * 2 / 3))
+  assert mesh.take_dirty('test') == (set(mesh.vertices), set())
+
+  smoothing_module.taubin_smooth(mesh, 1, 0.5, -0.53)
+  scale = 2 / 3 * (1 - 2 * 0.5 / 3) * (1 + 2 * 0.53 / 3)
+  for vertex, (x, y, z) in positions.items():
+    assert mesh.vertex_coordinates[vertex] == pytest.approx(
+        (x * scale, y * scale, z * scale))
+  assert mesh.take_dirty('test') == (set(mesh.vertices), set())
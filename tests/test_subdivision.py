@@ -0,0 +1,14 @@
+"""Tests for the subdivision of DLFL Meshes."""
+from pytopmod.core.dlfl import operators, primitives
+from pytopmod.core.dlfl.operations import subdivision
+
+
+def test_adaptive_triangulate_reports_skipped_faces():
+  mesh = primitives.cube(1)
+  _, sphere_face = operators.create_point_sphere(mesh, (5.0, 0.0, 0.0))
+  faces, skipped = subdivision.adaptive_triangulate(
+      mesh, lambda face: True, levels=2)
+  assert skipped == {sphere_face}
+  # Each quad is split in 4 triangles, then each triangle in 3.
+  assert len(faces) == 6 * 4 * 3
+  assert faces | skipped == set(mesh.faces)
@@ -0,0 +1,100 @@
+"""Tests for the recording and replay of operation traces."""
+import threading
+
+import pytest
+
+from pytopmod.core import trace
+from pytopmod.core.dcel import arrays as dcel_arrays
+from pytopmod.core.dcel import primitives as dcel_primitives
+from pytopmod.core.dcel import trace as dcel_trace
+from pytopmod.core.dlfl import arrays, operators, primitives
+from pytopmod.core.dlfl import trace as dlfl_trace
+from pytopmod.core.dlfl.operations import subdivision
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_random_traces_replay(seed):
+  mesh = primitives.cube(2)
+  data = dlfl_trace.random_trace(mesh, 40, seed)
+  copy = primitives.cube(2)
+  dlfl_trace.replay(copy, data)
+  assert arrays.fingerprint(copy) == arrays.fingerprint(mesh)
+
+  dcel_mesh = dcel_primitives.cube(2)
+  data = dcel_trace.random_trace(dcel_mesh, 40, seed)
+  dcel_copy = dcel_primitives.cube(2)
+  assert len(dcel_trace.replay(dcel_copy, data, timings=True)) == 40
+  assert dcel_arrays.fingerprint(dcel_copy) == dcel_arrays.fingerprint(
+      dcel_mesh)
+
+
+@pytest.mark.parametrize('module, trace_module', [
+    (primitives, dlfl_trace), (dcel_primitives, dcel_trace)])
+def test_extrusion_and_smoothing_replay(module, trace_module):
+  mesh = module.cube(1)
+  recorder = trace_module.recorder(mesh)
+  faces = sorted(mesh.faces)
+  recorder.apply('extrude_face', faces[0])
+  recorder.apply('extrude_face', faces[1], 0.5, (0.0, 1.0, 0.0), twist=0.25)
+  recorder.apply('laplacian_smooth', 2)
+  recorder.apply('taubin_smooth', factor=0.25)
+  assert recorder.operations[0] == ('extrude_face',
+                                    (faces[0], 1.0, None, 1.0, 0.0))
+
+  copy = module.cube(1)
+  trace_module.replay(copy, recorder.trace())
+  fingerprint = (arrays.fingerprint if module is primitives
+                 else dcel_arrays.fingerprint)
+  assert fingerprint(copy) == fingerprint(mesh)
+
+
+def test_calls_on_the_recorded_mesh_are_logged():
+  mesh = primitives.cube(1)
+  other = primitives.cube(1)
+  with dlfl_trace.recorder(mesh) as recorder:
+    operators.create_point_sphere(mesh, (0.0, 0.0, 0.0))
+    recorder.apply('create_point_sphere', (1.0, 0.0, 0.0))
+    operators.create_point_sphere(other, (2.0, 0.0, 0.0))
+    # The edge insertions of the subdivision are not logged.
+    subdivision.triangulate_face(mesh, sorted(mesh.faces)[0])
+    with pytest.raises(KeyError):
+      recorder.apply('triangulate_faces', list(mesh.faces))
+  operators.create_point_sphere(mesh, (3.0, 0.0, 0.0))
+  assert [name for name, _ in recorder.operations] == [
+      'create_point_sphere', 'create_point_sphere', 'triangulate_face']
+  assert recorder.operations[0] == ('create_point_sphere', ((0.0, 0.0, 0.0),))
+
+  copy = primitives.cube(1)
+  with dlfl_trace.recorder(copy) as copy_recorder:
+    dlfl_trace.replay(copy, recorder.trace())
+  assert copy_recorder.operations == recorder.operations
+
+
+def test_recorders_in_threads_are_independent():
+  meshes = [primitives.cube(1) for _ in range(4)]
+  recorders = [dlfl_trace.recorder(mesh) for mesh in meshes]
+
+  def record(index: int):
+    for _ in range(50):
+      recorders[index].apply('create_point_sphere', (float(index), 0.0, 0.0))
+
+  threads = [threading.Thread(target=record, args=(index,))
+             for index in range(len(meshes))]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  for index, recorder in enumerate(recorders):
+    assert recorder.operations == [
+        ('create_point_sphere', ((float(index), 0.0, 0.0),))] * 50
+
+
+def test_encode_decode_argument_kinds():
+  specs = (trace.OperationSpec('operation', operators, 'vfeidpo'),)
+  operations = [
+      ('operation', ('v1', 'f200', 'e3', -5, 0.5, (1.0, 2.0, 3.0), None)),
+      ('operation', ('v0', 'f0', 'e0', 300, -1.5, (0.0, 0.0, 0.0),
+                     (4.0, 5.0, 6.0))),
+  ]
+  data = trace.encode('dlfl', specs, operations)
+  assert trace.decode(data, specs) == ('dlfl', operations)